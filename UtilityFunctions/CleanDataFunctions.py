@@ -12,6 +12,8 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from UtilityFunctions.normalizationEngine import compileRewriteRules, layers, lists, mixtures, normalize, normalizeToken, rewrite, steps
+
 def ageingIsoProtocoll(userData):
     ''' Return the text string for the ISO protocoll'''
     protocoll = []
@@ -97,70 +99,22 @@ def aggregationStates(userData):
     '''Format the agregtion stat list'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several gases in the solution separted by ;
-
-    stateList = []
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Enfors the notation of lists rather than that of mixing
-            item = item.replace(':', ';')   
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    states = depositionStep.split(';')
-
-                    for k, state in enumerate(states):
-                        # Enforse proper formating
-                        states[k] = aggregationStatesFormating(state)
-
-                    depositionSteps[j] = '; '.join(states)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            stateList.append(item)
-
-        except:
-            print(f'faild to extract aggregationStates of {item} on row {i}')
-            stateList.append(item)
-
-    return stateList
+    # For each deposition proceadures, there may be several states separted by ;
+    # Enfors the notation of lists rather than that of mixing
+    return normalize(userData, aggregationStatesVocabulary, separators = (layers, steps, lists), replacements = ((':', ';'),), default = 'Unknown')
+
+# Standard formating of aggregation states, and the lower case formating variations that are converted to it
+aggregationStatesVocabulary = {
+    'Unknown' : ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan'],
+    'Solid' : ['solid'],
+    'Liquid' : ['solution', 'solutionn', 'soultion', 'solutions', 'liquid'],
+    'Gas' : ['gas', 'vapor', 'vapour'],
+    }
 
 def aggregationStatesFormating(state):
     '''Format the textstring describing the precursor state'''
- 
-    # Remove starting and ending blank spaces
-    state = state.strip()
-
-    # Go through all known formating variations and convert them to the corect one 
-    if state.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        formatedState = 'Unknown'
-    elif state.lower() in ['solid']:
-        formatedState = 'Solid'   
-    elif state.lower() in ['solution', 'solutionn', 'soultion', 'solutions', 'liquid']:
-        formatedState = 'Liquid' 
-    elif state.lower() in ['gas', 'vapor', 'vapour']:
-        formatedState = 'Gas'
-    else:
-        formatedState = 'Unknown'
 
-    return formatedState
+    return normalizeToken(state, aggregationStatesVocabulary, default = 'Unknown')
 
 def architecture(userData):
     '''Return a list of formated strings for the architecture'''
@@ -200,86 +154,28 @@ def atmosphere(userData):
     '''Format the string describing the atmosphere'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several gases in the solution separted by ;
-
-    environment = []
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    gases = depositionStep.split(';')
-
-                    for k, gas in enumerate(gases):
-                        # Enforse proper formating
-                        gases[k] = atmosphereFormating(gas)
-
-                    depositionSteps[j] = '; '.join(gases)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            environment.append(item)
-
-        except:
-            print(f'faild to extract atmosphere of {item} on row {i}')
-            environment.append(item)
-
-    return environment
+    # For each deposition proceadures, there may be several gases separted by ;
+    return normalize(userData, atmosphereVocabulary, separators = (layers, steps, lists))
+
+# Standard formating of atmospheres, and the lower case formating variations that are converted to it
+atmosphereVocabulary = {
+    'Unknown' : ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan'],
+    'Air' : ['air'],
+    'Ambient' : ['ambient', 'anbient atmosphere', 'ambient atmosphere', 'ambient air', 'ambient environment'],
+    'Ar' : ['argon', 'ar'],
+    'Dry air' : ['dry air', 'drybox', 'dry box'],
+    'Inert' : ['inert'],
+    'Glovebox' : ['glovebox', 'glove box'],
+    'Methylamin' : ['ma', 'methylamin'],
+    'N2' : ['n2', 'nitrogen'],
+    'Vacuum' : ['vacuum', 'vacum', 'vaccum'],
+    }
 
 def atmosphereFormating(atmosphere):
     ''' Check atmosphere againast known formating variations 
     and return the standard formating for the atmosphere '''
 
-    # Remove starting and ending blank spaces
-    atmosphere = atmosphere.strip()
-
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in atmosphereFormating')
-  
-    elif atmosphere.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        formatedAtmosphere = 'Unknown'
-
-    elif atmosphere.lower() in ['air']:
-        formatedAtmosphere = 'Air'
-    elif atmosphere.lower() in ['ambient', 'anbient atmosphere', 'ambient atmosphere', 'ambient air', 'ambient environment']:
-        formatedAtmosphere = 'Ambient'
-    elif atmosphere.lower() in ['argon', 'ar']:
-        formatedAtmosphere = 'Ar'
-    elif atmosphere.lower() in ['dry air', 'drybox', 'dry box']:
-        formatedAtmosphere = 'Dry air'
-    elif atmosphere.lower() in ['inert']:
-        formatedAtmosphere = 'Inert'
-    elif atmosphere.lower() in ['glovebox', 'glove box']:
-        formatedAtmosphere = 'Glovebox'
-    elif atmosphere.lower() in ['ma', 'methylamin']:
-        formatedAtmosphere = 'Methylamin'
-    elif atmosphere.lower() in ['n2', 'nitrogen']:
-        formatedAtmosphere = 'N2'
-    elif atmosphere.lower() in ['vacuum', 'vacum', 'vaccum']:
-        formatedAtmosphere = 'Vacuum'
-
-    # If no known formating variations
-    else: 
-        formatedAtmosphere = atmosphere
-
-    return formatedAtmosphere
+    return normalizeToken(atmosphere, atmosphereVocabulary)
 
 def averageOverNumberOfCells(userData):
     '''Convert values to int or 1 for missing values.'''
@@ -309,20 +205,16 @@ def averageOverNumberOfCells(userData):
 
     return values
 
+# Standard formating of chemicals, and the lower case formating variations that are converted to it
+chemicalsVocabulary = {
+    'nan' : ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan'],
+    }
+
 def chemicalsFormating(chemical):
     ''' Check cemicals in solution againast known formating variations 
     and return the standard formating for the chemcial'''
 
-    # Remove leading and tailing blank spaces
-    chemical = chemical.strip()
-
-    # If not stated
-    if chemical.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        return 'nan'
-
-    # TODO. Fill upp with common formating variations to be corected for
-
-    return chemical
+    return normalizeToken(chemical, chemicalsVocabulary)
 
 def certificationIstitute(userData):
     '''Format the string describing the certification institute'''
@@ -374,88 +266,16 @@ def compounds(userData):
     '''Format the composition of solutions'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several compounds in the solution separted by ;
-
-    chemicals = []
-    for item in userData:
-        try:
-            # Enforce input is a string 
-            item = str(item)   
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    compounds = depositionStep.split(';')
-
-                    for k, compound in enumerate(compounds):
-                        # Enforse proper formating
-                        compounds[k] = chemicalsFormating(compound)
-
-                    depositionSteps[j] = '; '.join(compounds)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            chemicals.append(item)
-        except:
-            chemicals.append('')
-            print(f'Cound not read in compounds on line: {i}')
-
-    return chemicals
+    # For each deposition proceadures, there may be several compounds separted by ;
+    return normalize(userData, chemicalsVocabulary, separators = (layers, steps, lists), errorValue = '')
 
 def concentrations(userData):
     '''Format the concentrations'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several compounds in the solution separted by ;
-
-    amounts = []
-    for item in userData:
-        try:
-            # Enforce input is a string 
-            item = str(item)   
-
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    compounds = depositionStep.split(';')
-
-                    for k, compound in enumerate(compounds):
-                        # Enforse proper formating
-                        compounds[k] = concentrationFormating(compound)
-
-                    depositionSteps[j] = '; '.join(compounds)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            amounts.append(item)
-        except:
-            amounts.append('')
-            print(f'Cound not read in concentrations on line: {i}')
-
-    return amounts
+    # For each deposition proceadures, there may be several compounds separted by ;
+    # Enforse the use of decimal point
+    return normalize(userData, concentrationFormating, separators = (layers, steps, lists), replacements = ((',', '.'),), errorValue = '', strip = False)
 
 def concentrationFormating(compound):
     ''' Check concentrations againast known formating variations 
@@ -701,197 +521,79 @@ def depositionProcedure(userData):
     '''Format the deposition proceadure data'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    depositionList = []
-
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove starting en ending blank spaces
-            item = item.strip()
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionProcedures = layer.split('>>')
-
-                for j, depositionProcedure in enumerate(depositionProcedures):
-                    # Enforse proper formating
-                    depositionProcedures[j] = depositionProcedureFormating(depositionProcedure)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[i] = " >> ".join(depositionProcedures)
-
-            # Concatenate all parts with proper spacing
-            item = " | ".join(layers)
-
-            depositionList.append(item)
-        except:
-            print(f'faild to extract depositionProcedure of {item} on row {i}')
-            depositionList.append(item)
-
-    return depositionList
+    return normalize(userData, depositionProcedureVocabulary, separators = (layers, steps))
+
+# Standard formating of deposition procedures, and the lower case formating variations that are converted to it
+depositionProcedureVocabulary = {
+    'Air brush spray' : ['air brush', 'air brush spray', 'air brush spray-coating'],
+    'ALD' : ['ald', 'atomic layer deposition', 'peald', 'plasma enhanced ald'],
+    'Brush painting' : ['brush painting', 'brush-painting', 'brushing'],
+    'Candle burning' : ['candle burning'],
+    'CBD' : ['bath deposition', 'bath-deposition', 'cbd', 'chemical bath', 'chemical bath deposition', 'chemical bath depostion', 'chemical bath method', 'chemical deposition', 'chemical-bath'],
+    'Closed space sublimation' : ['close-spaced sublimation', 'closed space sublimatio', 'closed space sublimation', 'css'],
+    'Co-evaporation' : ['co evaporation', 'co-evaporation', 'coevaporation'],
+    'Crystalisation' : ['crystalisation'],
+    'CVD' : ['chemical vapor deposition', 'chemical vapour deposition', 'cvd', 'p-cvd'],
+    'DC Magnetron Sputtering' : ['dc magnetron sputter', 'dc magnetron sputtering'],
+    'DC Sputtering' : ['dc sputter', 'dc sputtering', 'dc-sputtering'],
+    'DC Reactive Magnetron Sputtering' : ['dc reactive magnetron sputtering'],
+    'Diffusion' : ['diffusion'],
+    'Diffusion-gas reaction' : ['diffusion gas reaction', 'diffusion-gas reaction'],
+    'Dipp-coating' : ['dip -coating', 'dip coating', 'dip-coating', 'dipcoating', 'diping', 'dipp coating', 'dipp-coating', 'dippcoating', 'dipping'],
+    'Doctor blading' : ['bald coating', 'bald-coating', 'bar coating', 'bar-coating', 'blad coating', 'blad-coating', 'blade coated', 'blade coating', 'blade printing', 'blade-coating', 'bladecoating', 'blading coating', 'doctor blade', 'doctor blade-coating', 'doctor blade coating', 'doctor blading', 'doctor-blade', 'doctor-blade coating', 'doctor-blading', 'doctorblade', 'doctorblading'],
+    'Drop-infiltration' : ['dop-infiltration', 'drop infiltration', 'drop-infiltration', 'dropinfiltration', 'dropp infiltration', 'dropp-infiltration', 'infiltrate'],
+    'Dropcasting' : ['drop casting', 'drop coating', 'drop-cast', 'drop-casting', 'drop-coating', 'dropcast', 'dropcasting', 'dropcoating', 'dropp coating'],
+    'E-beam evaporation' : ['e beam evaporation', 'e-beam', 'e-beam deposition', 'e-beam evaporation', 'ebeam evaporation', 'ebeam evporation', 'ebeam-evaporation', 'electro beam evaporation', 'electron beam deposition', 'electron beam evaporated', 'electron beam evaporation', 'electronbeam evaporation', 'reactive e-beam evaporation'],
+    'Electrospraying' : ['electro-spray', 'electrospray', 'electrospray coating', 'electrospraying'],
+    'Evaporation' : ['evaporate', 'evaporated', 'evaporatio', 'evaporation', 'thermal deposition', 'thermal evaporated', 'thermal evaporation', 'thermal vaporation', 'vaccum deposited', 'vacumn deposition', 'vacuum evaporation', 'vacuum thermal deposition'],
+    'Electrochemical anodization' : ['anodization', 'electrochemical anodization', 'potentiostatic anoidzation'],
+    'Electrodeposition' : ['anodically electrodeposition', 'ecd', 'electro deposition', 'electrocdeposition', 'electrochemical', 'electrochemical deposition', 'electrodeposited', 'electrodeposition', 'electrophoretic deposition', 'electro-deposition'],
+    'Electropolymerization' : ['electrochemical polymerisation', 'electrochemical polymerization', 'electropolymerization'],
+    'Electrospinning' : ['electrospinning', 'electro-spinning', 'electrostatic spinning'],
+    'Flash evaporation' : ['flash evaporation'],
+    'Gelation' : ['gelation'],
+    'Gas reaction' : ['gas reaction', 'vasp'],
+    'Hot-casting' : ['hot casting', 'hot-casting'],
+    'Hot-pressed' : ['hot pressed', 'hot-pressed'],
+    'Hydrothermal' : ['hydrotherma', 'hydrothermal', 'hydrothermal deposition', 'hydrothermal growth', 'hydrothermal method', 'hydrothermal process', 'hydrothermal synthesis', 'hydrotrmal'],
+    'Inkjet printing' : ['injet printing', 'inkjet printing', 'inkjet-printing'],
+    'Ion exchange' : ['ion exchange', 'ion-exchange'],
+    'Lamination' : ['dry press-transfer', 'film transfer', 'film transfer lamination', 'laminating', 'lamination', 'transfer lamination technique', 'transfer printing', 'wrapping'],
+    'Langmuir-Blodgett deposition' : ['langmuir-blodgett deposition', 'langmuir-blodgett film deposition'],
+    'LBLAR' : ['layer by layer adsorption and reaction', 'lblar'],
+    'Magnetron sputtering' : ['magneton sputtering', 'magnetron sputtering', 'magnetron-sputtering'],
+    'Pulsed laser deposition' : ['pld', 'pulsed laser deposition'],
+    'PVD' : ['pvd', 'ebpvd'],
+    'Reactive sputtering' : ['reactive sputtering'],
+    'Recrystalisation' : ['recrystalisation'],
+    'RF sputtering' : ['rf sputtering', 'rf-sputtering', 'rf magnetic sputtering'],
+    'Roller coating' : ['grooved roller coating', 'roll to roll microgravure printing', 'roller coating'],
+    'RF Magnetron Sputtering' : ['rfms', 'frequency magnetron sputteirng(fms)', 'radio-frequency magnetron sputtering', 'rf magneton sputtering', 'magnetron rf sputtering'],
+    'Sandwiching' : ['clamping', 'sandwich', 'sandwiched', 'sandwiching', 'sandwitched'],
+    'Screen printing' : ['screan printing', 'screan-printing', 'screanprinting', 'screen-printing', 'screen prinitng', 'screen-prining', 'screen-prinitng', 'screen-printed', 'screen printed', 'screen printing', 'screenprinting', 'screnprinting', 'silk-screen-printing', 'sreanprinting'],
+    'SILAR' : ['silar'],
+    'Single crystal growth' : ['single crystal growth'],
+    'Slot-die coating' : ['r2r slot-die coating', 'roll-to-roll slot-die coating', 'slot die', 'slot die coating', 'slot dye coating', 'slot-die coating', 'slot-dye coating', 'slotdie coating'],
+    'Sol-gel' : ['sol-gel', 'solgel'],
+    'Solvothermal' : ['auto-clave', 'autoclave', 'microwave-assisted reaction', 'solvothermal', 'solvothermal growth'],
+    'Space-limited inverse temperature crystallization' : ['space-limited inverse temperature crystallization'],
+    'Spin-coating' : ['spi-coating', 'spin -coating', 'spin casting', 'spin casted', 'spin coated', 'spin coating', 'spin coatng', 'spin-caoting', 'spin-cast', 'spin-casting', 'spin-cating', 'spin-coated', 'spin-coatin', 'spin-coating', 'spin.coating', 'spincaoting', 'spincoaing', 'spincoating', 'sping coating', 'spun-coating'],
+    'Spray-coating' : ['gun-spraying', 'spray', 'spray coating', 'spray depositing', 'spray deposition', 'spray-coating', 'spraycoating'],
+    'Spray-pyrolys' : ['pray-pyrolysis', 'spary pyrolysis', 'spra-pyrolys', 'spray pirolisis', 'spray pirolysis', 'spray pyolysis', 'spray pyrilysis', 'spray pyrolisis', 'spray pyrolys', 'spray pyrolysis', 'spray-pyrolisis', 'spray-pyrolys', 'spray-pyrolysis', 'spraypyrolysis'],
+    'Springkling' : ['springkling'],
+    'Sputtering' : ['dputtering', 'ion beam sputtering', 'plasma sputtering', 'sputter', 'sputtered', 'sputtering'],
+    'Thermal oxidation' : ['thermal oxidization'],
+    'Ultrasonic spray' : ['ultrasonic spray deposition', 'ultrasonic spray-coating'],
+    'Unknown' : ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan'],
+    'Vacuum flash evaporation' : ['vacuum flash evaporation'],
+    'Vacuum sublimation' : ['vacuum sublimation'],
+    }
 
 def depositionProcedureFormating(methode):
     ''' Check deposition proceadures againast known formating variations 
         and return the standard formating for the methode '''
 
-    # Remove starting and ending blank spaces
-    methode = methode.strip()
-
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in depositionProcedureFormating')
-
-    elif methode.lower() in ['air brush', 'air brush spray', 'air brush spray-coating']:
-        formatedMethode = 'Air brush spray'
-    elif methode.lower() in ['ald', 'atomic layer deposition', 'peald', 'plasma enhanced ald']:
-        formatedMethode = 'ALD' 
-
-    elif methode.lower() in ['brush painting', 'brush-painting', 'brushing']:
-        formatedMethode = 'Brush painting'
-
-    elif methode.lower() in ['candle burning']:
-        formatedMethode = 'Candle burning'
-    elif methode.lower() in ['bath deposition', 'bath-deposition', 'cbd', 'chemical bath', 'chemical bath deposition', 'chemical bath depostion', 'chemical bath method', 'chemical deposition', 'chemical-bath']:
-        formatedMethode = 'CBD' 
-    elif methode.lower() in ['close-spaced sublimation', 'closed space sublimatio', 'closed space sublimation', 'css']:
-        formatedMethode = 'Closed space sublimation' 
-    elif methode.lower() in ['co evaporation', 'co-evaporation', 'coevaporation']:
-        formatedMethode = 'Co-evaporation'
-    elif methode.lower() in ['crystalisation']:
-        formatedMethode = 'Crystalisation'
-    elif methode.lower() in ['chemical vapor deposition', 'chemical vapour deposition', 'cvd', 'p-cvd']:
-        formatedMethode = 'CVD' 
- 
-    elif methode.lower() in ['dc magnetron sputter', 'dc magnetron sputtering']:
-        formatedMethode = 'DC Magnetron Sputtering' 
-    elif methode.lower() in ['dc sputter', 'dc sputtering', 'dc-sputtering']:
-        formatedMethode = 'DC Sputtering'         
-    elif methode.lower() in ['dc reactive magnetron sputtering']:
-        formatedMethode = 'DC Reactive Magnetron Sputtering' 
-    elif methode.lower() in ['diffusion']:
-        formatedMethode = 'Diffusion' 
-    elif methode.lower() in ['diffusion gas reaction', 'diffusion-gas reaction']:
-        formatedMethode = 'Diffusion-gas reaction'  
-    elif methode.lower() in ['dip -coating', 'dip coating', 'dip-coating', 'dipcoating', 'diping', 'dipp coating', 'dipp-coating', 'dippcoating', 'dipping']:
-        formatedMethode = 'Dipp-coating'     
-    elif methode.lower() in ['bald coating', 'bald-coating', 'bar coating', 'bar-coating', 'blad coating', 'blad-coating', 'blade coated', 'blade coating', 'blade printing', 'blade-coating', 'bladecoating', 'blading coating', 'doctor blade', 'doctor blade-coating', 'doctor blade coating', 'doctor blading', 'doctor-blade', 'doctor-blade coating', 'doctor-blading', 'doctorblade', 'doctorblading']:
-        formatedMethode = 'Doctor blading'
-    elif methode.lower() in ['dop-infiltration', 'drop infiltration', 'drop-infiltration', 'dropinfiltration', 'dropp infiltration', 'dropp-infiltration', 'infiltrate']:
-        formatedMethode = 'Drop-infiltration' 
-    elif methode.lower() in ['drop casting', 'drop coating', 'drop-cast', 'drop-casting', 'drop-coating', 'dropcast', 'dropcasting', 'dropcoating', 'dropp coating']:
-        formatedMethode = 'Dropcasting' 
-
-    elif methode.lower() in ['e beam evaporation', 'e-beam', 'e-beam deposition', 'e-beam evaporation', 'ebeam evaporation', 'ebeam evporation', 'ebeam-evaporation', 'electro beam evaporation', 'electron beam deposition', 'electron beam evaporated', 'electron beam evaporation', 'electronbeam evaporation', 'reactive e-beam evaporation']:
-        formatedMethode = 'E-beam evaporation'
-    elif methode.lower() in ['electro-spray', 'electrospray', 'electrospray coating', 'electrospraying']:
-        formatedMethode = 'Electrospraying'        
-    elif methode.lower() in ['evaporate', 'evaporated', 'evaporatio', 'evaporation', 'thermal deposition', 'thermal evaporated', 'thermal evaporation', 'thermal vaporation', 'vaccum deposited', 'vacumn deposition', 'vacuum evaporation', 'vacuum thermal deposition']:
-        formatedMethode = 'Evaporation'
-    elif methode.lower() in ['anodization', 'electrochemical anodization', 'potentiostatic anoidzation']:
-        formatedMethode = 'Electrochemical anodization'
-    elif methode.lower() in ['anodically electrodeposition', 'ecd', 'electro deposition', 'electrocdeposition', 'electrochemical', 'electrochemical deposition', 'electrodeposited', 'electrodeposition', 'electrophoretic deposition', 'electro-deposition']:
-        formatedMethode = 'Electrodeposition'
-    elif methode.lower() in ['electrochemical polymerisation', 'electrochemical polymerization', 'electropolymerization']:
-        formatedMethode = 'Electropolymerization'
-    elif methode.lower() in ['electrospinning', 'electro-spinning', 'electrostatic spinning']:
-        formatedMethode = 'Electrospinning'
-
-    elif methode.lower() in ['flash evaporation']:
-        formatedMethode = 'Flash evaporation'
-
-    elif methode.lower() in ['gelation']:
-        formatedMethode = 'Gelation'
-    elif methode.lower() in ['gas reaction', 'vasp']:
-        formatedMethode = 'Gas reaction'
-      
-    elif methode.lower() in ['hot casting', 'hot-casting']:
-        formatedMethode = 'Hot-casting'
-    elif methode.lower() in ['hot pressed', 'hot-pressed']:
-        formatedMethode = 'Hot-pressed'
-    elif methode.lower() in ['hydrotherma', 'hydrothermal', 'hydrothermal deposition', 'hydrothermal growth', 'hydrothermal method', 'hydrothermal process', 'hydrothermal synthesis', 'hydrotrmal']:
-        formatedMethode = 'Hydrothermal'
-
-    elif methode.lower() in ['injet printing', 'inkjet printing', 'inkjet-printing']:
-        formatedMethode = 'Inkjet printing'
-    elif methode.lower() in ['ion exchange', 'ion-exchange']:
-        formatedMethode = 'Ion exchange'
-       
-    elif methode.lower() in ['dry press-transfer', 'film transfer', 'film transfer lamination', 'laminating', 'lamination', 'transfer lamination technique', 'transfer printing', 'wrapping']:
-        formatedMethode = 'Lamination'        
-    elif methode.lower() in ['langmuir-blodgett deposition', 'langmuir-blodgett film deposition']:
-        formatedMethode = 'Langmuir-Blodgett deposition'
-    elif methode.lower() in ['layer by layer adsorption and reaction', 'lblar']:
-        formatedMethode = 'LBLAR'
-
-    elif methode.lower() in ['magneton sputtering', 'magnetron sputtering', 'magnetron-sputtering']:
-        formatedMethode = 'Magnetron sputtering'
-
-    elif methode.lower() in ['pld', 'pulsed laser deposition']:
-        formatedMethode = 'Pulsed laser deposition'
-    elif methode.lower() in ['pvd', 'ebpvd']:
-        formatedMethode = 'PVD'
-
-    elif methode.lower() in ['reactive sputtering']:
-        formatedMethode = 'Reactive sputtering'
-    elif methode.lower() in ['recrystalisation']:
-        formatedMethode = 'Recrystalisation'
-    elif methode.lower() in ['rf sputtering', 'rf-sputtering', 'rf magnetic sputtering']:
-        formatedMethode = 'RF sputtering'
-    elif methode.lower() in ['grooved roller coating', 'roll to roll microgravure printing', 'roller coating']:
-        formatedMethode = 'Roller coating'
-    elif methode.lower() in ['rfms', 'frequency magnetron sputteirng(fms)', 'radio-frequency magnetron sputtering', 'rf magneton sputtering', 'magnetron rf sputtering']:
-        formatedMethode = 'RF Magnetron Sputtering' 
-        
-    elif methode.lower() in ['clamping', 'sandwich', 'sandwiched', 'sandwiching', 'sandwitched']:
-        formatedMethode = 'Sandwiching'
-    elif methode.lower() in ['screan printing', 'screan-printing', 'screanprinting', 'screen-printing', 'screen prinitng', 'screen-prining', 'screen-prinitng', 'screen-printed', 'screen printed', 'screen printing',  'screenprinting', 'screnprinting', 'silk-screen-printing', 'sreanprinting']:
-        formatedMethode = 'Screen printing' 
-    elif methode.lower() in ['silar']:
-        formatedMethode = 'SILAR'
-    elif methode.lower() in ['single crystal growth']:
-        formatedMethode = 'Single crystal growth'
-    elif methode.lower() in ['r2r slot-die coating', 'roll-to-roll slot-die coating', 'slot die', 'slot die coating', 'slot dye coating', 'slot-die coating', 'slot-dye coating', 'slotdie coating']:
-        formatedMethode = 'Slot-die coating'
-    elif methode.lower() in ['sol-gel', 'solgel']:
-        formatedMethode = 'Sol-gel'
-    elif methode.lower() in ['auto-clave', 'autoclave', 'microwave-assisted reaction', 'solvothermal', 'solvothermal growth']:
-        formatedMethode = 'Solvothermal' 
-    elif methode.lower() in ['space-limited inverse temperature crystallization']:
-        formatedMethode = 'Space-limited inverse temperature crystallization'
-    elif methode.lower() in ['spi-coating', 'spin -coating', 'spin casting', 'spin casted', 'spin coated', 'spin coating', 'spin coatng', 'spin-caoting', 'spin-caoting', 'spin-cast', 'spin-casting', 'spin-cating', 'spin-coated', 'spin-coatin', 'spin-coating', 'spin.coating', 'spincaoting', 'spincoaing', 'spincoating', 'sping coating', 'spun-coating']:
-        formatedMethode = 'Spin-coating'
-    elif methode.lower() in ['gun-spraying', 'spray', 'spray coating', 'spray depositing', 'spray deposition', 'spray-coating', 'spraycoating']:
-        formatedMethode = 'Spray-coating' 
-    elif methode.lower() in ['pray-pyrolysis', 'spary pyrolysis', 'spra-pyrolys', 'spray pirolisis', 'spray pirolysis', 'spray pyolysis', 'spray pyrilysis', 'spray pyrolisis', 'spray pyrolys', 'spray pyrolysis', 'spray-pyrolisis', 'spray-pyrolys', 'spray-pyrolysis', 'spraypyrolysis']:
-        formatedMethode = 'Spray-pyrolys' 
-    elif methode.lower() in ['springkling']:
-        formatedMethode = 'Springkling' 
-    elif methode.lower() in ['dputtering', 'ion beam sputtering', 'plasma sputtering', 'sputter', 'sputtered', 'sputtering']:
-        formatedMethode = 'Sputtering' 
-
-    elif methode.lower() in ['thermal oxidization']:
-        formatedMethode = 'Thermal oxidation'
-
-    elif methode.lower() in ['ultrasonic spray deposition', 'ultrasonic spray-coating']:
-        formatedMethode = 'Ultrasonic spray' 
-    elif methode.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        formatedMethode = 'Unknown'
-
-    elif methode.lower() in ['vacuum flash evaporation']:
-        formatedMethode = 'Vacuum flash evaporation' 
-    elif methode.lower() in ['vacuum sublimation']:
-        formatedMethode = 'Vacuum sublimation' 
-
-    # If no known formating variations
-    else: 
-        formatedMethode = methode
-
-    return formatedMethode
+    return normalizeToken(methode, depositionProcedureVocabulary)
 
 def depositionProcedureOld(userData):
     '''Format the deposition proceadure data'''
@@ -969,38 +671,20 @@ def doiNumbers(userData):
 
 def dopandsAndAdditives(userData):
     '''Format dopands and additives '''
-    listOfAdditives = []
-    for i, item in enumerate(userData):
-        try:
-            # Enforce input as a string 
-            item = str(item)
-
-            # Remove starting and ending blank spaces
-            item = item.strip()
-
-            # Split on |
-            layers = item.split('|')
-
-            for j, layer in enumerate(layers):
-                # Split on ;
-                dopands = layer.split(';')
-
-                for k, dopand in enumerate(dopands):
-                    # Enforse proper formating
-                    dopands[k] = dopandsAndAdditivesFormating(dopand)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[j] = "; ".join(dopands)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-
-            listOfAdditives.append(item)
-        except:
-            listOfAdditives.append('')
-            print(f'Cound not read in dopandsAndAdditives on line: {i}')
-
-    return listOfAdditives
+    # For each item, there may be several layers separated by |
+    # For each layer, there may be several dopands separted by ;
+    return normalize(userData, dopandsAndAdditivesFormating, separators = (layers, lists), errorValue = '')
+
+# Standard formating of dopands and additives, and the lower case formating variations that are converted to it
+dopandsAndAdditivesVocabulary = {
+    'nan' : ['', 'nan', 'na'],
+    'Unknown' : ['unknown'],
+    'Undoped' : ['non', 'none', 'undoped'],
+    'Ascorbic acid' : ['ascorbicacid'],
+    'Phosphatidylcholine' : ['phosphatidylcholine'],
+    'TBP' : ['4-tert-butylpyridine', 'tbp', 't-bp'],
+    'Li-TFSI' : ['litfsi', 'li-tfsi'],
+    }
 
 def dopandsAndAdditivesFormating(additive):
     ''' Check dopands and additives againast known formating variations 
@@ -1014,35 +698,7 @@ def dopandsAndAdditivesFormating(additive):
     additive = additive.replace(" :",":")
     additive = additive.replace(": ",":")
 
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in dopandsAndAdditivesFormating')
-  
-    elif additive.lower() in  ['', 'nan', 'na']:
-        formatedAdditive = 'nan'
-
-    elif additive.lower() in  ['unknown']:
-        formatedAdditive = 'Unknown'
-
-    elif additive.lower() in  ['non', 'none', 'undoped']:
-        formatedAdditive = 'Undoped'
-
-    elif additive.lower() in ['ascorbicacid']:
-        formatedAdditive = 'Ascorbic acid'
-    elif additive.lower() in ['phosphatidylcholine']:
-        formatedAdditive = 'Phosphatidylcholine'
-
-    elif additive.lower() in ['4-tert-butylpyridine','tbp', 't-bp']:
-        formatedAdditive = 'TBP'
-    elif additive.lower() in ["litfsi","li-tfsi"]:
-        formatedAdditive = 'Li-TFSI'
-
-
-    # If no known formating variations
-    else: 
-        formatedAdditive = additive
-
-    return formatedAdditive
+    return normalizeToken(additive, dopandsAndAdditivesVocabulary)
 
 def dopandsAndAdditivesOld(userData, perovskite):
     '''Format dopands and aditives '''
@@ -1261,39 +917,9 @@ def JscData(userData):
 
 def mixingRatios(userData):
     '''List of relative humidity '''
-    solutionMixtures = []
-
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionProcedures = layer.split('>>')
-
-                for j, depositionProcedure in enumerate(depositionProcedures):
-                    # Enforse proper formating
-                    depositionProcedures[j] = mixingRatiosFormating(depositionProcedure)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[i] = " >> ".join(depositionProcedures)
-
-            # Concatenate all parts with proper spacing
-            item = " | ".join(layers)
-
-            solutionMixtures.append(item)
-        except:
-            print(f'faild to extract mixingRatios of {item} on row {i}')
-            solutionMixtures.append(item)
-
-    return solutionMixtures
+    # For each item, there may be several layers separated by |
+    # For each layer, there may be several depostion proceadures separatd by >>
+    return normalize(userData, mixingRatiosFormating, separators = (layers, steps))
 
 def mixingRatiosFormating(ratios):
     ''' Check solventmixing against known formating variations 
@@ -1436,64 +1062,24 @@ def numberListUnitless(userData):
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
     # For each deposition proceadures, there may be several elements separted by ;
+    # Enforse the use of decimal point and the notation of lists
+    return normalize(userData, numberListUnitlessFormating, separators = (layers, steps, lists), replacements = ((',', '.'), (':', ';')), errorValue = '', strip = False)
+  
+def numberListUnitlessFormating(element):
+    ''' Check element againast known formating variations 
+    and return the standard formating'''
 
-    amounts = []
-    for item in userData:
-        try:
-            # Enforce input is a string 
-            item = str(item)   
+    # Remove all blank spaces
+    element = element.replace(' ','')
 
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
+    # If not stated
+    if element.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
+        return 'nan'
 
-            # Enforse the list notation rather than the mixing notation
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    elements = depositionStep.split(';')
-
-                    for k, element in enumerate(elements):
-                        # Enforse proper formating
-                        elements[k] = numberListUnitlessFormating(element)
-
-                    depositionSteps[j] = '; '.join(elements)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            amounts.append(item)
-        except:
-            amounts.append('')
-            print(f'Cound not read in temperature on line: {i}')
-
-    return amounts
-  
-def numberListUnitlessFormating(element):
-    ''' Check element againast known formating variations 
-    and return the standard formating'''
-
-    # Remove all blank spaces
-    element = element.replace(' ','')
-
-    # If not stated
-    if element.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        return 'nan'
-
-    # Separate out the number from the unit (and there should be no unit)
-    number, unit = stringToNumberAndUnit(element)
-  
-    return number
+    # Separate out the number from the unit (and there should be no unit)
+    number, unit = stringToNumberAndUnit(element)
+  
+    return number
 
 def numericInteger(userData, default = 0):
     '''Convert values to int with specified default value'''
@@ -1667,207 +1253,140 @@ def perovskiteAfterTreatment(userData):
 
 def perovskiteCoefficients(userData):
     '''Format coefficients in chemical formulas'''
-    listOfCoefficients= []
-    for item in userData:
-        try:
-            # Enforce input as a string 
-            item = str(item)
-
-            # Remove starting and ending blank spaces
-            item = item.strip()
-
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Enfors the use of list notation rather than mixing notation
-            item = item.replace(':', ';')
-            
-            # In case 1 have been read as True (have happened)
-            if item == 'True':
-                item = '1'
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on ;
-                coefficients = layer.split(';')
+    # For each item, there may be several layers separated by |
+    # For each layer, there may be several coefficients separted by ;
 
-                for j, coefficient in enumerate(coefficients):
-                    # Enforse proper formating
-                    coefficients[j] = coefficientsFormating(coefficient)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[i] = "; ".join(coefficients)
+    # In case 1 have been read as True (have happened)
+    userData = pd.Series(userData, dtype = object).astype(str).str.strip().replace('True', '1')
 
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
+    # Enforse the use of decimal point and the notation of lists
+    return normalize(userData, coefficientsFormating, separators = (layers, lists), replacements = ((',', '.'), (':', ';')), errorValue = '')
 
-            listOfCoefficients.append(item)
-        except:
-            listOfCoefficients.append('')
-            print(f'Cound not read in perovskiteCoefficients on line: {j}')
+# Rewrite rules for perovskite compositions, applied in order
+perovskiteCompositionRules = compileRewriteRules([
+    # Enfors the use of decimal point
+    (',', '.'),
 
-    return listOfCoefficients
+    # Ensure that all ions are written with the right casing
+    ('fa', 'FA'),
+    ('Fa', 'FA'),
+    ('ma', 'MA'),
+    ('Ma', 'MA'),
+    ('pb', 'Pb'),
+    ('Gua', 'GU'),
+    ('CH3NH3', 'MA'),
+
+    ('Sn0.5Pb0.5', 'Pb0.5Sn0.5'),
+    ('Sn0.1Pb0.9', 'Pb0.9Sn0.1'),
+
+    ('Sn0.5Ge0.5', 'Ge0.5Sn0.5'),
+
+    ('I1.2Br1.8', 'Br1.8I1.2'),
+    ('I1.5Br1.5', 'Br1.5I1.5'),
+    ('I1.8Br1.2', 'Br1.2I1.8'),
+    ('I2.1Br0.9', 'Br0.9I2.1'),
+    ('I2.2Br0.8', 'Br0.8I2.2'),
+    ('I2.24Br0.6', 'Br0.6I2.4'),
+    ('I2.51Br0.49', 'Br0.49I2.51'),
+    ('I2.55Br0.45', 'Br0.45I2.55'),
+    ('I2.49Br0.51', 'Br0.51I2.49'),
+    ('I2.5Br0.5', 'Br0.5I2.5'),
+    ('I2.59Br0.41', 'Br0.41I2.59'),
+    ('I2.65Br0.35', 'Br0.35I2.65'),
+    ('I2.69Br0.31', 'Br0.31I2.69'),
+    ('I2.7Br0.3', 'Br0.3I2.7'),
+    ('I2.75Br0.25', 'Br0.25I2.75'),
+    ('I2.8Br0.2', 'Br0.2I2.8'),
+    ('I2.85Br0.15', 'Br0.15I2.85'),
+    ('I2.9Br0.1', 'Br0.1I2.9'),
+    ('I2.99Br0.01', 'Br0.01I2.99'),
+
+    ('MA0.15FA0.75', 'FA0.75MA0.15'),
+    ('MA0.17FA0.83', 'FA0.83MA0.17'),
+    ('MA0.2FA0.8', 'FA0.8MA0.2'),
+    ('MA0.4FA0.6', 'FA0.6MA0.4'),
+    ('MA0.6FA0.4', 'FA0.4MA0.6'),
+    ('MA0.7FA0.3', 'FA0.3MA0.7'),
+    ('MA0.85FA0.15', 'FA0.15MA0.85'),
+    ('MA0.9FA0.1', 'FA0.1MA0.9'),
+    ('MA0.05FA0.83', 'FA0.83MA0.05'),
+
+    ('MA0.1FA0.75Cs0.15', 'Cs0.15FA0.75MA0.1'),
+    ('MA0.6FA0.38Cs0.02', 'Cs0.02FA0.38MA0.6'),
+    ('FA0.75MA0.15Cs0.1', 'Cs0.1FA0.75MA0.15'),
+
+    ('MA0.85Cs0.15', 'Cs0.15MA0.85'),
+
+    ('FA0.83Cs0.17', 'Cs0.17FA0.83'),
+    ('FA0.7Cs0.3', 'Cs0.3FA0.7'),
+    ('FA0.8Cs0.2', 'Cs0.2FA0.8'),
+    ('FA0.85Cs0.15', 'Cs0.15FA0.85'),
+    ('FA0.875Cs0.125', 'Cs0.125FA0.875'),
+    ('FA0.9Cs0.1', 'Cs0.1FA0.9'),
+    ('FA0.95Cs0.05', 'Cs0.05FA0.95'),
+
+    ('FA0.85BA0.15', 'BA0.15FA0.85'),
+
+    ('MA3BA2', 'BA2MA3'),
+    ('BA0.2MA3', 'MA3BA0.2'),
+    ('BA0.4MA3', 'MA3BA0.4'),
+    ('BA0.6MA3', 'MA3BA0.6'),
+
+    ('Br1I2', 'BrI2'),
+    ('I2Br', 'BrI2'),
+    ('Br2I1', 'Br2I'),
+
+    ('(I0.8Br0.2)3', 'Br0.6I2.4'),
+    ('(I0.85Br0.15)3', 'Br0.45I2.55'),
+
+    ('(I0.75Br0.25)3', 'Br0.75I2.25'),
+    ])
+
+# Known formating mistakes. Compositions that are replaced as a whole after the rewrite rules
+perovskiteCompositionMistakes = {
+    'MAPbI3' : ['MAPbI3-xClx', 'MAPbIxCl3-x', 'MAPbI3−xClx', 'MAPbIxCly', 'MAPbi3', 'MAPbI2.67Cl0.33', 'MAPbI2.75Cl0.25', 'MAPbI2.7Cl0.30', 'MAPbI2.81Cl0.19', 'MAPbI2.89Cl0.11'],
+    'FAPbI3' : ['FAMAPbI3–xBrx', 'α-FAPbI3'],
+    'FA0.7MA0.3PbBr0.9I2.1' : ['(FAPbI3)0.7(MAPbBr3)0.3'],
+    'FA0.75MA0.25PbBr0.75I2.25' : ['(FAPbI3)0.75(MAPbBr3)0.25'],
+    'FA0.8MA0.2PbBr0.6I2.4' : ['(FAPbI3)0.8(MAPbBr3)0.2'],
+    'FA0.85MA0.15PbBr0.45I2.55' : ['(FAPbI3)0.85(MAPbBr3)0.15', 'FAI)0.85(PbI2)0.85(MABr)0.15(PbBr2)0.15'],
+    'FA0.9MA0.1PbBr0.3I2.7' : ['(FAPbI3)0.9(MAPbBr3)0.1'],
+    'FA0.95MA0.05PbBr0.15I2.85' : ['(FAPbI3)0.95(MAPbBr3)0.05'],
+    'CsPbBrI2' : ['CsPbI2Br'],
+    'BAFA10Pb11I34' : ['(FAPbI3)10(BAPbI4)'],
+    'BAFA40Pb41I124' : ['(FAPbI3)40(BAPbI4)'],
+    'BAFA60Pb61I184' : ['(FAPbI3)60(BAPbI4)'],
+    'MA3Bi2I9' : ['(MA)3Bi2I9', '(CH3NH3)3Bi2I9'],
+    'Cs0.05FA0.81MA0.14PbBr0.45I2.55' : ['Cs0.05FA0.81MA0.14PbI2.55Br0.45'],
+    'FA0.85PEA0.015SnI3' : ['PEA0.15FA0.85SnI3:SnF2'],
+    'Cs0.1MA0.9PbBr1.2I1.8' : ['MA0.9Cs0.1PbBr1.2I1.8'],
+    }
+_perovskiteCompositionMistakes = {mistake : composition for composition, mistakes in perovskiteCompositionMistakes.items() for mistake in mistakes}
 
 def perovskiteComposition(userData):
     '''Format the strings determining the perovskite compoition'''
-    composition = []
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-        
-            # In case of tempy string
-            if item == '':
-                item = 'none'
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Enfors the use of decimal point
-            item = item.replace(',', '.')
-
-            # Ensure that all ions are written with the right casing
-            item = item.replace("fa","FA")
-            item = item.replace("Fa","FA")
-            item = item.replace("ma","MA")
-            item = item.replace("Ma","MA")
-            item = item.replace("pb","Pb")
-            item = item.replace("Gua","GU")
-            item = item.replace("CH3NH3","MA")
-
-            item = item.replace("Sn0.5Pb0.5","Pb0.5Sn0.5")
-            item = item.replace("Sn0.1Pb0.9","Pb0.9Sn0.1")
-
-            item = item.replace("Sn0.5Ge0.5","Ge0.5Sn0.5")
-
-            item = item.replace("I1.2Br1.8","Br1.8I1.2")
-            item = item.replace("I1.5Br1.5","Br1.5I1.5")
-            item = item.replace("I1.8Br1.2","Br1.2I1.8")
-            item = item.replace("I2.1Br0.9","Br0.9I2.1")
-            item = item.replace("I2.2Br0.8","Br0.8I2.2")
-            item = item.replace("I2.24Br0.6","Br0.6I2.4")
-            item = item.replace("I2.51Br0.49","Br0.49I2.51")
-            item = item.replace("I2.55Br0.45","Br0.45I2.55")
-            item = item.replace("I2.49Br0.51","Br0.51I2.49")
-            item = item.replace("I2.5Br0.5","Br0.5I2.5")
-            item = item.replace("I2.59Br0.41","Br0.41I2.59")
-            item = item.replace("I2.65Br0.35","Br0.35I2.65")
-            item = item.replace("I2.69Br0.31","Br0.31I2.69")
-            item = item.replace("I2.7Br0.3","Br0.3I2.7")
-            item = item.replace("I2.75Br0.25","Br0.25I2.75")
-            item = item.replace("I2.8Br0.2","Br0.2I2.8")
-            item = item.replace("I2.85Br0.15","Br0.15I2.85")
-            item = item.replace("I2.9Br0.1","Br0.1I2.9")
-            item = item.replace("I2.99Br0.01","Br0.01I2.99")
-
-            item = item.replace("MA0.15FA0.75","FA0.75MA0.15")
-            item = item.replace("MA0.17FA0.83","FA0.83MA0.17")
-            item = item.replace("MA0.2FA0.8","FA0.8MA0.2")
-            item = item.replace("MA0.4FA0.6","FA0.6MA0.4")
-            item = item.replace("MA0.6FA0.4","FA0.4MA0.6")
-            item = item.replace("MA0.7FA0.3","FA0.3MA0.7")
-            item = item.replace("MA0.85FA0.15","FA0.15MA0.85")
-            item = item.replace("MA0.9FA0.1","FA0.1MA0.9")
-            item = item.replace("MA0.05FA0.83","FA0.83MA0.05")
-
-            item = item.replace("MA0.1FA0.75Cs0.15", "Cs0.15FA0.75MA0.1")
-            item = item.replace("MA0.6FA0.38Cs0.02", "Cs0.02FA0.38MA0.6")
-            item = item.replace("FA0.75MA0.15Cs0.1", "Cs0.1FA0.75MA0.15")
-
-            item = item.replace("MA0.85Cs0.15","Cs0.15MA0.85")
-
-            item = item.replace("FA0.83Cs0.17","Cs0.17FA0.83")
-            item = item.replace("FA0.7Cs0.3","Cs0.3FA0.7")
-            item = item.replace("FA0.8Cs0.2","Cs0.2FA0.8")
-            item = item.replace("FA0.85Cs0.15","Cs0.15FA0.85")
-            item = item.replace("FA0.875Cs0.125","Cs0.125FA0.875")
-            item = item.replace("FA0.9Cs0.1","Cs0.1FA0.9")
-            item = item.replace("FA0.95Cs0.05","Cs0.05FA0.95")
-
-            item = item.replace("FA0.85BA0.15", "BA0.15FA0.85")
-
-            item = item.replace("MA3BA2","BA2MA3")
-            item = item.replace("BA0.2MA3","MA3BA0.2")
-            item = item.replace("BA0.4MA3","MA3BA0.4")
-            item = item.replace("BA0.6MA3","MA3BA0.6")
-
-            item = item.replace("Br1I2","BrI2")
-            item = item.replace("I2Br","BrI2")
-            item = item.replace("Br2I1","Br2I")
-
-            item = item.replace("(I0.8Br0.2)3","Br0.6I2.4")
-            item = item.replace("(I0.85Br0.15)3", "Br0.45I2.55")
-
-
-            item = item.replace("(I0.75Br0.25)3", "Br0.75I2.25")
-
-            ## Correct known formating mistakes
-            #item = item.replace("bP","Pb")
-            if item in ['MAPbI3-xClx', 'MAPbI3-xClx', 'MAPbIxCl3-x', 'MAPbI3−xClx', 'MAPbIxCly', 'MAPbi3', 'MAPbI2.67Cl0.33', 'MAPbI2.75Cl0.25' ,'MAPbI2.7Cl0.30', 'MAPbI2.81Cl0.19', 'MAPbI2.89Cl0.11']:
-                item = 'MAPbI3'
-            elif item in ['FAMAPbI3–xBrx', 'α-FAPbI3']:
-                item = 'FAPbI3'
-            elif item in ['(FAPbI3)0.7(MAPbBr3)0.3']:
-                item = 'FA0.7MA0.3PbBr0.9I2.1'
-            elif item in ['(FAPbI3)0.75(MAPbBr3)0.25']:
-                item = 'FA0.75MA0.25PbBr0.75I2.25'
-            elif item in ['(FAPbI3)0.8(MAPbBr3)0.2']:
-                item = 'FA0.8MA0.2PbBr0.6I2.4'
-            elif item in ['(FAPbI3)0.85(MAPbBr3)0.15', 'FAI)0.85(PbI2)0.85(MABr)0.15(PbBr2)0.15']:
-                item = 'FA0.85MA0.15PbBr0.45I2.55'
-            elif item in ['(FAPbI3)0.9(MAPbBr3)0.1']:
-                item = 'FA0.9MA0.1PbBr0.3I2.7'
-            elif item in ['(FAPbI3)0.95(MAPbBr3)0.05']:
-                item = 'FA0.95MA0.05PbBr0.15I2.85'
-
-            elif item in ['CsPbI2Br']:
-                item = 'CsPbBrI2'
-
-            elif item in ['(FAPbI3)10(BAPbI4)']:
-                item = 'BAFA10Pb11I34'
-            elif item in ['(FAPbI3)40(BAPbI4)']:
-                item = 'BAFA40Pb41I124'
-            elif item in ['(FAPbI3)60(BAPbI4)']:
-                item = 'BAFA60Pb61I184'
-
-            elif item in ['(MA)3Bi2I9']:
-                item = 'MA3Bi2I9'
-             
-            elif item in ['Cs0.05FA0.81MA0.14PbI2.55Br0.45']:
-                item = 'Cs0.05FA0.81MA0.14PbBr0.45I2.55'
-
-            elif item in ['PEA0.15FA0.85SnI3:SnF2']:
-                item = 'FA0.85PEA0.015SnI3'
+    # In case of empty strings
+    userData = pd.Series(userData, dtype = object).astype(str).replace('', 'none')
 
+    # Each unique composition is only formated once
+    return normalize(userData, perovskiteCompositionFormating)
 
-            elif item in ['(CH3NH3)3Bi2I9']:
-                item = 'MA3Bi2I9'
-
-            elif item in ['MA0.9Cs0.1PbBr1.2I1.8']:
-                item = 'Cs0.1MA0.9PbBr1.2I1.8'
-
-            # Split on |
-            itemList = item.split('|')
-
-            for i, element in enumerate(itemList):
-                # Remove leading and tailing blank spaces
-                itemList[i] = element.strip()
+def perovskiteCompositionFormating(composition):
+    '''Format one perovskite composition'''
+    # Enfors the use of decimal point, the right casing and the order of the ions
+    composition = rewrite(composition, perovskiteCompositionRules)
 
-            # Concatenate all parts with proper spacing
-            item = " | ".join(itemList)
+    # Correct known formating mistakes
+    composition = _perovskiteCompositionMistakes.get(composition, composition)
 
-            # TO DO
-            # Deal with parantesises
+    # Remove leading and tailing blank spaces around |, and concatenate all parts with proper spacing
+    composition = " | ".join([element.strip() for element in composition.split('|')])
 
-            # TO DO
-            # Deal with the order of the ions
+    # TO DO
+    # Deal with parantesises
 
-            composition.append(item)
-        except:
-            print(f'faild to extract perovskiteComposition of {item} on row {i}')
-            composition.append(item)
+    # TO DO
+    # Deal with the order of the ions
 
     return composition
 
@@ -1875,110 +1394,32 @@ def perovskiteIons(userData):
     '''Format list of perovsktie ions'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several ions separted by ;
-
-    listOfIons = []
-    for item in userData:
-        try:
-            # Enforce input as a string 
-            item = str(item)
-
-            # Remove starting and ending blank spaces
-            item = item.strip()
-
-            # Enfors the use of list notation rather than mixing notation
-            item = item.replace(':', ';') 
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on ;
-                ions = layer.split(';')
-
-                for j, ion in enumerate(ions):
-                    # Enforse proper formating
-                    ions[j] = perovskiteIonFormating(ion)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[i] = "; ".join(ions)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-
-            listOfIons.append(item)
-        except:
-            listOfIons.append('')
-            print(f'Cound not read in dopandsAndAdditives on line: {j}')
-
-    return listOfIons
+    # Enfors the use of list notation rather than mixing notation
+    return normalize(userData, perovskiteIonVocabulary, separators = (layers, lists), replacements = ((':', ';'),), errorValue = '')
+
+# Standard formating of perovskite ions, and the lower case formating variations that are converted to it
+perovskiteIonVocabulary = {
+    'Br' : ['br'],
+    'Cs' : ['cs'],
+    'FA' : ['fa', 'ch5n2', 'ch(nh2)2'],
+    'MA' : ['ma', 'ch3nh3'],
+    'Pb' : ['pb'],
+    'Sn' : ['sn'],
+    'nan' : ['', 'nan', 'non', 'none', 'np.nan', 'unknown'],
+    }
 
 def perovskiteIonFormating(ion):
     ''' Check pervskite ions againast known formating variations 
         and return the standard formating for the ion '''
 
-    # Remove starting and ending blank spaces
-    ion = ion.strip()
-
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in depositionProcedureFormating')
-    elif ion.lower() in ['br']:
-        ion = 'Br'
-    elif ion.lower() in ['cs']:
-        ion = 'Cs'
-    elif ion.lower() in ['fa', 'ch5n2', 'ch(nh2)2']:
-        ion = 'FA'
-    elif ion.lower() in ['ma', 'ch3nh3']:
-        ion = 'MA'
-    elif ion.lower() in ['pb']:
-        ion = 'Pb'
-    elif ion.lower() in ['sn']:
-        ion = 'Sn'
-    elif ion.lower() in ['', 'nan', 'non', 'none', 'np.nan', 'unknown']:
-        ion = 'nan'
-
-
-    return ion
+    return normalizeToken(ion, perovskiteIonVocabulary)
 
 def perovskiteLongForm(userData):
     '''Format the peroskite short form '''
     # For each item, there may be several layers separated by |
-    # For each layer, there may be several perovskite mixed with each other separated by ;
-    compositionList = []
-    for item in userData:
-        try:
-            # Enforce input as a string 
-            item = str(item)
-
-            # Remove starting and ending blank spaces
-            item = item.strip()
-
-            # Enfors the use of list notation rather than mixing notation
-            item = item.replace(':', ';') 
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on ;
-                perovskites = layer.split(';')
-
-                for j, perovskite in enumerate(perovskites):
-                    # Enforse proper formating
-                    perovskites[j] = perovskiteLongFormFormating(perovskite)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[i] = "; ".join(perovskites)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-
-            compositionList.append(item)
-        except:
-            compositionList.append('')
-            print(f'Cound not read in perovskiteShortForm on line: {j}')
-
-    return compositionList
+    # For each layer, there may be several perovskites separted by ;
+    # Enfors the use of list notation rather than mixing notation
+    return normalize(userData, perovskiteLongFormFormating, separators = (layers, lists), replacements = ((':', ';'),), errorValue = '')
 
 def perovskiteLongFormFormating(perovskite):
     ''' Check perovskite againast known formating variations 
@@ -2065,42 +1506,9 @@ def PerovskitePrecursorState(userData):
 def perovskiteShortForm(userData):
     '''Format the peroskite short form '''
     # For each item, there may be several layers separated by |
-    # For each layer, there may be several perovskite mixed with each other separated by ;
-    compositionList = []
-    for item in userData:
-        try:
-            # Enforce input as a string 
-            item = str(item)
-
-            # Remove starting and ending blank spaces
-            item = item.strip()
-
-            # Enfors the use of list notation rather than mixing notation
-            item = item.replace(':', ';') 
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on ;
-                perovskites = layer.split(';')
-
-                for j, perovskite in enumerate(perovskites):
-                    # Enforse proper formating
-                    perovskites[j] = perovskiteShortFormFormating(perovskite)
-                
-                # Concatenate additives for each layer with proper spacing
-                layers[i] = "; ".join(perovskites)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-
-            compositionList.append(item)
-        except:
-            compositionList.append('')
-            print(f'Cound not read in perovskiteShortForm on line: {j}')
-
-    return compositionList
+    # For each layer, there may be several perovskites separted by ;
+    # Enfors the use of list notation rather than mixing notation
+    return normalize(userData, perovskiteShortFormFormating, separators = (layers, lists), replacements = ((':', ';'),), errorValue = '')
 
 def perovskiteShortFormFormating(perovskite):
     ''' Check perovskite againast known formating variations 
@@ -2200,55 +1608,11 @@ def preconditioningProtocoll(userData):
     return protocoll
 
 def pressure(userData):
-    # list of pressures    
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
     # For each deposition proceadures, there may be several pressures separted by ;
-    environment = []
-
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Change from notation of mixtures to notation of lists
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    gases = depositionStep.split(';')
-
-                    for k, gas in enumerate(gases):
-                        # Enforse proper formating
-                        gases[k] = pressureFormating(gas)
-
-                    depositionSteps[j] = '; '.join(gases)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-
-            environment.append(item)
-        except:
-            print(f'faild to extract pressure of {item} on row {i}')
-            environment.append(item)
-
-    return environment
+    # Enforse the use of decimal point and the notation of lists
+    return normalize(userData, pressureFormating, separators = (layers, steps, lists), replacements = ((',', '.'), (':', ';')))
 
 def pressureFormating(pressure):
     ''' Check amounts againast known formating variations 
@@ -2296,64 +1660,19 @@ def purity(userData):
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
     # For each deposition proceadures, there may be several solvents/chemicals separted by ;
-    supplierList = []
-
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Change from notation of mixtures to notation of lists
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    purities = depositionStep.split(';')
-
-                    for k, purity in enumerate(purities):
-                        # Enforse proper formating
-                        purities[k] = purityFormating(purity)
-
-                    depositionSteps[j] = '; '.join(purities)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            supplierList.append(item)
-        except:
-            print(f'faild to extract supplier of {item} on row {i}')
-            supplierList.append(item)
+    # Change from notation of mixtures to notation of lists
+    return normalize(userData, purityVocabulary, separators = (layers, steps, lists), replacements = ((':', ';'),))
 
-    return supplierList
+# Standard formating of purities, and the lower case formating variations that are converted to it
+purityVocabulary = {
+    'Unknown' : ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan'],
+    }
 
 def purityFormating(purity):
     ''' Check suppliers againast known formating variations 
     and return the standard formating for the supplier'''
 
-    # Remove starting and ending blank spaces
-    purity = purity.strip()
-
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in atmosphereFormating')
-  
-    elif purity.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        purity = 'Unknown'
-
-    return purity
+    return normalizeToken(purity, purityVocabulary)
 
 def quenchingMedia(userData):
     '''Format the description of the quenching media'''
@@ -2476,56 +1795,16 @@ def relativeHumidity(userData):
     '''List of relative humidity '''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several humidites separted by ;
-    environment = []
+    # For each deposition proceadures, there may be several humidities separted by ;
+    # Enforse the use of decimal point
+    return normalize(userData, relativeHumidityFormating, separators = (layers, steps, lists), replacements = ((',', '.'),))
 
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
+def relativeHumidityFormating(humidity):
+    ''' Check relative humidity againast known formating variations 
+    and return the standard formating for the atmosphere '''
 
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    humidities = depositionStep.split(';')
-
-                    for k, humidity in enumerate(humidities):
-                        # Enforse proper formating
-                        humidities[k] = relativeHumidityFormating(humidity)
-
-                    depositionSteps[j] = '; '.join(humidities)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-
-            environment.append(item)
-        except:
-            print(f'faild to extract relativeHumidity of {item} on row {i}')
-            environment.append(item)
-
-    return environment
-
-def relativeHumidityFormating(humidity):
-    ''' Check relative humidity againast known formating variations 
-    and return the standard formating for the atmosphere '''
-
-    # Remove unit
-    humidity = humidity.replace("%","")
+    # Remove unit
+    humidity = humidity.replace("%","")
 
     # Remove starting and ending blank spaces
     humidity = humidity.strip()
@@ -2586,168 +1865,60 @@ def solvents(userData):
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
     # For each deposition proceadures, there may be several solvents in the solution separted by ;
-    reactionSolutions = []
-
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Change from notation of mixtures to notation of lists
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    solvents = depositionStep.split(';')
-
-                    for k, solvent in enumerate(solvents):
-                        # Enforse proper formating
-                        solvents[k] = solventFormating(solvent)
-
-                    depositionSteps[j] = '; '.join(solvents)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            reactionSolutions.append(item)
-        except:
-            print(f'faild to extract solvents of {item} on row {i}')
-            reactionSolutions.append(item)
-
-    return reactionSolutions
+    # Change from notation of mixtures to notation of lists
+    return normalize(userData, solventVocabulary, separators = (layers, steps, lists), replacements = ((':', ';'),))
+
+# Standard formating of solvents, and the lower case formating variations that are converted to it
+solventVocabulary = {
+    'Unknown' : ['', 'unknown', 'nan', 'na', '-', 'np.nan'],
+    '2-methoxyethanol' : ['2-methoxyethanol', '2-me'],
+    'acetonitrile' : ['acn', 'acetonitrile'],
+    'Anisole' : ['anisole', 'methoxybenzene', 'methyl phenoxide'],
+    'Antisolvent' : ['antisolvent', 'nonhalogenated antisolvent', 'nonpolar solvent scouring', 'polar solvent'],
+    '2-Butanol' : ['2-buthanol', 'sba', 'sec butyl alcohol', 'sec-butyl alcohol'],
+    'Butyl acetate' : ['butyl acetate'],
+    'Chlorobenzene' : ['anhydrous chlorobenzene', 'cb', 'cbz', 'chloro benzene', 'chlorobenze', 'chlorobenzene', 'chlorobenzenene', 'chlorobenzenenez', 'cholorobenzene', 'clorobenzene'],
+    'Chloroform' : ['chloroform', 'chloroform-d'],
+    'Dichloromethane' : ['dcm', 'dichloromethane'],
+    'Dichlorobenzene' : ['dichlorobenzene'],
+    'Diethyl ether' : ['anhydrous diethyl ether', 'de', 'dee', 'dieathyl  ether', 'diethyl ether', 'diethylether', 'ethoxyethane'],
+    'Diphenyl ether' : ['diphenylether'],
+    'DMF' : ['(ch3)2nc(o)h', 'dimethylformamide', 'dimetylformamid', 'dmf', 'n,n-dimethylformamide'],
+    'DMSO' : ['(ch3)2so', 'dimethyl sulfoxide', 'dimethylsulfoxide', 'dmso'],
+    'Ether' : ['anhydrous ether', 'ether'],
+    'Ethanol' : ['ethanol', 'etoh'],
+    'Ethyl acetate' : ['ea', 'ethyl acetate', 'ethylacetate', 'ethylene acetate'],
+    'Ethyl ether' : ['eth', 'ethyl ether'],
+    'GBL' : ['butyrolactetone', 'butyrolactone', 'gamma-butyrolactone', 'gamma-gbl', 'gbl', 'γ-butyrolactone', 'γ-gbl'],
+    'IPA' : ['2-propanol', 'ipa', 'iso-propanol', 'isopropanol', 'isopropylalcohol'],
+    'Methanol' : ['methanol', 'meoh'],
+    'Methyl acetate' : ['methyl acetate'],
+    'Methylamine' : ['methylamine'],
+    'NMP' : ['n-methylpyrrolidone', 'nmp', 'n‐methyl‐2‐pyrrolidinone'],
+    'none' : ['non', 'none'],
+    'Octane' : ['octane'],
+    'PEI' : ['pei', 'polyethylenimine'],
+    'Propyl acetate' : ['propyl acetate'],
+    'Tetrachloroethane' : ['tetrachloroethane'],
+    'Tetraethyl orthosilicate' : ['tetraethyl orthosilicate'],
+    'Tetrafluorotoluene' : ['tetrafluorotoluene'],
+    'Trifluorotoluene' : ['α, α, α-trifluorotoluene', 'trifluorotoluene'],
+    'Toluene' : ['anhydrous toulene', 'methylbenzene', 'toluene', 'tolune', 'toulene'],
+    'Ar' : ['argon', 'ar'],
+    'Dry air' : ['dry air', 'dry-air'],
+    'Flash infrared annealling' : ['fira', 'flash infrared annealling (fira)', 'flash infrared annealling'],
+    'Gas' : ['gas', 'gas blowing', 'gas quench', 'gas-assisted'],
+    'Hot air' : ['hot air'],
+    'N2' : ['n2', 'n2 blowing', 'n2-gas', 'nitrogen'],
+    'Vacuum' : ['vacuum'],
+    }
 
 def solventFormating(solvent):
     ''' Check solvent againast known formating variations 
     and return the standard formating for the solvent 
     Inculdes special cases for gas based antisolvents'''
 
-    # Remove starting and ending blank spaces
-    solvent = solvent.strip()
-
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in atmosphereFormating')
-  
-    elif solvent.lower() in  ['', 'unknown', 'nan', 'na', '-', 'np.nan']:
-        formatedSolvent = 'Unknown'
-
-    elif solvent.lower() in ['2-methoxyethanol', '2-me']:
-        formatedSolvent = '2-methoxyethanol'
-
-    elif solvent.lower() in ['acn', 'acetonitrile']:
-        formatedSolvent = 'acetonitrile'
-    elif solvent.lower() in ['anisole', 'methoxybenzene', 'methyl phenoxide']:
-        formatedSolvent = 'Anisole'
-    elif solvent.lower() in ['antisolvent', 'nonhalogenated antisolvent', 'nonpolar solvent scouring', 'polar solvent']:
-        formatedSolvent = 'Antisolvent'
-
-    elif solvent.lower() in ['2-buthanol', 'sba', 'sec butyl alcohol', 'sec-butyl alcohol']:
-        formatedSolvent = '2-Butanol'
-    elif solvent.lower() in ['butyl acetate']:
-        formatedSolvent = 'Butyl acetate'
-
-    elif solvent.lower() in ['anhydrous chlorobenzene', 'cb', 'cbz', 'chloro benzene', 'chlorobenze', 'chlorobenzene', 'chlorobenzenene', 'chlorobenzenene', 'chlorobenzenenez', 'cholorobenzene', 'clorobenzene']:
-        formatedSolvent = 'Chlorobenzene'
-    elif solvent.lower() in ['chloroform', 'chloroform-d']:
-        formatedSolvent = 'Chloroform'
-
-    elif solvent.lower() in ['dcm', 'dichloromethane']:
-        formatedSolvent = 'Dichloromethane'
-    elif solvent.lower() in ['dichlorobenzene']:
-        formatedSolvent = 'Dichlorobenzene'
-    elif solvent.lower() in ['anhydrous diethyl ether', 'anhydrous diethyl ether', 'de', 'dee', 'dieathyl  ether', 'diethyl ether', 'diethylether', 'ethoxyethane']:
-        formatedSolvent = 'Diethyl ether'
-    elif solvent.lower() in ['diphenylether']:
-        formatedSolvent = 'Diphenyl ether'
-    elif solvent.lower() in ['(ch3)2nc(o)h', 'dimethylformamide', 'dimetylformamid', 'dmf', 'n,n-dimethylformamide']:
-        formatedSolvent = 'DMF'
-    elif solvent.lower() in ['(ch3)2so', 'dimethyl sulfoxide', 'dimethylsulfoxide', 'dmso']:
-        formatedSolvent = 'DMSO'
-
-    elif solvent.lower() in ['anhydrous ether', 'ether']:
-        formatedSolvent = 'Ether'
-    elif solvent.lower() in ['ethanol', 'etoh']:
-        formatedSolvent = 'Ethanol'
-    elif solvent.lower() in ['ea', 'ethyl acetate', 'ethylacetate', 'ethylacetate', 'ethylene acetate']:
-        formatedSolvent = 'Ethyl acetate'
-    elif solvent.lower() in ['eth', 'ethyl ether']:
-        formatedSolvent = 'Ethyl ether'
-
-    elif solvent.lower() in ['butyrolactetone', 'butyrolactone', 'gamma-butyrolactone', 'gamma-gbl', 'gbl', 'γ-butyrolactone', 'γ-gbl']:
-        formatedSolvent = 'GBL'
-
-    elif solvent.lower() in ['2-propanol', 'ipa', 'iso-propanol', 'isopropanol', 'isopropylalcohol']:
-        formatedSolvent = 'IPA'
-
-    elif solvent.lower() in ['methanol', 'meoh']:
-        formatedSolvent = 'Methanol'
-    elif solvent.lower() in ['methyl acetate']:
-        formatedSolvent = 'Methyl acetate'
-    elif solvent.lower() in ['methylamine']:
-        formatedSolvent = 'Methylamine'
-
-    elif solvent.lower() in ['n-methylpyrrolidone', 'nmp', 'n‐methyl‐2‐pyrrolidinone']:
-        formatedSolvent = 'NMP'
-
-    elif solvent.lower() in ['non', 'none']:
-        formatedSolvent = 'none'
-        
-    elif solvent.lower() in ['octane']:
-        formatedSolvent = 'Octane'
-
-    elif solvent.lower() in ['pei', 'polyethylenimine']:
-        formatedSolvent = 'PEI'
-    elif solvent.lower() in ['propyl acetate']:
-        formatedSolvent = 'Propyl acetate'
-
-    elif solvent.lower() in ['tetrachloroethane']:
-        formatedSolvent = 'Tetrachloroethane'
-    elif solvent.lower() in ['tetraethyl orthosilicate']:
-        formatedSolvent = 'Tetraethyl orthosilicate'
-    elif solvent.lower() in ['tetrafluorotoluene']:
-        formatedSolvent = 'Tetrafluorotoluene'
-    elif solvent.lower() in ['α, α, α-trifluorotoluene', 'trifluorotoluene']:
-        formatedSolvent = 'Trifluorotoluene'
-    elif solvent.lower() in ['anhydrous toulene', 'methylbenzene', 'toluene', 'tolune', 'toulene']:
-        formatedSolvent = 'Toluene'
-
-    elif solvent.lower() in  ['unknown']:
-        formatedSolvent = 'Unknown'
-
-    # Special cases for non solvent based antisolvet treatments
-    elif solvent.lower() in ['argon', 'ar']:
-        formatedSolvent = 'Ar'
-    elif solvent.lower() in ['dry air', 'dry-air']:
-        formatedSolvent = 'Dry air'
-    elif solvent.lower() in ['fira', 'flash infrared annealling (fira)', 'flash infrared annealling']:
-        formatedSolvent = 'Flash infrared annealling'
-    elif solvent.lower() in ['gas', 'gas blowing', 'gas quench', 'gas-assisted']:
-        formatedSolvent = 'Gas'
-    elif solvent.lower() in ['hot air']:
-        formatedSolvent = 'Hot air'
-    elif solvent.lower() in ['n2', 'n2 blowing', 'n2-gas', 'nitrogen']:
-        formatedSolvent = 'N2'
-    elif solvent.lower() in ['vacuum']:
-        formatedSolvent = 'Vacuum'
-
-    # If no known formating variations
-    else: 
-        formatedSolvent = solvent
-
-    return formatedSolvent
+    return normalizeToken(solvent, solventVocabulary)
 
 def solventsOld(userData):
     ''' Format the solvents description'''
@@ -2829,47 +2000,98 @@ def stackSequence(userData):
     # For each item, there may be several layers separated by |
     # For each layer, there may be several elements separted by ;
     # For each element there could be a mixtures of materials separated by a : 
-    stack = []
-    
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on ;
-                elements = layer.split(';')
-
-                for j, element in enumerate(elements):
-                    # Split on :
-                    materials = element.split(':')
-
-                    for k, material in enumerate(materials):
-                        # Enforse proper formating
-                        materials[k] = stackSequenceFormating(material)
-
-                   # Concatenate all parts with proper spacing
-                    elements[j] = ':'.join(materials)
-
-               # Concatenate all parts with proper spacing
-                layers[i] = '; '.join(elements)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            stack.append(item)
-
-        except:
-            print(f'faild to extract stackSequence of {item} on row {i}')
-            stack.append(item)
-
-    return stack
+    return normalize(userData, stackSequenceFormating, separators = (layers, lists, mixtures))
+
+# Standard formating of stack elements, and the lower case formating variations that are converted to it
+stackSequenceVocabulary = {
+    'Unknown' : ['', 'unknown', 'nan', 'na', '-', 'np.nan'],
+    'Ag-np' : ['ag np', 'ag-np', 'ag nps', 'ag-nps'],
+    'Ag-nw' : ['ag - nws', 'ag nano wires', 'ag nanowires', 'ag nw', 'ag nws', 'ag-nanowire', 'ag-nanowires', 'ag-nr', 'ag-nw', 'agnr', 'agnw', 'agnws'],
+    'Al2O3-mp' : ['al2o3-m', 'al2o3-ms', 'm-al2o3', 'mp-al2o3', 'm-alo2'],
+    'A.R.C.' : ['a.r.c.', 'arc', 'a.r.c'],
+    'Au-np' : ['au np', 'au nps', 'au-np', 'au-nps'],
+    'AZO' : ['azo', 'al:zno', 'zno:al'],
+    'AZO-np' : ['al:zno np', 'al:zno-np', 'azo-np', 'azo np', 'azo nanoparticles', 'zno:al np', 'zno:al-np'],
+    'Barrier foil' : ['barrier foil'],
+    'BCP' : ['bathocuproine', 'bcp'],
+    'bis-C60' : ['bis-c60'],
+    'Bphen' : ['bphen'],
+    'BSO-mp' : ['mp-bso'],
+    'C60' : ['c60'],
+    'Carbon' : ['c', 'carbon', 'carbon electrode'],
+    'Carbon-mp' : ['c-mp', 'carbon-mp'],
+    'Carbon-nt' : ['c nanotube', 'c-nanotube', 'c-nt', 'carbon nanotube', 'carbon-nanotube', 'carbon-nt', 'cnt'],
+    'Carbon-QDs' : ['c qds', 'c-qds', 'carbon-qds', 'cqds'],
+    'Cover glass-QDs' : ['cover glass'],
+    'Cu:NiO' : ['cu:niox'],
+    'Epoxy' : ['epoxy'],
+    'Epoxy resin' : ['epoxy resin'],
+    'ETM' : ['etl', 'etm'],
+    'FTO' : ['fto', 'f:sno2'],
+    'Glass' : ['glas'],
+    'Graphene' : ['graphene'],
+    'Graphene oxide' : ['graphene oxide', 'go'],
+    'Graphene-ns' : ['gns'],
+    'Graphite' : ['graphite'],
+    'HTM' : ['htl', 'htm'],
+    'ITO' : ['ito', 'in:sno2'],
+    'Metal' : ['metal', 'metall'],
+    'MWCNTs' : ['mwcnt', 'mwcnts'],
+    'N-Graphene-ns' : ['ngns'],
+    'NiO' : ['nio', 'niox'],
+    'NiO-c' : ['nio-c', 'niox-c'],
+    'NiO-np' : ['nio np', 'nio-np', 'nionp', 'niox -np', 'niox np', 'niox-nc', 'niox-np'],
+    'NiO-mp' : ['nio-mp', 'niox-m', 'niox-mp'],
+    'none' : ['non', 'none'],
+    'PbS-QDs' : ['pbs qds'],
+    'PCBM-60' : ['pc60bm', 'pc61bm', 'pcbm', 'pcbm-60', 'pcbm-61', 'pcbm-c60', 'pcbm-c61', 'pcbm60', 'pcbm61'],
+    'PCBM-70' : ['pc70bm', 'pc71bm', 'pcb71m', 'pcbm-70', 'pcbm-71', 'pcbm-c70', 'pcbm-c71', 'pcbm70', 'pcbm71'],
+    'PEDOT' : ['pedot'],
+    'PEDOT:PSS' : ['pedot:pss', 'pedot : pss', 'pedot-pss'],
+    'PEI' : ['pei', 'polyetherimide'],
+    'PEG' : ['peg'],
+    'PEN | ITO' : ['ito-pen'],
+    'PET' : ['pet'],
+    'Perovskite' : ['perovksite', 'perovskite', 'perovskites', 'pervoskite', 'prevskite', 'provskite', 'psk'],
+    'Polymer' : ['polymer'],
+    'PolyTPD' : ['poly-tpd', 'polytpd'],
+    'PTAA' : ['poly(triaryl amine)', 'poly(triarylamine)', 'poly[bis(4-phenyl)(2,4,6-trimethylphenyl)amine]]', 'polytriaryl amine', 'polytriarylamine', 'ptaa'],
+    'PSS' : ['pss'],
+    'Quartz' : ['fused quartz', 'fused silica', 'quartz', 'quartz glass'],
+    'rGO' : ['r-go', 'rgo'],
+    'Rhodamine 101' : ['rhodamine101', 'rhodamine 101', 'rhb101'],
+    'Si-nw' : ['si-nanorods', 'si-nr', 'si-nw'],
+    'SLG' : ['glass', 'ngo', 'ngo10', 'pilkington', 'sgl', 'slf', 'slg', 'tec'],
+    'SnO2' : ['sno2', 'snox'],
+    'SnO2-c' : ['c-sno2', 'sno2-bl', 'sno2-c'],
+    'SnO2-mp' : ['m-sno2', 'mp-sno2', 'sno2 m', 'sno2 mp', 'sno2-m', 'sno2-mp'],
+    'SnO2-np' : ['np-sno2', 'sno2 -np', 'sno2 np', 'sno2-ncs', 'sno2-np'],
+    'SnO2-nw' : ['sno2 nanorods', 'sno2 nanowires', 'sno2-nanorods', 'sno2-nanowires', 'sno2-nr', 'sno2-nw'],
+    'SnO2-QDs' : ['sno2-qd', 'sno2-qds'],
+    'Spiro-MeOTAD' : ['spiiro', 'spiro', 'spiro ometad', 'spiro-meotad', 'spiro-ometad', 'spiromeotad', 'spirometad', 'spiroometad', 'spiro‐meotad', 'spiro‐ometad', 'sprio', 'sprio-ometad'],
+    'SrTiO3' : ['srtio3', 'srxti1-xo3'],
+    'Surlyn' : ['surlyn'],
+    'SWCNTs' : ['sw-c-nt', 'swcnt', 'swcnts', 'swnts'],
+    'Ti-foil' : ['ti foil', 'ti-foil'],
+    'TiO2' : ['tio2', 'tio2x', 'tiox'],
+    'TiO2-c' : ['bk-tio2', 'bl-tio2', 'c tio2', 'c-tio', 'c-tio2', 'cp-tio2', 'ctio', 'ctio2', 'd-tio2', 'tio-c', 'tio2 - c', 'tio2 -c', 'tio2-b', 'tio2-bl', 'tio2-c', 'tio2-cp', 'tio2c', 'tiox-c'],
+    'TiO2-mp' : ['tio2-mp', 'tio2- mp', 'tio2 - mp', 'm-tio2', 'mp-tio2', 'ml-tio2', 'tio2 nps', 'tio2-m', 'tio2mp', 'tio2 mp', 'tio2 -m', 'meso-tio2', 'tio2 nanoporous', 'tio2 meso', 'tio2 m', 'm- tio2', 'mtio2'],
+    'TiO2-IO' : ['tio2-io', 'tio2 invers opal'],
+    'TiO2-nanofibres' : ['tio2 nfs', 'tio2-nfs', 'tio2-nanofibres'],
+    'TiO2-np' : ['np- tio2', 'np-tio2', 'tio2 nanocrystals', 'tio2 nanoparticles', 'tio2-nanoparticles', 'tio2 np', 'tio2-np', 'tio2-nps'],
+    'TiO2-ns' : ['tio2 nanosheet', 'tio2 nanosheets', 'tio2-nanosheet', 'tio2-nanosheets', 'tio2-ns'],
+    'TiO2-nt' : ['nt-tio2', 'tio2 nanotube', 'tio2 nanotubes', 'tio2-nanotube', 'tio2-nanotubes', 'tio2-nt'],
+    'TiO2-nw' : ['nanorods-tio2', 'tio2 nanorod', 'tio2 nanorod array', 'tio2 nanorod arrays', 'tio2 nanorods', 'tio2 nanowires', 'tio2 nr', 'tio2 nrs', 'tio2 nws', 'tio2-na', 'tio2-nanocolumns', 'tio2-nanorod', 'tio2-nanorods', 'tio2-nanowire', 'tio2-nanowires', 'tio2-nr', 'tio2-nrs', 'tio2-nws'],
+    'Zn2SnO4-mp' : ['mp-zn2sno4', 'zn2sno4-mp'],
+    'ZnO' : ['zno'],
+    'ZnO-c' : ['c-zno', 'zno-c'],
+    'ZnO-np' : ['npzno', 'zno np', 'zno nps', 'zno-np', 'zno-nps'],
+    'ZnO-nw' : ['nr- zno', 'nr-zno', 'zno nanorod', 'zno nanorods', 'zno nanowire', 'zno nanowires', 'zno nr', 'zno nrs', 'zno-nanorod', 'zno-nanorods', 'zno-nanowires', 'zno-nr', 'zno-nrs'],
+    'ZnO-QDs' : ['zno qd', 'zno qds', 'zno-qd', 'zno-qds'],
+    'ZrO2-mp' : ['m-zro2', 'zro-mp', 'zro2-mp'],
+    'Willow glass' : ['willow glass', 'corning willow glass', 'wg'],
+    'WOx' : ['wox'],
+    }
 
 def stackSequenceFormating(stackElement):
     ''' Check stack element againast known formating variations 
@@ -2884,244 +2106,12 @@ def stackSequenceFormating(stackElement):
     stackElement = stackElement.replace(": ",":")
     stackElement = stackElement.replace(" NPs","-np")
 
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in stackElementFormating')
-  
-    elif stackElement.lower() in  ['', 'unknown', 'nan', 'na', '-', 'np.nan']:
-        formatedStackElement = 'Unknown'
-
-    elif stackElement.lower() in ['ag np', 'ag-np', 'ag nps', 'ag-nps']:
-        formatedStackElement = 'Ag-np'
-    elif stackElement.lower() in ['ag - nws', 'ag nano wires', 'ag nanowires', 'ag nw', 'ag nws', 'ag-nanowire', 'ag-nanowires', 'ag-nr', 'ag-nw', 'agnr', 'agnw', 'agnws']:
-        formatedStackElement = 'Ag-nw'
-    elif stackElement.lower() in ['al2o3-m', 'al2o3-ms', 'm-al2o3', 'mp-al2o3', 'm-alo2']:
-        formatedStackElement = 'Al2O3-mp'
-    elif stackElement.lower() in ['a.r.c.', 'arc', 'a.r.c']:
-        formatedStackElement = 'A.R.C.'
-    elif stackElement.lower() in ['au np', 'au nps', 'au-np', 'au-nps']:
-        formatedStackElement = 'Au-np'
-    elif stackElement.lower() in ['azo', 'al:zno', 'zno:al']:
-        formatedStackElement = 'AZO'
-    elif stackElement.lower() in ['al:zno np', 'al:zno-np', 'azo-np', 'azo np', 'azo nanoparticles', 'zno:al np', 'zno:al-np']:
-        formatedStackElement = 'AZO-np'
-
-    elif stackElement.lower() in ['barrier foil']:
-        formatedStackElement = 'Barrier foil' 
-    elif stackElement.lower() in ['bathocuproine', 'bcp']:
-        formatedStackElement = 'BCP' 
-    elif stackElement.lower() in ['bis-c60']:
-        formatedStackElement = 'bis-C60'
-    elif stackElement.lower() in ['bphen']:
-        formatedStackElement = 'Bphen'          
-    elif stackElement.lower() in ['mp-bso']:
-        formatedStackElement = 'BSO-mp'   
- 
-    elif stackElement.lower() in ['c60']:
-        formatedStackElement = 'C60'        
-    elif stackElement.lower() in ['c', 'carbon' ,'carbon electrode']:
-        formatedStackElement = 'Carbon'  
-    elif stackElement.lower() in ['c-mp', 'carbon-mp']:
-        formatedStackElement = 'Carbon-mp' 
-    elif stackElement.lower() in ['c nanotube', 'c-nanotube', 'c-nt', 'carbon nanotube', 'carbon-nanotube', 'carbon-nt', 'cnt']: 
-        formatedStackElement = 'Carbon-nt' 
-    elif stackElement.lower() in ['c qds', 'c-qds', 'carbon-qds', 'cqds']:
-        formatedStackElement = 'Carbon-QDs'
-    elif stackElement.lower() in ['cover glass']:
-        formatedStackElement = 'Cover glass-QDs'
-    elif stackElement.lower() in ['cu:niox']:
-        formatedStackElement = 'Cu:NiO' 
-
-    elif stackElement.lower() in ['epoxy']:
-        formatedStackElement = 'Epoxy' 
-    elif stackElement.lower() in ['epoxy resin']:
-        formatedStackElement = 'Epoxy resin' 
-    elif stackElement.lower() in ['etl', 'etm']:
-        formatedStackElement = 'ETM' 
-
-    elif stackElement.lower() in ['fto', 'f:sno2']:
-        formatedStackElement = 'FTO' 
-
-    elif stackElement.lower() in ['glas']:
-        formatedStackElement = 'Glass' 
-    elif stackElement.lower() in ['graphene']:
-        formatedStackElement = 'Graphene' 
-    elif stackElement.lower() in ['graphene oxide', 'go']:
-        formatedStackElement = 'Graphene oxide'
-    elif stackElement.lower() in ['gns']:
-        formatedStackElement = 'Graphene-ns' 
-    elif stackElement.lower() in ['graphite']:
-        formatedStackElement = 'Graphite' 
-
-    elif stackElement.lower() in ['htl', 'htm']:
-        formatedStackElement = 'HTM' 
-
-    elif stackElement.lower() in ['ito', 'in:sno2']:
-        formatedStackElement = 'ITO' 
-
-    elif stackElement.lower() in ['metal', 'metall']:
-        formatedStackElement = 'Metal' 
-    elif stackElement.lower() in ['mwcnt', 'mwcnts']:
-        formatedStackElement = 'MWCNTs' 
-
-    elif stackElement.lower() in ['ngns']:
-        formatedStackElement = 'N-Graphene-ns' 
-    elif stackElement.lower() in ['nio', 'niox']:
-        formatedStackElement = 'NiO' 
-    elif stackElement.lower() in ['nio-c', 'niox-c']:
-        formatedStackElement = 'NiO-c'
-    elif stackElement.lower() in ['nio np', 'nio-np', 'nionp', 'niox -np', 'niox np', 'niox-nc', 'niox-np']:
-        formatedStackElement = 'NiO-np'
-    elif stackElement.lower() in ['nio-mp', 'niox-m', 'niox-mp']:
-        formatedStackElement = 'NiO-mp'
-    elif stackElement.lower() in ['non', 'none']:
-        formatedStackElement = 'none'
-
-    elif stackElement.lower() in ['pbs qds', 'PbS-qd']:
-        formatedStackElement = 'PbS-QDs'
-    elif stackElement.lower() in ['pc60bm', 'pc61bm', 'pcbm', 'pcbm-60', 'pcbm-61', 'pcbm-c60', 'pcbm-c61', 'pcbm60', 'pcbm61']:
-        formatedStackElement = 'PCBM-60' 
-    elif stackElement.lower() in ['pc70bm', 'pc71bm', 'pcb71m', 'pcbm-70', 'pcbm-71', 'pcbm-c70', 'pcbm-c71', 'pcbm70', 'pcbm71']:
-        formatedStackElement = 'PCBM-70'
-    elif stackElement.lower() in ['pedot']:
-        formatedStackElement = 'PEDOT'
-    elif stackElement.lower() in ['pedot:pss', 'pedot : pss', 'pedot-pss']:
-        formatedStackElement = 'PEDOT:PSS'
-    elif stackElement.lower() in ['pei', 'polyetherimide']:
-        formatedStackElement = 'PEI'
-    elif stackElement.lower() in ['peg']:
-        formatedStackElement = 'PEG'
-    elif stackElement.lower() in ['peg']:
-        formatedStackElement = 'PEG'
-    elif stackElement.lower() in ['ito-pen']:
-        formatedStackElement = 'PEN | ITO'
-    elif stackElement.lower() in ['pet']:
-        formatedStackElement = 'PET'
-    elif stackElement.lower() in ['perovksite', 'perovskite', 'perovskites', 'pervoskite', 'prevskite', 'provskite', 'psk']:
-        formatedStackElement = 'Perovskite'
-    elif stackElement.lower() in ['polymer']:
-        formatedStackElement = 'Polymer'
-    elif stackElement.lower() in ['poly-tpd', 'polytpd']:
-        formatedStackElement = 'PolyTPD'
-    elif stackElement.lower() in ['poly(triaryl amine)', 'poly(triarylamine)', 'poly[bis(4-phenyl)(2,4,6-trimethylphenyl)amine]]', 'polytriaryl amine', 'polytriarylamine', 'ptaa',]:
-        formatedStackElement = 'PTAA'
-    elif stackElement.lower() in ['pss']:
-        formatedStackElement = 'PSS'
-
-    elif stackElement.lower() in ['fused quartz', 'fused silica', 'quartz', 'quartz glass']:
-        formatedStackElement = 'Quartz'
-
-    elif stackElement.lower() in ['r-go', 'rgo']:
-        formatedStackElement = 'rGO' 
-    elif stackElement.lower() in ['rhodamine101', 'rhodamine 101', 'rhb101']:
-        formatedStackElement = 'Rhodamine 101'
-
-    elif stackElement.lower() in ['si-nanorods', 'si-nr', 'si-nw']:
-        formatedStackElement = 'Si-nw'
-    elif stackElement.lower() in ['glass', 'ngo', 'ngo10', 'pilkington', 'sgl', 'slf', 'slg', 'tec']:
-        formatedStackElement = 'SLG'
-    elif stackElement.lower() in ['sno2', 'snox']:
-        formatedStackElement = 'SnO2'
-    elif stackElement.lower() in ['c-sno2', 'sno2-bl', 'sno2-c']:
-        formatedStackElement = 'SnO2-c'
-    elif stackElement.lower() in ['m-sno2', 'mp-sno2', 'sno2 m', 'sno2 mp', 'sno2-m', 'sno2-mp']:
-        formatedStackElement = 'SnO2-mp'
-    elif stackElement.lower() in ['np-sno2', 'sno2 -np', 'sno2 np', 'sno2-ncs', 'sno2-np']:
-        formatedStackElement = 'SnO2-np'
-    elif stackElement.lower() in ['sno2 nanorods', 'sno2 nanowires', 'sno2-nanorods', 'sno2-nanowires', 'sno2-nr', 'sno2-nw']:
-        formatedStackElement = 'SnO2-nw'
-    elif stackElement.lower() in ['sno2-qd', 'sno2-qds']:
-        formatedStackElement = 'SnO2-QDs'
-    elif stackElement.lower() in ['spiiro', 'spiro', 'spiro ometad', 'spiro ometad', 'spiro-meotad', 'spiro-ometad', 'spiromeotad', 'spirometad', 'spiroometad', 'spiroometad', 'spiro‐meotad', 'spiro‐ometad', 'sprio', 'sprio-ometad']:
-        formatedStackElement = 'Spiro-MeOTAD'
-    elif stackElement.lower() in ['srtio3', 'srxti1-xo3']:
-        formatedStackElement = 'SrTiO3'
-    elif stackElement.lower() in ['surlyn']:
-        formatedStackElement = 'Surlyn'
-    elif stackElement.lower() in ['sw-c-nt', 'swcnt', 'swcnts', 'swnts']:
-        formatedStackElement = 'SWCNTs'
-
-    elif stackElement.lower() in ['ti foil', 'ti-foil']:
-        formatedStackElement = 'Ti-foil'
-    elif stackElement.lower() in ['tio2', 'tio2x', 'tiox']:
-        formatedStackElement = 'TiO2'
-    elif stackElement.lower() in ['bk-tio2', 'bl-tio2', 'c tio2', 'c-tio', 'c-tio2', 'cp-tio2', 'ctio', 'ctio2', 'd-tio2', 'tio-c', 'tio2 - c', 'tio2 -c', 'tio2-b', 'tio2-bl', 'tio2-c', 'tio2-cp', 'tio2c', 'tiox-c']:
-        formatedStackElement = 'TiO2-c'
-    elif stackElement.lower() in ['tio2-mp', 'tio2- mp', 'tio2 - mp', 'm-tio2', 'mp-tio2', 'ml-tio2', 'tio2 nps', 'tio2-m', 'tio2mp', 'tio2 mp', 'tio2 -m', 'meso-tio2', 'tio2 nanoporous', 'tio2 meso', 'tio2 m', 'm- tio2', 'mtio2']:
-        formatedStackElement = 'TiO2-mp'
-    elif stackElement.lower() in ['tio2-io', 'tio2 invers opal']:
-        formatedStackElement = 'TiO2-IO'
-    elif stackElement.lower() in ['tio2 nfs', 'tio2-nfs', 'tio2-nanofibres']:
-        formatedStackElement = 'TiO2-nanofibres'
-    elif stackElement.lower() in ['np- tio2', 'np-tio2', 'tio2 nanocrystals', 'tio2 nanoparticles', 'tio2-nanoparticles', 'tio2 np', 'tio2-np', 'tio2-nps']:
-        formatedStackElement = 'TiO2-np'
-    elif stackElement.lower() in ['tio2 nanosheet', 'tio2 nanosheets', 'tio2-nanosheet', 'tio2-nanosheets', 'tio2-ns']:
-        formatedStackElement = 'TiO2-ns'
-    elif stackElement.lower() in ['nt-tio2', 'tio2 nanotube', 'tio2 nanotubes', 'tio2-nanotube', 'tio2-nanotubes', 'tio2-nt']:
-        formatedStackElement = 'TiO2-nt'
-    elif stackElement.lower() in ['nanorods-tio2', 'tio2 nanorod', 'tio2 nanorod array', 'tio2 nanorod arrays', 'tio2 nanorods', 'tio2 nanowires', 'tio2 nr', 'tio2 nrs', 'tio2 nws', 'tio2-na', 'tio2-nanocolumns', 'tio2-nanorod', 'tio2-nanorods', 'tio2-nanowire', 'tio2-nanowires', 'tio2-nr', 'tio2-nrs', 'tio2-nws']:
-        formatedStackElement = 'TiO2-nw'
-
-    elif stackElement.lower() in ['mp-zn2sno4', 'zn2sno4-mp']:
-        formatedStackElement = 'Zn2SnO4-mp' 
-    elif stackElement.lower() in ['zno']:
-        formatedStackElement = 'ZnO'
-    elif stackElement.lower() in ['c-zno', 'zno-c']:
-        formatedStackElement = 'ZnO-c'
-    elif stackElement.lower() in ['npzno', 'zno np', 'zno nps', 'zno-np', 'zno-nps']:
-        formatedStackElement = 'ZnO-np'
-    elif stackElement.lower() in ['nr- zno', 'nr-zno', 'zno nanorod', 'zno nanorods', 'zno nanowire', 'zno nanowires', 'zno nr', 'zno nrs', 'zno-nanorod', 'zno-nanorods', 'zno-nanowire ', 'zno-nanowires', 'zno-nr', 'zno-nrs']:
-        formatedStackElement = 'ZnO-nw'
-    elif stackElement.lower() in ['zno qd', 'zno qds', 'zno-qd', 'zno-qds']:
-        formatedStackElement = 'ZnO-QDs'
-    elif stackElement.lower() in ['m-zro2', 'zro-mp', 'zro2-m ', 'zro2-mp']:
-        formatedStackElement = 'ZrO2-mp'
-
-    elif stackElement.lower() in ['willow glass', 'corning willow glass', 'wg']:
-        formatedStackElement = 'Willow glass'
-    elif stackElement.lower() in ['wox']:
-        formatedStackElement = 'WOx'  
-
-    # If no known formating variations
-    else: 
-        formatedStackElement = stackElement
-
-    return formatedStackElement
+    return normalizeToken(stackElement, stackSequenceVocabulary)
 
 def stackSequenceForSealing(userData):
     ''' Format stack sequences '''
-    stack = []
-    for k, item in enumerate(userData):
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-        
-            # Remove startin gand ending blank spaces
-            item = item.strip()
-
-            # Replace nan with emty strings
-            if item.lower() == 'nan':
-                item = ''
-
-            # Split on |
-            itemList = item.split('|')
-
-            for i, stackElement in enumerate(itemList):
-                # Remove blank spaces
-                stackElement = stackElement.strip()
-
-                # Enforse proper formating (based on the variations I have seen)
-                itemList[i] = stackSequenceFormating(stackElement)
-
-            # Concatenate all parts with proper spacing
-            item = " | ".join(itemList)
-
-            stack.append(item)
-        except:
-            stack.append(item)
-            print(f'Could not process stackSequence {item} on line {k}')
-
-    return stack
+    # For each item, there may be several layers separated by |
+    return normalize(userData, stackSequenceFormating, separators = (layers,))
 
 def stringToNumberAndUnit(string):
     '''Takes a string that is suposed to contain a number followed by a unit 
@@ -3156,112 +2146,27 @@ def supplier(userData):
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
     # For each deposition proceadures, there may be several solvents/chemicals separted by ;
-    supplierList = []
-
-    for item in userData:
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-
-            # Remove leading and tailing blank spaces
-            item = item.strip()
+    # Change from notation of mixtures to notation of lists
+    return normalize(userData, supplierVocabulary, separators = (layers, steps, lists), replacements = ((':', ';'),))
 
-            # Change from notation of mixtures to notation of lists
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    suppliers = depositionStep.split(';')
-
-                    for k, supplier in enumerate(suppliers):
-                        # Enforse proper formating
-                        suppliers[k] = supplierFormating(supplier)
-
-                    depositionSteps[j] = '; '.join(suppliers)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            supplierList.append(item)
-        except:
-            print(f'faild to extract supplier of {item} on row {i}')
-            supplierList.append(item)
-
-    return supplierList
+# Standard formating of suppliers, and the lower case formating variations that are converted to it
+supplierVocabulary = {
+    'Unknown' : ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan'],
+    }
 
 def supplierFormating(supplier):
     ''' Check suppliers againast known formating variations 
     and return the standard formating for the supplier'''
 
-    # Remove starting and ending blank spaces
-    supplier = supplier.strip()
-
-    # Go through all known formating variations and convert them to the corect one
-    if False:   # To start the elif cascade
-        Print(f'Problem in elif cascade in atmosphereFormating')
-  
-    elif supplier.lower() in  ['', 'unknown', 'non', 'none', 'nan', 'na', '-', 'np.nan']:
-        supplier = 'Unknown'
-
-    return supplier
+    return normalizeToken(supplier, supplierVocabulary)
 
 def temperature(userData):
     '''Format the volumes'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several compounds in the solution separted by ;
-
-    amounts = []
-    for item in userData:
-        try:
-            # Enforce input is a string 
-            item = str(item)   
-
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Enforse the use of corect separator
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    compounds = depositionStep.split(';')
-
-                    for k, compound in enumerate(compounds):
-                        # Enforse proper formating
-                        compounds[k] = temperatureFormating(compound)
-
-                    depositionSteps[j] = '; '.join(compounds)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            amounts.append(item)
-        except:
-            amounts.append('')
-            print(f'Cound not read in temperature on line: {i}')
-
-    return amounts
+    # For each deposition proceadures, there may be several temperatures separted by ;
+    # Enforse the use of decimal point and the notation of lists
+    return normalize(userData, temperatureFormating, separators = (layers, steps, lists), replacements = ((',', '.'), (':', ';')), errorValue = '', strip = False)
   
 def temperatureFormating(temperature):
     ''' Check volumes againast known formating variations 
@@ -3283,33 +2188,8 @@ def temperatureFormating(temperature):
 def thickness(userData, givenUnit, desiredUnit):
     '''Format Thickesses'''
     # For each item, there may be several layers separated by |
-    thickesses = []
-    for i, item in enumerate(userData):
-        try:
-            # Enforce that input is a string 
-            item = str(item)
-        
-            # Remove blank spaces
-            item = item.strip().replace(" ","")
-
-            # Enfors the use of decimal point
-            item = item.replace(',', '.')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Enforse proper formating
-                layers[i] = thickessesFormating(layer, givenUnit, desiredUnit)
-
-            item = " | ".join(layers)
-             
-            thickesses.append(item)
-        except:
-            print(f'Failed to process: thickesses for {item} on row {i}')
-            thickesses.append(item)
-
-    return thickesses
+    # Remove all blank spaces and enforse the use of decimal point
+    return normalize(userData, thickessesFormating, separators = (layers,), replacements = ((' ', ''), (',', '.')), arguments = (givenUnit, desiredUnit))
 
 def thickness_corection(userData):
     '''Cleaning function used only for coreting data already in the database '''
@@ -3448,48 +2328,8 @@ def time(userData, givenUnit, desiredUnit):
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
     # For each deposition proceadures, there may be several times separted by ;
-
-    amounts = []
-    for item in userData:
-        try:
-            # Enforce input is a string 
-            item = str(item)   
-
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Enforse the use of corect separator
-            item = item.replace(':', ';')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    compounds = depositionStep.split(';')
-
-                    for k, compound in enumerate(compounds):
-                        # Enforse proper formating
-                        compounds[k] = timeFormating(compound, givenUnit, desiredUnit)
-
-                    depositionSteps[j] = '; '.join(compounds)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            amounts.append(item)
-        except:
-            amounts.append('')
-            print(f'Cound not read in volumes on line: {i}')
-
-    return amounts
+    # Enforse the use of decimal point and the notation of lists
+    return normalize(userData, timeFormating, separators = (layers, steps, lists), replacements = ((',', '.'), (':', ';')), arguments = (givenUnit, desiredUnit), errorValue = '')
   
 def timeFormating(time, givenUnit, desiredUnit):
     ''' Check times againast known formating variations 
@@ -3690,46 +2530,9 @@ def volumes(userData, givenUnit, desiredUnit):
     '''Format the volumes'''
     # For each item, there may be several layers separated by |
     # For each layer, there may be several depostion proceadures separatd by >>
-    # For each deposition proceadures, there may be several compounds in the solution separted by ;
-
-    amounts = []
-    for item in userData:
-        try:
-            # Enforce input is a string 
-            item = str(item)   
-
-            # Enforse the use of decimal point
-            item = item.replace(',', '.')
-
-            # Split on |
-            layers = item.split('|')
-
-            for i, layer in enumerate(layers):
-                # Split on >>
-                depositionSteps = layer.split('>>')
-
-                for j, depositionStep in enumerate(depositionSteps):
-                    # Split on ;
-                    compounds = depositionStep.split(';')
-
-                    for k, compound in enumerate(compounds):
-                        # Enforse proper formating
-                        compounds[k] = volumesFormating(compound, givenUnit, desiredUnit)
-
-                    depositionSteps[j] = '; '.join(compounds)
-
-                # Concatenate all parts with proper spacing
-                layers[i] = ' >> '.join(depositionSteps)
-
-            # Concatenate all layers with proper spacing
-            item = " | ".join(layers)
-           
-            amounts.append(item)
-        except:
-            amounts.append('')
-            print(f'Cound not read in volumes on line: {i}')
-
-    return amounts
+    # For each deposition proceadures, there may be several volumes separted by ;
+    # Enforse the use of decimal point
+    return normalize(userData, volumesFormating, separators = (layers, steps, lists), replacements = ((',', '.'),), arguments = (givenUnit, desiredUnit), errorValue = '')
   
 def volumesFormating(volume, givenUnit, desiredUnit):
     ''' Check volumes againast known formating variations 
@@ -17,142 +17,97 @@ import pandas as pd
 #import re
 
 
-def defaultFF(userData):
-    ''' Determin the default FF to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
-    FF = []
-    flag = []
-
-    for i in range(len(userData)): 
+def _numericColumn(userData, column):
+    '''Returns the values on the rows 0, 1, 2, ... of {column} as floats, together with a mask that is False where the value is missing or not numeric,
+    i.e. where looking it up and checking it with np.isnan would fail'''
+    rows = len(userData)
+    if column not in userData.columns:
+        return np.full(rows, np.nan), np.zeros(rows, dtype = bool)
+
+    series = userData[column]
+
+    # The rows are looked up by label. Labels that are missing or not unique can not be read
+    if not series.index.equals(pd.RangeIndex(rows)):
+        series = series[~series.index.duplicated(keep = False)]
+        found = pd.Index(range(rows)).isin(series.index)
+        series = series.reindex(range(rows))
+    else:
+        found = np.ones(rows, dtype = bool)
+
+    if series.dtype.kind in 'biuf':
+        return series.to_numpy(dtype = float), found
+
+    # Mixed data. Check the entries one by one
+    values = np.full(rows, np.nan)
+    numeric = np.zeros(rows, dtype = bool)
+    for i, item in enumerate(series.values):
         try:
-            if np.isnan(userData['JV_reverse_scan_FF'][i]) == False:
-                FF.append(userData['JV_reverse_scan_FF'][i])
-                flag.append('Reversed')
-            elif np.isnan(userData['JV_forward_scan_FF'][i]) == False:
-                FF.append(userData['JV_forward_scan_FF'][i])
-                flag.append('Forward')
-            else:
-                FF.append(np.nan)
-                flag.append(np.nan)
+            np.isnan(item)
+            values[i] = item
+            numeric[i] = True
         except:
-            FF.append(np.nan)
-            flag.append(np.nan)
+            pass
+
+    return values, found & numeric
+
+def defaultJVParameter(userData, columns):
+    '''Returns, for each row, the first value in {columns} that is not nan, and the flag of the column it was taken from.
+    {columns} is a list of (column, flag) in order of priority. Rows where a checked value is not numeric get nan as value and flag'''
+    rows = len(userData)
+    value = np.full(rows, np.nan)
+    flag = np.full(rows, np.nan, dtype = object)
+    undecided = np.ones(rows, dtype = bool)
+
+    for column, columnFlag in columns:
+        values, numeric = _numericColumn(userData, column)
+        undecided &= numeric
+        found = undecided & ~np.isnan(values)
+        value = np.where(found, values, value)
+        flag[found] = columnFlag
+        undecided &= ~found
+
+    return value.tolist(), flag.tolist()
 
-    return FF, flag
+def defaultFF(userData):
+    ''' Determin the default FF to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
+    return defaultJVParameter(userData, [('JV_reverse_scan_FF', 'Reversed'), ('JV_forward_scan_FF', 'Forward')])
 
 def defaultJsc(userData):
     ''' Determin the default Jsc to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
-    Jsc = []
-    flag = []
-
-    for i in range(len(userData)):       
-        # Check if the data template is of a version with stabilised values
-        try:
-            if np.isnan(userData['JV_reverse_scan_Jsc'][i]) == False:
-                Jsc.append(userData['JV_reverse_scan_Jsc'][i])
-                flag.append('Reversed')
-            elif np.isnan(userData['JV_forward_scan_Jsc'][i]) == False:
-                Jsc.append(userData['JV_forward_scan_Jsc'][i])
-                flag.append('Forward')
-            else:
-                Jsc.append(np.nan)
-                flag.append(np.nan)
-        except:
-            Jsc.append(np.nan)
-            flag.append(np.nan)
-        
-    return Jsc, flag
+    return defaultJVParameter(userData, [('JV_reverse_scan_Jsc', 'Reversed'), ('JV_forward_scan_Jsc', 'Forward')])
 
 def defaultVoc(userData):
     ''' Determin the default Voc to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
-    Voc = []
-    flag = []
-
-    for i in range(len(userData)):       
-        # Check if the data template is of a version with stabilised values
-        try:
-            if np.isnan(userData['JV_reverse_scan_Voc'][i]) == False:
-                Voc.append(userData['JV_reverse_scan_Voc'][i])
-                flag.append('Reversed')
-            elif np.isnan(userData['JV_forward_scan_Voc'][i]) == False:
-                Voc.append(userData['JV_forward_scan_Voc'][i])
-                flag.append('Forward')
-            else:
-                Voc.append(np.nan)
-                flag.append(np.nan)
-        except:
-            Voc.append(np.nan)
-            flag.append(np.nan)
-        
-    return Voc, flag
+    return defaultJVParameter(userData, [('JV_reverse_scan_Voc', 'Reversed'), ('JV_forward_scan_Voc', 'Forward')])
 
 def defaultPCE(userData):
     ''' Determin the default PCE to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
-    PCE = []
-    flag = []
-
-    for i in range(len(userData)):       
-        # Check if the data template is of a version with stabilised values
-        try:
-            if np.isnan(userData['Stabilised_performance_PCE'][i]) == False:
-                PCE.append(userData['Stabilised_performance_PCE'][i])
-                flag.append('Stabilised')
-            elif np.isnan(userData['JV_reverse_scan_PCE'][i]) == False:
-                PCE.append(userData['JV_reverse_scan_PCE'][i])
-                flag.append('Reversed')
-            elif np.isnan(userData['JV_forward_scan_PCE'][i]) == False:
-                PCE.append(userData['JV_forward_scan_PCE'][i])
-                flag.append('Forward')
-            else:
-                PCE.append(np.nan)
-                flag.append(np.nan)
-        except:
-            PCE.append(np.nan)
-            flag.append(np.nan)
-        
-    return PCE, flag
+    return defaultJVParameter(userData, [('Stabilised_performance_PCE', 'Stabilised'), ('JV_reverse_scan_PCE', 'Reversed'), ('JV_forward_scan_PCE', 'Forward')])
 
 def hysteresisIndex(userData):
     '''Calculate the hysteresis index
     '''
-    hysteresis = []
-    
-    for i in range(len(userData)):
-        datatemp = []
-        # Gather the IV-data
-        try:
-            datatemp.append(userData['JV_forward_scan_Voc'][i])
-            datatemp.append(userData['JV_reverse_scan_Voc'][i])
-            datatemp.append(userData['JV_forward_scan_Jsc'][i])
-            datatemp.append(userData['JV_reverse_scan_Jsc'][i])
-            datatemp.append(userData['JV_forward_scan_FF'][i])
-            datatemp.append(userData['JV_reverse_scan_FF'][i])
-            datatemp.append(userData['JV_forward_scan_PCE'][i])
-            datatemp.append(userData['JV_reverse_scan_PCE'][i])
+    rows = len(userData)
+    hysteresis = np.ones(rows)
+    complete = np.ones(rows, dtype = bool)
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        for parameter in ['Voc', 'Jsc', 'FF', 'PCE']:
+            forward, forwardNumeric = _numericColumn(userData, f'JV_forward_scan_{parameter}')
+            reverse, reverseNumeric = _numericColumn(userData, f'JV_reverse_scan_{parameter}')
 
             # If not enough data to calculat the hysteresis
-            if np.isnan(datatemp).any() or 0 in datatemp:
-                hysteresis.append(np.nan)
+            complete &= forwardNumeric & reverseNumeric & ~np.isnan(forward) & ~np.isnan(reverse) & (forward != 0) & (reverse != 0)
 
-            # Calcualte the rations for all parameters between the forward and the revers scan
-            else:
-                fractions = []
-                fractions.append(userData['JV_forward_scan_Voc'][i]/userData['JV_reverse_scan_Voc'][i])
-                fractions.append(userData['JV_forward_scan_Jsc'][i]/userData['JV_reverse_scan_Jsc'][i])
-                fractions.append(userData['JV_forward_scan_FF'][i]/userData['JV_reverse_scan_FF'][i])
-                fractions.append(userData['JV_forward_scan_PCE'][i]/userData['JV_reverse_scan_PCE'][i])
-
-                # Enfores that all the elements in the fractions are above 1. i.e. in the form biggest/smallest
-                for i, item in enumerate(fractions):
-                    if item < 1:
-                     fractions[i] = 1/item
-
-                # Calculate a proxy for the hysteresis
-                hysteresis.append(np.cumprod(np.array(fractions))[-1] - 1)
-        except:
-            print(f'Failed to derrive the hysteresis index on row {i}')
-            hysteresis.append(np.nan)
+            # Calcualte the rations between the forward and the revers scan. Enfores that they are above 1. i.e. in the form biggest/smallest
+            fraction = forward/reverse
+            fraction = np.where(fraction < 1, 1/fraction, fraction)
+
+            # Multiplied in the same order as before so that the result is identical
+            hysteresis = hysteresis*fraction
 
-    return hysteresis
+    # Calculate a proxy for the hysteresis
+    return np.where(complete, hysteresis - 1, np.nan).tolist()
 
 def isLeadFree(userData):
     '''Return true every perovskite not containing lead (Pb) '''
@@ -9,80 +9,39 @@
 # =============================================================================
 
 from datetime import datetime
-import os
-import pickle
 
-from crossref.restful import Works, Etiquette
 import numpy as np
 import pandas as pd
 
 import UtilityFunctions.CompleatDataFunctionsV5 as codf
+from UtilityFunctions.crossrefFetcher import fetchCrossrefMetadata
+from UtilityFunctions.doiCache import cachedCitations, extractCitation, openDoiCache, saveCitation
 
 
 def citationData(DOInumbers, defaultDate, defaultAuthor, DOIPath):
     '''Extract citation data from CrossRf based on the DOI number 
-    Stor all downloaded reference data in a pickle file located at DOIPath'''
-
-    #%% Use crossref (https://www.crossref.org/) to extract metadata
-    # Setting up a session at crossref
-    my_etiquette = Etiquette('Perovskite solar', 'version 1', '', 'jacobsson.jesper.work@gmail.com')
-    works = Works()
-    works = Works(etiquette=my_etiquette)
-
+    Stor all downloaded reference data in the cache belonging to DOIPath, see doiCache'''
 
     #%% Download reference data
-     # open a file with previously downloaded reference information if it excist
-    if os.path.exists(DOIPath) == True:
-        Old_DOI_file_excist = True
-        with open(DOIPath, 'rb') as f:
-            DOI_saved = pickle.load(f)
-    else:
-        Old_DOI_file_excist = False
-
-
-    # Define a dataframe to temporaly store all not previously stored reference information
-    DOI_saved_files_temp = pd.DataFrame()
-    DOI_saved_files_temp['DOI'] = []
-    DOI_saved_files_temp['Dict'] = []
-
-    # Download reference data for all DOI not previously downloaded
-    if Old_DOI_file_excist == True:
-        listOfSavedDOI = DOI_saved['DOI'].tolist()
-    else:
-        listOfSavedDOI = []
-    
-    
-    for i, DOI in enumerate(DOInumbers):
-        # Check if metadata already is downloaded
-        if DOI in listOfSavedDOI or DOI in DOI_saved_files_temp['DOI'].tolist() or DOI == "nan":
-            continue
-        else:
-            print(f'Searching for citation data for paper on row {i}') # for keeping track of progress during development
-            # Get the metadata for the paper from Crossref
-            try:
-                paper = works.doi(DOI)
-                
-                if type(paper) == dict:
-                    # Add the data to the temprary dataframe
-                    DOI_saved_files_temp = DOI_saved_files_temp.append({'DOI': DOI, 'Dict': paper}, ignore_index = True)
-                else:
-                    print(f'Failed to download data for: {DOI}')
-                       
-            except:
-                print(f'Failed to download data for: {DOI}')          
-
-    # Add the newly saved reference information to the already saved data
-    if Old_DOI_file_excist == True:
-        DOI_saved = DOI_saved.append(DOI_saved_files_temp, ignore_index = True)
-    else:
-        DOI_saved = DOI_saved_files_temp
-
-    # Save the downloaded reference information
+    # Open the cache with previously downloaded reference information
+    connection = openDoiCache(DOIPath)
     try:
-        with open(DOIPath, 'wb') as f:
-            pickle.dump(DOI_saved, f)
-    except:
-        print(f'Failed to save new DOI data to reference file')
+        citations = cachedCitations(connection, DOInumbers)
+
+        # Download reference data for all DOI not previously downloaded. Use crossref (https://www.crossref.org/) to extract metadata
+        newDOInumbers = [DOI for DOI in dict.fromkeys(DOI for DOI in DOInumbers if isinstance(DOI, str)) if DOI not in citations and DOI != "nan"]
+        if len(newDOInumbers) > 0:
+            print(f'Searching for citation data for {len(newDOInumbers)} papers')
+
+        for DOI, paper, error in fetchCrossrefMetadata(newDOInumbers):
+            if type(paper) == dict:
+                # Append the data to the cache
+                saveCitation(connection, DOI, paper)
+                citations[DOI] = extractCitation(paper)
+            else:
+                print(f'Failed to download data for: {DOI} ({error})')
+    finally:
+        connection.close()
 
     #%% Extract metadata from the reference data
     data = pd.DataFrame()
@@ -90,58 +49,20 @@ def citationData(DOInumbers, defaultDate, defaultAuthor, DOIPath):
     mainauthor = []
     journal = []
 
+    # Todays date is used when the publication date is not known
+    todaysDate = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
+
     for i, DOI in enumerate(DOInumbers):
-        try:
-            # Get the index for where the DOI is stored
-            doiIndex = DOI_saved.index[DOI_saved['DOI'] == DOI].tolist()
-
-            # Retriev the dictionary with the article metadata 
-            MetaData = DOI_saved['Dict'].loc[doiIndex[0]]
-
-            # Datetime when the paper was published
-            try:
-                date = MetaData['created']['date-parts'][0]           
-                # Convert datetime string to datetime format
-                date = datetime.strptime(str(date)[1:-1], '%Y, %m, %d').date()
-            except:
-                #date = pd.to_datetime(defaultDate[i])
-                #date = pd.to_datetime(defaultDate[i].replace(":", "-"))
-                #date = datetime.date(date)
-                date = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-
-            timestamp.append(date)
-
-            # First autor's last name (does not get it right every time)
-            try:
-                if len(MetaData['author']) > 1:
-                    author = MetaData['author'][0]['family'] + ' et al.'
-                else:
-                    author = MetaData['author'][0]['family']
-            except:
-                author = defaultAuthor[i]              
-            mainauthor.append(author)
-
-            # Journal
-            try:
-               journal.append(MetaData['container-title'][0])
-            except:
-               journal.append('-')
-        except:
-
-            try:
-                #date = pd.to_datetime(str(defaultDate[i]))
-                #date = pd.to_datetime(str(defaultDate[i]).replace(":", "-"))
-                #date = datetime.date(date)
-                date = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-            except:
-                # Default date
-                #date = pd.to_datetime(str(2000))
-                date = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-                date = datetime.date(date)
-
-            timestamp.append(date)
-            mainauthor.append(defaultAuthor[i] )
-            journal.append('-')
+        date, author, journalName = citations.get(DOI, (None, None, None)) if isinstance(DOI, str) else (None, None, None)
+
+        # Datetime when the paper was published
+        timestamp.append(todaysDate if date is None else datetime.strptime(date, '%Y-%m-%d').date())
+
+        # First autor's last name
+        mainauthor.append(defaultAuthor[i] if author is None else author)
+
+        # Journal
+        journal.append('-' if journalName is None else journalName)
 
     data['PublicationDate'] = timestamp
     data['FirstAuthor'] = mainauthor
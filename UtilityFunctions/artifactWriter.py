@@ -0,0 +1,62 @@
+# =============================================================================
+# artifactWriter
+# Moduel for saving the intermediate data of an upload (cleaned, derived,
+# citation and compleat data) for tracability. The files can be written in a
+# background thread so that the upload does not wait for the disk and the
+# Excel serialization. One thread writes all files, in the order they were
+# submitted, and each datafram is copied when it is submitted so that later
+# steps in the upload can change it.
+# =============================================================================
+
+#%% Imports
+from concurrent.futures import ThreadPoolExecutor, wait
+import os
+import threading
+
+
+#%% Parameters
+# The thread writing the files, and the files not yet written. One per process
+_writer = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = 'artifactWriter')
+_pendingLock = threading.Lock()
+_pending = []
+
+
+#%% Functions
+def writeDataFrame(data, filePath, description, fileName):
+    '''Save {data} as xlsx or csv depending on the file ending of {filePath}. {description} and {fileName} are used in the messages'''
+    # Extract file ending
+    fileEnding = os.path.splitext(os.path.basename(filePath))[1]
+
+    if fileEnding == '.xlsx':
+        try:
+            data.to_excel(filePath, index = False)
+            print(f'Saved {description} data')
+        except:
+            print(f'Failed to save {description} data based on: {fileName}')
+
+    else:
+        try:
+            data.to_csv(filePath, index = False, encoding='utf-8-sig')
+            print(f'Saved {description} data')
+        except:
+            try:
+                data = data.applymap(lambda x: x.encode('unicode_escape').decode('utf-8') if isinstance(x, str) else x)
+                data.to_csv(filePath, index = False)
+                print(f'Saved {description} data after unicode escape')
+            except:
+                print(f'Failed to save {description} data based on: {fileName}')
+
+def writeDataFrameInBackground(data, filePath, description, fileName):
+    '''Save a copy of {data} with writeDataFrame in the background thread. Returns a future that is done when the file is written'''
+    future = _writer.submit(writeDataFrame, data.copy(), filePath, description, fileName)
+    with _pendingLock:
+        _pending[:] = [item for item in _pending if not item.done()] + [future]
+
+    return future
+
+def waitForBackgroundWrites(timeout = None):
+    '''Wait until all files submitted to the background thread are written'''
+    with _pendingLock:
+        pending = list(_pending)
+
+    wait(pending, timeout = timeout)
@@ -0,0 +1,863 @@
+# =============================================================================
+# benchmarks
+# Moduel for comparing the speed of optimised functions with the versions they
+# replaced. The earlier versions are kept here as references, and each run_*
+# function checks that old and new give the same result before timing them.
+# =============================================================================
+
+#%% Imports
+from datetime import datetime
+import time
+
+import numpy as np
+import pandas as pd
+
+import UtilityFunctions.CleanDataFunctions as cdf
+import UtilityFunctions.CompleatDataFunctionsV5 as codf
+from UtilityFunctions.normalizationEngine import clearNormalizationCaches
+from UtilityFunctions.utilityFunctions import (conectToDatabase,
+    convertNumerListToFloats,
+    dataManipulation,
+    getMaxTemperature,
+    loadDataFromDatabase)
+
+
+#%% Reference implementations
+def convertNumerListToFloats_reference(numberList):
+    '''Convert a numerlist to floats. If more than one value, keep the first one'''
+
+    # Convert data to strings
+    numberList = numberList.astype(str)
+
+    # identify all strings with more than one element, by utlising that they contain the pattern ' | '
+    x = numberList.str.contains(' | ') == True
+
+    # Get a list of the indexes where the abowe condition holds
+    indexlist = list(numberList[x].index)
+
+    # Loop over all instances with more than one number
+    for index in indexlist:
+        # Ensure that entry is a string
+        y = str(numberList[index]).strip()
+
+        # Keep the first entry
+        y = y.split(' | ')[0].strip()
+
+        # Convert number into a float
+        try:
+            number = float(y)
+        except:
+            number = np.nan
+
+        # Uppdate data
+        numberList.loc[index] = number
+
+    # Convert everything to floats
+    numberList = pd.to_numeric(numberList, errors = 'coerce')
+
+    return numberList
+
+def getMaxTemperature_reference(data):
+    '''Take a panadas series with entries as strings in the format 'value1; value2' and returns a list with the highest of the two numbers '''
+
+    # Internal helper function
+    def convertToNumber(x):
+        try:
+            number = float(x)
+        except:
+            number = np.nan
+
+        return number
+
+    maxTemp = []
+    for item in data:
+        # Ensure that data is a string
+        temperaturString = str(item).strip()
+
+        # Separate the entries into a list
+        temperaturListString = temperaturString.split(';')
+
+        T = []
+        for temperature in temperaturListString:
+            # Remove blank spaces
+            temperature = temperature.strip()
+
+            # convert to a number and add to temporary list
+            T.append(convertToNumber(temperature))
+
+        # Append the higest number
+        maxTemp.append(max(T))
+
+    return maxTemp
+
+def dataManipulation_reference(data, numericColumns):
+    '''Do data manipulation required by the app'''
+    # replace Nan with -1 in the columns that may be plotted
+    for column in list(data.columns):
+        if column in numericColumns:
+            data[column] = data[column].fillna(value = -1)
+
+    # Convert the band gap column to numeric values (and keeping the first value if multiple values)
+    if 'Perovskite_band_gap' in list(data.columns):
+        data['Perovskite_band_gap_string'] = data['Perovskite_band_gap']
+        data['Perovskite_band_gap'] = convertNumerListToFloats_reference(data['Perovskite_band_gap'])
+        data['Perovskite_band_gap'] = data['Perovskite_band_gap'].fillna(value = -1)
+
+    # Time data
+    if 'Ref_publication_date' in list(data.columns):
+        data['Ref_publication_date'] = pd.to_datetime(data['Ref_publication_date'], errors="coerce")
+        # Replace corupt values with todays date
+        todays_time = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
+        data['Ref_publication_date'] = data['Ref_publication_date'].fillna(todays_time)
+
+    # Extract the higher temperature in the temperature range
+    for column in ['Outdoor_temperature_range', 'Stability_temperature_range']:
+        if column in list(data.columns):
+            data[column] = getMaxTemperature_reference(data[column])
+
+    return data
+
+def stackSequenceFormating_reference(stackElement):
+    ''' Check stack element againast known formating variations 
+        and return the standard formating for the stack element'''
+
+    # Remove starting and ending blank spaces
+    stackElement = stackElement.strip()
+
+    # In string formating
+    stackElement = stackElement.replace(" : ",":")
+    stackElement = stackElement.replace(" :",":")
+    stackElement = stackElement.replace(": ",":")
+    stackElement = stackElement.replace(" NPs","-np")
+
+    # Go through all known formating variations and convert them to the corect one
+    if False:   # To start the elif cascade
+        Print(f'Problem in elif cascade in stackElementFormating')
+  
+    elif stackElement.lower() in  ['', 'unknown', 'nan', 'na', '-', 'np.nan']:
+        formatedStackElement = 'Unknown'
+
+    elif stackElement.lower() in ['ag np', 'ag-np', 'ag nps', 'ag-nps']:
+        formatedStackElement = 'Ag-np'
+    elif stackElement.lower() in ['ag - nws', 'ag nano wires', 'ag nanowires', 'ag nw', 'ag nws', 'ag-nanowire', 'ag-nanowires', 'ag-nr', 'ag-nw', 'agnr', 'agnw', 'agnws']:
+        formatedStackElement = 'Ag-nw'
+    elif stackElement.lower() in ['al2o3-m', 'al2o3-ms', 'm-al2o3', 'mp-al2o3', 'm-alo2']:
+        formatedStackElement = 'Al2O3-mp'
+    elif stackElement.lower() in ['a.r.c.', 'arc', 'a.r.c']:
+        formatedStackElement = 'A.R.C.'
+    elif stackElement.lower() in ['au np', 'au nps', 'au-np', 'au-nps']:
+        formatedStackElement = 'Au-np'
+    elif stackElement.lower() in ['azo', 'al:zno', 'zno:al']:
+        formatedStackElement = 'AZO'
+    elif stackElement.lower() in ['al:zno np', 'al:zno-np', 'azo-np', 'azo np', 'azo nanoparticles', 'zno:al np', 'zno:al-np']:
+        formatedStackElement = 'AZO-np'
+
+    elif stackElement.lower() in ['barrier foil']:
+        formatedStackElement = 'Barrier foil' 
+    elif stackElement.lower() in ['bathocuproine', 'bcp']:
+        formatedStackElement = 'BCP' 
+    elif stackElement.lower() in ['bis-c60']:
+        formatedStackElement = 'bis-C60'
+    elif stackElement.lower() in ['bphen']:
+        formatedStackElement = 'Bphen'          
+    elif stackElement.lower() in ['mp-bso']:
+        formatedStackElement = 'BSO-mp'   
+ 
+    elif stackElement.lower() in ['c60']:
+        formatedStackElement = 'C60'        
+    elif stackElement.lower() in ['c', 'carbon' ,'carbon electrode']:
+        formatedStackElement = 'Carbon'  
+    elif stackElement.lower() in ['c-mp', 'carbon-mp']:
+        formatedStackElement = 'Carbon-mp' 
+    elif stackElement.lower() in ['c nanotube', 'c-nanotube', 'c-nt', 'carbon nanotube', 'carbon-nanotube', 'carbon-nt', 'cnt']: 
+        formatedStackElement = 'Carbon-nt' 
+    elif stackElement.lower() in ['c qds', 'c-qds', 'carbon-qds', 'cqds']:
+        formatedStackElement = 'Carbon-QDs'
+    elif stackElement.lower() in ['cover glass']:
+        formatedStackElement = 'Cover glass-QDs'
+    elif stackElement.lower() in ['cu:niox']:
+        formatedStackElement = 'Cu:NiO' 
+
+    elif stackElement.lower() in ['epoxy']:
+        formatedStackElement = 'Epoxy' 
+    elif stackElement.lower() in ['epoxy resin']:
+        formatedStackElement = 'Epoxy resin' 
+    elif stackElement.lower() in ['etl', 'etm']:
+        formatedStackElement = 'ETM' 
+
+    elif stackElement.lower() in ['fto', 'f:sno2']:
+        formatedStackElement = 'FTO' 
+
+    elif stackElement.lower() in ['glas']:
+        formatedStackElement = 'Glass' 
+    elif stackElement.lower() in ['graphene']:
+        formatedStackElement = 'Graphene' 
+    elif stackElement.lower() in ['graphene oxide', 'go']:
+        formatedStackElement = 'Graphene oxide'
+    elif stackElement.lower() in ['gns']:
+        formatedStackElement = 'Graphene-ns' 
+    elif stackElement.lower() in ['graphite']:
+        formatedStackElement = 'Graphite' 
+
+    elif stackElement.lower() in ['htl', 'htm']:
+        formatedStackElement = 'HTM' 
+
+    elif stackElement.lower() in ['ito', 'in:sno2']:
+        formatedStackElement = 'ITO' 
+
+    elif stackElement.lower() in ['metal', 'metall']:
+        formatedStackElement = 'Metal' 
+    elif stackElement.lower() in ['mwcnt', 'mwcnts']:
+        formatedStackElement = 'MWCNTs' 
+
+    elif stackElement.lower() in ['ngns']:
+        formatedStackElement = 'N-Graphene-ns' 
+    elif stackElement.lower() in ['nio', 'niox']:
+        formatedStackElement = 'NiO' 
+    elif stackElement.lower() in ['nio-c', 'niox-c']:
+        formatedStackElement = 'NiO-c'
+    elif stackElement.lower() in ['nio np', 'nio-np', 'nionp', 'niox -np', 'niox np', 'niox-nc', 'niox-np']:
+        formatedStackElement = 'NiO-np'
+    elif stackElement.lower() in ['nio-mp', 'niox-m', 'niox-mp']:
+        formatedStackElement = 'NiO-mp'
+    elif stackElement.lower() in ['non', 'none']:
+        formatedStackElement = 'none'
+
+    elif stackElement.lower() in ['pbs qds', 'PbS-qd']:
+        formatedStackElement = 'PbS-QDs'
+    elif stackElement.lower() in ['pc60bm', 'pc61bm', 'pcbm', 'pcbm-60', 'pcbm-61', 'pcbm-c60', 'pcbm-c61', 'pcbm60', 'pcbm61']:
+        formatedStackElement = 'PCBM-60' 
+    elif stackElement.lower() in ['pc70bm', 'pc71bm', 'pcb71m', 'pcbm-70', 'pcbm-71', 'pcbm-c70', 'pcbm-c71', 'pcbm70', 'pcbm71']:
+        formatedStackElement = 'PCBM-70'
+    elif stackElement.lower() in ['pedot']:
+        formatedStackElement = 'PEDOT'
+    elif stackElement.lower() in ['pedot:pss', 'pedot : pss', 'pedot-pss']:
+        formatedStackElement = 'PEDOT:PSS'
+    elif stackElement.lower() in ['pei', 'polyetherimide']:
+        formatedStackElement = 'PEI'
+    elif stackElement.lower() in ['peg']:
+        formatedStackElement = 'PEG'
+    elif stackElement.lower() in ['peg']:
+        formatedStackElement = 'PEG'
+    elif stackElement.lower() in ['ito-pen']:
+        formatedStackElement = 'PEN | ITO'
+    elif stackElement.lower() in ['pet']:
+        formatedStackElement = 'PET'
+    elif stackElement.lower() in ['perovksite', 'perovskite', 'perovskites', 'pervoskite', 'prevskite', 'provskite', 'psk']:
+        formatedStackElement = 'Perovskite'
+    elif stackElement.lower() in ['polymer']:
+        formatedStackElement = 'Polymer'
+    elif stackElement.lower() in ['poly-tpd', 'polytpd']:
+        formatedStackElement = 'PolyTPD'
+    elif stackElement.lower() in ['poly(triaryl amine)', 'poly(triarylamine)', 'poly[bis(4-phenyl)(2,4,6-trimethylphenyl)amine]]', 'polytriaryl amine', 'polytriarylamine', 'ptaa',]:
+        formatedStackElement = 'PTAA'
+    elif stackElement.lower() in ['pss']:
+        formatedStackElement = 'PSS'
+
+    elif stackElement.lower() in ['fused quartz', 'fused silica', 'quartz', 'quartz glass']:
+        formatedStackElement = 'Quartz'
+
+    elif stackElement.lower() in ['r-go', 'rgo']:
+        formatedStackElement = 'rGO' 
+    elif stackElement.lower() in ['rhodamine101', 'rhodamine 101', 'rhb101']:
+        formatedStackElement = 'Rhodamine 101'
+
+    elif stackElement.lower() in ['si-nanorods', 'si-nr', 'si-nw']:
+        formatedStackElement = 'Si-nw'
+    elif stackElement.lower() in ['glass', 'ngo', 'ngo10', 'pilkington', 'sgl', 'slf', 'slg', 'tec']:
+        formatedStackElement = 'SLG'
+    elif stackElement.lower() in ['sno2', 'snox']:
+        formatedStackElement = 'SnO2'
+    elif stackElement.lower() in ['c-sno2', 'sno2-bl', 'sno2-c']:
+        formatedStackElement = 'SnO2-c'
+    elif stackElement.lower() in ['m-sno2', 'mp-sno2', 'sno2 m', 'sno2 mp', 'sno2-m', 'sno2-mp']:
+        formatedStackElement = 'SnO2-mp'
+    elif stackElement.lower() in ['np-sno2', 'sno2 -np', 'sno2 np', 'sno2-ncs', 'sno2-np']:
+        formatedStackElement = 'SnO2-np'
+    elif stackElement.lower() in ['sno2 nanorods', 'sno2 nanowires', 'sno2-nanorods', 'sno2-nanowires', 'sno2-nr', 'sno2-nw']:
+        formatedStackElement = 'SnO2-nw'
+    elif stackElement.lower() in ['sno2-qd', 'sno2-qds']:
+        formatedStackElement = 'SnO2-QDs'
+    elif stackElement.lower() in ['spiiro', 'spiro', 'spiro ometad', 'spiro ometad', 'spiro-meotad', 'spiro-ometad', 'spiromeotad', 'spirometad', 'spiroometad', 'spiroometad', 'spiro‐meotad', 'spiro‐ometad', 'sprio', 'sprio-ometad']:
+        formatedStackElement = 'Spiro-MeOTAD'
+    elif stackElement.lower() in ['srtio3', 'srxti1-xo3']:
+        formatedStackElement = 'SrTiO3'
+    elif stackElement.lower() in ['surlyn']:
+        formatedStackElement = 'Surlyn'
+    elif stackElement.lower() in ['sw-c-nt', 'swcnt', 'swcnts', 'swnts']:
+        formatedStackElement = 'SWCNTs'
+
+    elif stackElement.lower() in ['ti foil', 'ti-foil']:
+        formatedStackElement = 'Ti-foil'
+    elif stackElement.lower() in ['tio2', 'tio2x', 'tiox']:
+        formatedStackElement = 'TiO2'
+    elif stackElement.lower() in ['bk-tio2', 'bl-tio2', 'c tio2', 'c-tio', 'c-tio2', 'cp-tio2', 'ctio', 'ctio2', 'd-tio2', 'tio-c', 'tio2 - c', 'tio2 -c', 'tio2-b', 'tio2-bl', 'tio2-c', 'tio2-cp', 'tio2c', 'tiox-c']:
+        formatedStackElement = 'TiO2-c'
+    elif stackElement.lower() in ['tio2-mp', 'tio2- mp', 'tio2 - mp', 'm-tio2', 'mp-tio2', 'ml-tio2', 'tio2 nps', 'tio2-m', 'tio2mp', 'tio2 mp', 'tio2 -m', 'meso-tio2', 'tio2 nanoporous', 'tio2 meso', 'tio2 m', 'm- tio2', 'mtio2']:
+        formatedStackElement = 'TiO2-mp'
+    elif stackElement.lower() in ['tio2-io', 'tio2 invers opal']:
+        formatedStackElement = 'TiO2-IO'
+    elif stackElement.lower() in ['tio2 nfs', 'tio2-nfs', 'tio2-nanofibres']:
+        formatedStackElement = 'TiO2-nanofibres'
+    elif stackElement.lower() in ['np- tio2', 'np-tio2', 'tio2 nanocrystals', 'tio2 nanoparticles', 'tio2-nanoparticles', 'tio2 np', 'tio2-np', 'tio2-nps']:
+        formatedStackElement = 'TiO2-np'
+    elif stackElement.lower() in ['tio2 nanosheet', 'tio2 nanosheets', 'tio2-nanosheet', 'tio2-nanosheets', 'tio2-ns']:
+        formatedStackElement = 'TiO2-ns'
+    elif stackElement.lower() in ['nt-tio2', 'tio2 nanotube', 'tio2 nanotubes', 'tio2-nanotube', 'tio2-nanotubes', 'tio2-nt']:
+        formatedStackElement = 'TiO2-nt'
+    elif stackElement.lower() in ['nanorods-tio2', 'tio2 nanorod', 'tio2 nanorod array', 'tio2 nanorod arrays', 'tio2 nanorods', 'tio2 nanowires', 'tio2 nr', 'tio2 nrs', 'tio2 nws', 'tio2-na', 'tio2-nanocolumns', 'tio2-nanorod', 'tio2-nanorods', 'tio2-nanowire', 'tio2-nanowires', 'tio2-nr', 'tio2-nrs', 'tio2-nws']:
+        formatedStackElement = 'TiO2-nw'
+
+    elif stackElement.lower() in ['mp-zn2sno4', 'zn2sno4-mp']:
+        formatedStackElement = 'Zn2SnO4-mp' 
+    elif stackElement.lower() in ['zno']:
+        formatedStackElement = 'ZnO'
+    elif stackElement.lower() in ['c-zno', 'zno-c']:
+        formatedStackElement = 'ZnO-c'
+    elif stackElement.lower() in ['npzno', 'zno np', 'zno nps', 'zno-np', 'zno-nps']:
+        formatedStackElement = 'ZnO-np'
+    elif stackElement.lower() in ['nr- zno', 'nr-zno', 'zno nanorod', 'zno nanorods', 'zno nanowire', 'zno nanowires', 'zno nr', 'zno nrs', 'zno-nanorod', 'zno-nanorods', 'zno-nanowire ', 'zno-nanowires', 'zno-nr', 'zno-nrs']:
+        formatedStackElement = 'ZnO-nw'
+    elif stackElement.lower() in ['zno qd', 'zno qds', 'zno-qd', 'zno-qds']:
+        formatedStackElement = 'ZnO-QDs'
+    elif stackElement.lower() in ['m-zro2', 'zro-mp', 'zro2-m ', 'zro2-mp']:
+        formatedStackElement = 'ZrO2-mp'
+
+    elif stackElement.lower() in ['willow glass', 'corning willow glass', 'wg']:
+        formatedStackElement = 'Willow glass'
+    elif stackElement.lower() in ['wox']:
+        formatedStackElement = 'WOx'  
+
+    # If no known formating variations
+    else: 
+        formatedStackElement = stackElement
+
+    return formatedStackElement
+
+def stackSequence_reference(userData):
+    '''Format the string describing stack sequences'''
+    stack = []
+    for item in userData:
+        # Enforce that input is a string 
+        item = str(item).strip()
+
+        # Split on |, ; and :
+        layers = item.split('|')
+        for i, layer in enumerate(layers):
+            elements = layer.split(';')
+            for j, element in enumerate(elements):
+                materials = element.split(':')
+                for k, material in enumerate(materials):
+                    materials[k] = stackSequenceFormating_reference(material)
+                elements[j] = ':'.join(materials)
+            layers[i] = '; '.join(elements)
+
+        stack.append(" | ".join(layers))
+
+    return stack
+
+
+def perovskiteComposition_reference(userData):
+    '''Format the strings determining the perovskite compoition'''
+    composition = []
+    for item in userData:
+        try:
+            # Enforce that input is a string 
+            item = str(item)
+        
+            # In case of tempy string
+            if item == '':
+                item = 'none'
+
+            # Remove leading and tailing blank spaces
+            item = item.strip()
+
+            # Enfors the use of decimal point
+            item = item.replace(',', '.')
+
+            # Ensure that all ions are written with the right casing
+            item = item.replace("fa","FA")
+            item = item.replace("Fa","FA")
+            item = item.replace("ma","MA")
+            item = item.replace("Ma","MA")
+            item = item.replace("pb","Pb")
+            item = item.replace("Gua","GU")
+            item = item.replace("CH3NH3","MA")
+
+            item = item.replace("Sn0.5Pb0.5","Pb0.5Sn0.5")
+            item = item.replace("Sn0.1Pb0.9","Pb0.9Sn0.1")
+
+            item = item.replace("Sn0.5Ge0.5","Ge0.5Sn0.5")
+
+            item = item.replace("I1.2Br1.8","Br1.8I1.2")
+            item = item.replace("I1.5Br1.5","Br1.5I1.5")
+            item = item.replace("I1.8Br1.2","Br1.2I1.8")
+            item = item.replace("I2.1Br0.9","Br0.9I2.1")
+            item = item.replace("I2.2Br0.8","Br0.8I2.2")
+            item = item.replace("I2.24Br0.6","Br0.6I2.4")
+            item = item.replace("I2.51Br0.49","Br0.49I2.51")
+            item = item.replace("I2.55Br0.45","Br0.45I2.55")
+            item = item.replace("I2.49Br0.51","Br0.51I2.49")
+            item = item.replace("I2.5Br0.5","Br0.5I2.5")
+            item = item.replace("I2.59Br0.41","Br0.41I2.59")
+            item = item.replace("I2.65Br0.35","Br0.35I2.65")
+            item = item.replace("I2.69Br0.31","Br0.31I2.69")
+            item = item.replace("I2.7Br0.3","Br0.3I2.7")
+            item = item.replace("I2.75Br0.25","Br0.25I2.75")
+            item = item.replace("I2.8Br0.2","Br0.2I2.8")
+            item = item.replace("I2.85Br0.15","Br0.15I2.85")
+            item = item.replace("I2.9Br0.1","Br0.1I2.9")
+            item = item.replace("I2.99Br0.01","Br0.01I2.99")
+
+            item = item.replace("MA0.15FA0.75","FA0.75MA0.15")
+            item = item.replace("MA0.17FA0.83","FA0.83MA0.17")
+            item = item.replace("MA0.2FA0.8","FA0.8MA0.2")
+            item = item.replace("MA0.4FA0.6","FA0.6MA0.4")
+            item = item.replace("MA0.6FA0.4","FA0.4MA0.6")
+            item = item.replace("MA0.7FA0.3","FA0.3MA0.7")
+            item = item.replace("MA0.85FA0.15","FA0.15MA0.85")
+            item = item.replace("MA0.9FA0.1","FA0.1MA0.9")
+            item = item.replace("MA0.05FA0.83","FA0.83MA0.05")
+
+            item = item.replace("MA0.1FA0.75Cs0.15", "Cs0.15FA0.75MA0.1")
+            item = item.replace("MA0.6FA0.38Cs0.02", "Cs0.02FA0.38MA0.6")
+            item = item.replace("FA0.75MA0.15Cs0.1", "Cs0.1FA0.75MA0.15")
+
+            item = item.replace("MA0.85Cs0.15","Cs0.15MA0.85")
+
+            item = item.replace("FA0.83Cs0.17","Cs0.17FA0.83")
+            item = item.replace("FA0.7Cs0.3","Cs0.3FA0.7")
+            item = item.replace("FA0.8Cs0.2","Cs0.2FA0.8")
+            item = item.replace("FA0.85Cs0.15","Cs0.15FA0.85")
+            item = item.replace("FA0.875Cs0.125","Cs0.125FA0.875")
+            item = item.replace("FA0.9Cs0.1","Cs0.1FA0.9")
+            item = item.replace("FA0.95Cs0.05","Cs0.05FA0.95")
+
+            item = item.replace("FA0.85BA0.15", "BA0.15FA0.85")
+
+            item = item.replace("MA3BA2","BA2MA3")
+            item = item.replace("BA0.2MA3","MA3BA0.2")
+            item = item.replace("BA0.4MA3","MA3BA0.4")
+            item = item.replace("BA0.6MA3","MA3BA0.6")
+
+            item = item.replace("Br1I2","BrI2")
+            item = item.replace("I2Br","BrI2")
+            item = item.replace("Br2I1","Br2I")
+
+            item = item.replace("(I0.8Br0.2)3","Br0.6I2.4")
+            item = item.replace("(I0.85Br0.15)3", "Br0.45I2.55")
+
+
+            item = item.replace("(I0.75Br0.25)3", "Br0.75I2.25")
+
+            ## Correct known formating mistakes
+            #item = item.replace("bP","Pb")
+            if item in ['MAPbI3-xClx', 'MAPbI3-xClx', 'MAPbIxCl3-x', 'MAPbI3−xClx', 'MAPbIxCly', 'MAPbi3', 'MAPbI2.67Cl0.33', 'MAPbI2.75Cl0.25' ,'MAPbI2.7Cl0.30', 'MAPbI2.81Cl0.19', 'MAPbI2.89Cl0.11']:
+                item = 'MAPbI3'
+            elif item in ['FAMAPbI3–xBrx', 'α-FAPbI3']:
+                item = 'FAPbI3'
+            elif item in ['(FAPbI3)0.7(MAPbBr3)0.3']:
+                item = 'FA0.7MA0.3PbBr0.9I2.1'
+            elif item in ['(FAPbI3)0.75(MAPbBr3)0.25']:
+                item = 'FA0.75MA0.25PbBr0.75I2.25'
+            elif item in ['(FAPbI3)0.8(MAPbBr3)0.2']:
+                item = 'FA0.8MA0.2PbBr0.6I2.4'
+            elif item in ['(FAPbI3)0.85(MAPbBr3)0.15', 'FAI)0.85(PbI2)0.85(MABr)0.15(PbBr2)0.15']:
+                item = 'FA0.85MA0.15PbBr0.45I2.55'
+            elif item in ['(FAPbI3)0.9(MAPbBr3)0.1']:
+                item = 'FA0.9MA0.1PbBr0.3I2.7'
+            elif item in ['(FAPbI3)0.95(MAPbBr3)0.05']:
+                item = 'FA0.95MA0.05PbBr0.15I2.85'
+
+            elif item in ['CsPbI2Br']:
+                item = 'CsPbBrI2'
+
+            elif item in ['(FAPbI3)10(BAPbI4)']:
+                item = 'BAFA10Pb11I34'
+            elif item in ['(FAPbI3)40(BAPbI4)']:
+                item = 'BAFA40Pb41I124'
+            elif item in ['(FAPbI3)60(BAPbI4)']:
+                item = 'BAFA60Pb61I184'
+
+            elif item in ['(MA)3Bi2I9']:
+                item = 'MA3Bi2I9'
+             
+            elif item in ['Cs0.05FA0.81MA0.14PbI2.55Br0.45']:
+                item = 'Cs0.05FA0.81MA0.14PbBr0.45I2.55'
+
+            elif item in ['PEA0.15FA0.85SnI3:SnF2']:
+                item = 'FA0.85PEA0.015SnI3'
+
+
+            elif item in ['(CH3NH3)3Bi2I9']:
+                item = 'MA3Bi2I9'
+
+            elif item in ['MA0.9Cs0.1PbBr1.2I1.8']:
+                item = 'Cs0.1MA0.9PbBr1.2I1.8'
+
+            # Split on |
+            itemList = item.split('|')
+
+            for i, element in enumerate(itemList):
+                # Remove leading and tailing blank spaces
+                itemList[i] = element.strip()
+
+            # Concatenate all parts with proper spacing
+            item = " | ".join(itemList)
+
+            # TO DO
+            # Deal with parantesises
+
+            # TO DO
+            # Deal with the order of the ions
+
+            composition.append(item)
+        except:
+            print(f'faild to extract perovskiteComposition of {item} on row {i}')
+            composition.append(item)
+
+    return composition
+
+def defaultFF_reference(userData):
+    ''' Determin the default FF to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
+    FF = []
+    flag = []
+
+    for i in range(len(userData)): 
+        try:
+            if np.isnan(userData['JV_reverse_scan_FF'][i]) == False:
+                FF.append(userData['JV_reverse_scan_FF'][i])
+                flag.append('Reversed')
+            elif np.isnan(userData['JV_forward_scan_FF'][i]) == False:
+                FF.append(userData['JV_forward_scan_FF'][i])
+                flag.append('Forward')
+            else:
+                FF.append(np.nan)
+                flag.append(np.nan)
+        except:
+            FF.append(np.nan)
+            flag.append(np.nan)
+
+    return FF, flag
+
+def defaultJsc_reference(userData):
+    ''' Determin the default Jsc to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
+    Jsc = []
+    flag = []
+
+    for i in range(len(userData)):       
+        # Check if the data template is of a version with stabilised values
+        try:
+            if np.isnan(userData['JV_reverse_scan_Jsc'][i]) == False:
+                Jsc.append(userData['JV_reverse_scan_Jsc'][i])
+                flag.append('Reversed')
+            elif np.isnan(userData['JV_forward_scan_Jsc'][i]) == False:
+                Jsc.append(userData['JV_forward_scan_Jsc'][i])
+                flag.append('Forward')
+            else:
+                Jsc.append(np.nan)
+                flag.append(np.nan)
+        except:
+            Jsc.append(np.nan)
+            flag.append(np.nan)
+        
+    return Jsc, flag
+
+def defaultVoc_reference(userData):
+    ''' Determin the default Voc to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
+    Voc = []
+    flag = []
+
+    for i in range(len(userData)):       
+        # Check if the data template is of a version with stabilised values
+        try:
+            if np.isnan(userData['JV_reverse_scan_Voc'][i]) == False:
+                Voc.append(userData['JV_reverse_scan_Voc'][i])
+                flag.append('Reversed')
+            elif np.isnan(userData['JV_forward_scan_Voc'][i]) == False:
+                Voc.append(userData['JV_forward_scan_Voc'][i])
+                flag.append('Forward')
+            else:
+                Voc.append(np.nan)
+                flag.append(np.nan)
+        except:
+            Voc.append(np.nan)
+            flag.append(np.nan)
+        
+    return Voc, flag
+
+def defaultPCE_reference(userData):
+    ''' Determin the default PCE to plot. Chose the first value that excist of: stabilised valuses from mpp, reversed scan and lastly the forward scan'''
+    PCE = []
+    flag = []
+
+    for i in range(len(userData)):       
+        # Check if the data template is of a version with stabilised values
+        try:
+            if np.isnan(userData['Stabilised_performance_PCE'][i]) == False:
+                PCE.append(userData['Stabilised_performance_PCE'][i])
+                flag.append('Stabilised')
+            elif np.isnan(userData['JV_reverse_scan_PCE'][i]) == False:
+                PCE.append(userData['JV_reverse_scan_PCE'][i])
+                flag.append('Reversed')
+            elif np.isnan(userData['JV_forward_scan_PCE'][i]) == False:
+                PCE.append(userData['JV_forward_scan_PCE'][i])
+                flag.append('Forward')
+            else:
+                PCE.append(np.nan)
+                flag.append(np.nan)
+        except:
+            PCE.append(np.nan)
+            flag.append(np.nan)
+        
+    return PCE, flag
+
+def hysteresisIndex_reference(userData):
+    '''Calculate the hysteresis index
+    '''
+    hysteresis = []
+    
+    for i in range(len(userData)):
+        datatemp = []
+        # Gather the IV-data
+        try:
+            datatemp.append(userData['JV_forward_scan_Voc'][i])
+            datatemp.append(userData['JV_reverse_scan_Voc'][i])
+            datatemp.append(userData['JV_forward_scan_Jsc'][i])
+            datatemp.append(userData['JV_reverse_scan_Jsc'][i])
+            datatemp.append(userData['JV_forward_scan_FF'][i])
+            datatemp.append(userData['JV_reverse_scan_FF'][i])
+            datatemp.append(userData['JV_forward_scan_PCE'][i])
+            datatemp.append(userData['JV_reverse_scan_PCE'][i])
+
+            # If not enough data to calculat the hysteresis
+            if np.isnan(datatemp).any() or 0 in datatemp:
+                hysteresis.append(np.nan)
+
+            # Calcualte the rations for all parameters between the forward and the revers scan
+            else:
+                fractions = []
+                fractions.append(userData['JV_forward_scan_Voc'][i]/userData['JV_reverse_scan_Voc'][i])
+                fractions.append(userData['JV_forward_scan_Jsc'][i]/userData['JV_reverse_scan_Jsc'][i])
+                fractions.append(userData['JV_forward_scan_FF'][i]/userData['JV_reverse_scan_FF'][i])
+                fractions.append(userData['JV_forward_scan_PCE'][i]/userData['JV_reverse_scan_PCE'][i])
+
+                # Enfores that all the elements in the fractions are above 1. i.e. in the form biggest/smallest
+                for i, item in enumerate(fractions):
+                    if item < 1:
+                     fractions[i] = 1/item
+
+                # Calculate a proxy for the hysteresis
+                hysteresis.append(np.cumprod(np.array(fractions))[-1] - 1)
+        except:
+            print(f'Failed to derrive the hysteresis index on row {i}')
+            hysteresis.append(np.nan)
+
+    return hysteresis
+
+
+#%% Helper functions
+def timeFunction(function, repeats = 3):
+    '''Returns the shortest time in seconds of {repeats} calls to {function}'''
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+def perovskiteCompositionFixture():
+    '''Returns compositions that exercise every rewrite rule and every known formating mistake in perovskiteComposition,
+    also in combination with the casing rules, blank spaces and several layers'''
+    fixture = ['', ' ', 'nan', 'MAPbI3', 'MAPbI3 | CsPbBr3', ' MAPbI3|MAPbI3 ', 'ma0,5fa0,5pbi3', 'CH3NH3PbI3', 'GuaPbI3']
+    for old, new in cdf.perovskiteCompositionRules[1]:
+        fixture += [old, f'Cs{old}PbI3', old.lower(), f'{old} | {old}']
+    for composition, mistakes in cdf.perovskiteCompositionMistakes.items():
+        fixture += mistakes + [f' {mistake} ' for mistake in mistakes]
+
+    return fixture
+
+def normalizationFixture():
+    '''Returns entries with blank spaces and line breaks, e.g. from Excel cells ending with Alt+Enter, and the formating the earlier implementation
+    of each cleaning function gave them, {function : (arguments, formated entries)}'''
+    entries = ['\n', ' \n', '\r\n', 'a; \n', '25 | \n', '1 | \n | 2', '25 >> \n', ' 25 ', '25;\t', '']
+    expected = {
+        'aggregationStates' : ['Unknown', 'Unknown', 'Unknown', 'Unknown; Unknown', 'Unknown | Unknown', 'Unknown | Unknown | Unknown', 'Unknown >> Unknown', 'Unknown', 'Unknown; Unknown', 'Unknown'],
+        'atmosphere' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | Unknown | 2', '25 >> Unknown', '25', '25; Unknown', 'Unknown'],
+        'compounds' : ['nan', 'nan', 'nan', 'a; nan', '25 | nan', '1 | nan | 2', '25 >> nan', '25', '25; nan', 'nan'],
+        'concentrations' : [' ', ' ', ' ', ' a;  ', '25 |  ', '1 |   | 2', '25 >>  ', '25', '25;  ', 'nan'],
+        'depositionProcedure' : ['Unknown', 'Unknown', 'Unknown', 'a;', '25 | Unknown', '1 | Unknown | 2', '25 >> Unknown', '25', '25;', 'Unknown'],
+        'dopandsAndAdditives' : ['nan', 'nan', 'nan', 'a; nan', '25 | nan', '1 | nan | 2', '25 >>', '25', '25; nan', 'nan'],
+        'mixingRatios' : ['nan', 'nan', 'nan', 'nan', '1 | nan', '1 | nan | 1', '1 >> nan', '1', '25; nan', 'nan'],
+        'numberListUnitless' : ['', '', '', '; ', '25 | ', '1 |  | 2', '25 >> ', '25', '25; ', 'nan'],
+        'perovskiteCoefficients' : ['', '', '', 'x; ', '25 | ', '1 | x | 2', 'x', '25', '25; ', ''],
+        'perovskiteComposition' : ['', '', '', 'a;', '25 | ', '1 |  | 2', '25 >>', '25', '25;', 'none'],
+        'perovskiteIons' : ['nan', 'nan', 'nan', 'a; nan', '25 | nan', '1 | nan | 2', '25 >>', '25', '25; nan', 'nan'],
+        'perovskiteLongForm' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | \n | 2', '25>>', '25', '25; Unknown', 'Unknown'],
+        'perovskiteShortForm' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | \n | 2', '25>>', '25', '25; Unknown', 'Unknown'],
+        'pressure' : ['nan', 'nan', 'nan', ' a; nan', '25 | nan', '1 |   | 2', '25 >> nan', '25', '25; nan', 'nan'],
+        'purity' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | Unknown | 2', '25 >> Unknown', '25', '25; Unknown', 'Unknown'],
+        'relativeHumidity' : ['nan', 'nan', 'nan', 'nan; nan', '25 | nan', '1 | nan | 2', '25 >> nan', '25', '25; nan', 'nan'],
+        'solvents' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | Unknown | 2', '25 >> Unknown', '25', '25; Unknown', 'Unknown'],
+        'stackSequence' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | Unknown | 2', '25 >>', '25', '25; Unknown', 'Unknown'],
+        'stackSequenceForSealing' : ['Unknown', 'Unknown', 'Unknown', 'a;', '25 | Unknown', '1 | Unknown | 2', '25 >>', '25', '25;', 'Unknown'],
+        'supplier' : ['Unknown', 'Unknown', 'Unknown', 'a; Unknown', '25 | Unknown', '1 | Unknown | 2', '25 >> Unknown', '25', '25; Unknown', 'Unknown'],
+        'temperature' : ['', '', '', '; ', '25 | ', '1 |  | 2', '25 >> ', '25', '25; ', 'Unknown'],
+        'thickness' : ['nan', 'nan', 'nan', 'a;', '25.0 | nan', '1|\n|2', '25.0', '25.0', '25.0', 'nan'],
+        'time' : ['Unknown', 'Unknown', 'Unknown', 'Unknown; Unknown', '1500.0 | Unknown', '60.0 | Unknown | 120.0', '1500.0 >> Unknown', '1500.0', '1500.0; Unknown', 'Unknown'],
+        'volumes' : ['Unknown', 'Unknown', 'Unknown', 'Unknown; Unknown', '25.0 | Unknown', '1.0 | Unknown | 2.0', '25.0 >> Unknown', '25.0', '25.0; Unknown', 'Unknown'],
+        }
+    arguments = {'thickness' : ('nm', 'nm'), 'time' : ('h', 'min'), 'volumes' : ('ml', 'ml')}
+
+    return entries, {function : (arguments.get(function, ()), formated) for function, formated in expected.items()}
+
+def printComparison(name, referenceTime, newTime):
+    '''Print the time for the reference and the new implementation'''
+    print(f'{name}: reference {referenceTime*1000:.1f} ms, new {newTime*1000:.1f} ms, speedup {referenceTime/newTime:.1f}x')
+
+
+#%% Benchmarks
+def run_benchmarkDataManipulation(engine = None):
+    '''Compare dataManipulation and the conversions it uses with the earlier implementations on the full data table'''
+    if engine is None:
+        engine = conectToDatabase()
+
+    numericColumns = ['JV_default_PCE', 'JV_default_Voc', 'JV_default_FF', 'JV_default_Jsc']
+    columns = numericColumns + ['Ref_ID', 'Perovskite_band_gap', 'Ref_publication_date', 'Outdoor_temperature_range', 'Stability_temperature_range']
+
+    # The benchmark should not be affected by the column cache
+    data = loadDataFromDatabase(dataColumns = columns, engine = engine)
+    print(f'Benchmark on {len(data)} rows')
+
+    #%% Band gap
+    reference = convertNumerListToFloats_reference(data['Perovskite_band_gap'].copy())
+    new = convertNumerListToFloats(data['Perovskite_band_gap'].copy())
+    assert np.allclose(reference.values, new.values, equal_nan = True), 'convertNumerListToFloats differs from the reference'
+
+    printComparison('convertNumerListToFloats',
+                    timeFunction(lambda: convertNumerListToFloats_reference(data['Perovskite_band_gap'].copy())),
+                    timeFunction(lambda: convertNumerListToFloats(data['Perovskite_band_gap'].copy())))
+
+    #%% Temperature
+    for column in ['Outdoor_temperature_range', 'Stability_temperature_range']:
+        reference = np.array(getMaxTemperature_reference(data[column]), dtype = float)
+        new = getMaxTemperature(data[column])
+        assert np.allclose(reference, new, equal_nan = True), f'getMaxTemperature differs from the reference for {column}'
+
+        printComparison(f'getMaxTemperature {column}',
+                        timeFunction(lambda: getMaxTemperature_reference(data[column])),
+                        timeFunction(lambda: getMaxTemperature(data[column])))
+
+    #%% All of dataManipulation. The new version is timed without the column cache, i.e. as the first session in a process
+    reference = dataManipulation_reference(data.copy(), numericColumns)
+    new = dataManipulation(data.copy())
+    pd.testing.assert_frame_equal(reference, new[reference.columns])
+
+    printComparison('dataManipulation',
+                    timeFunction(lambda: dataManipulation_reference(data.copy(), numericColumns)),
+                    timeFunction(lambda: dataManipulation(data.copy())))
+
+def run_benchmarkStackSequence(engine = None, rows = 10000):
+    '''Compare stackSequence with the earlier implementation on a template with {rows} rows, sampled from the stack sequences in the database'''
+    if engine is None:
+        engine = conectToDatabase()
+
+    columns = ['Cell_stack_sequence', 'Substrate_stack_sequence', 'ETL_stack_sequence', 'HTL_stack_sequence', 'Backcontact_stack_sequence']
+    data = loadDataFromDatabase(dataColumns = columns, engine = engine)
+
+    # A template as it would look in an upload, with entries drawn from the existing data
+    rng = np.random.default_rng(0)
+    template = pd.DataFrame({column : rng.choice(data[column].astype(str).values, size = rows) for column in columns})
+    print(f'Benchmark on a template with {rows} rows')
+
+    for column in columns:
+        reference = stackSequence_reference(template[column])
+        new = cdf.stackSequence(template[column])
+        assert reference == new, f'stackSequence differs from the reference for {column}'
+
+        # The new version is timed with an empty cache, i.e. as the first column in an upload
+        def newFunction():
+            clearNormalizationCaches()
+            cdf.stackSequence(template[column])
+
+        referenceTime = timeFunction(lambda: stackSequence_reference(template[column]))
+        newTime = timeFunction(newFunction)
+        printComparison(f'stackSequence {column}', referenceTime, newTime)
+        print(f'    {rows/newTime:.0f} rows per second')
+
+def run_checkNormalization():
+    '''Check that the cleaning functions built on normalize give the same formating as the earlier implementations for entries with blank spaces and line breaks'''
+    entries, expected = normalizationFixture()
+    for function, (arguments, formated) in expected.items():
+        clearNormalizationCaches()
+        new = getattr(cdf, function)(pd.Series(entries, dtype = object), *arguments)
+        differences = [(entry, reference, item) for entry, reference, item in zip(entries, formated, new) if reference != item]
+        assert len(differences) == 0, f'{function} differs from the earlier implementation: {differences}'
+
+    print(f'{len(expected)} cleaning functions give the same formating as before')
+
+def run_benchmarkPerovskiteComposition(engine = None):
+    '''Check that perovskiteComposition gives byte identical results to the earlier implementation on the fixture and on the compositions in the database, and compare the speed'''
+    if engine is None:
+        engine = conectToDatabase()
+
+    columns = ['Perovskite_composition_long_form', 'Perovskite_composition_short_form']
+    data = loadDataFromDatabase(dataColumns = columns, engine = engine)
+
+    compositions = {'fixture' : pd.Series(perovskiteCompositionFixture())}
+    for column in columns:
+        compositions[column] = data[column]
+
+    for name, userData in compositions.items():
+        reference = perovskiteComposition_reference(userData)
+        new = cdf.perovskiteComposition(userData)
+        assert [item.encode('utf-8') for item in reference] == [item.encode('utf-8') for item in new], f'perovskiteComposition differs from the reference for {name}'
+
+        # The new version is timed with an empty cache
+        def newFunction():
+            clearNormalizationCaches()
+            cdf.perovskiteComposition(userData)
+
+        printComparison(f'perovskiteComposition {name} ({len(userData)} rows)',
+                        timeFunction(lambda: perovskiteComposition_reference(userData)),
+                        timeFunction(newFunction))
+
+def run_benchmarkJVDefaults(engine = None):
+    '''Check that the default JV parameters and the hysteresis index are identical to the earlier row by row implementations on the full data table, and compare the speed'''
+    if engine is None:
+        engine = conectToDatabase()
+
+    columns = [f'JV_{direction}_scan_{parameter}' for direction in ['forward', 'reverse'] for parameter in ['Voc', 'Jsc', 'FF', 'PCE']] + ['Stabilised_performance_PCE']
+    data = loadDataFromDatabase(dataColumns = columns, engine = engine)
+    print(f'Benchmark on {len(data)} rows')
+
+    functions = {
+        'defaultVoc' : (defaultVoc_reference, codf.defaultVoc),
+        'defaultJsc' : (defaultJsc_reference, codf.defaultJsc),
+        'defaultFF' : (defaultFF_reference, codf.defaultFF),
+        'defaultPCE' : (defaultPCE_reference, codf.defaultPCE),
+        'hysteresisIndex' : (hysteresisIndex_reference, codf.hysteresisIndex),
+        }
+
+    referenceTotal = 0
+    newTotal = 0
+    for name, (referenceFunction, newFunction) in functions.items():
+        with np.errstate(all = 'ignore'):
+            reference = referenceFunction(data)
+        new = newFunction(data)
+
+        # Values and flags are compared as series, where nan is equal to nan
+        if name == 'hysteresisIndex':
+            reference, new = [reference], [new]
+        for referenceItem, newItem in zip(reference, new):
+            pd.testing.assert_series_equal(pd.Series(referenceItem), pd.Series(newItem), check_exact = True)
+
+        with np.errstate(all = 'ignore'):
+            referenceTime = timeFunction(lambda: referenceFunction(data))
+        newTime = timeFunction(lambda: newFunction(data))
+        printComparison(name, referenceTime, newTime)
+        referenceTotal += referenceTime
+        newTotal += newTime
+
+    printComparison('All JV defaults and the hysteresis index', referenceTotal, newTotal)
@@ -0,0 +1,191 @@
+# =============================================================================
+# bulkInsert
+# Moduel for inserting uploaded data into the main table with Postgres
+# COPY FROM STDIN instead of one INSERT per row. The data is first checked
+# against the perovskitedata table class: the columns must be the same and in
+# the same order, and every value must be possible to convert to the type of
+# its column. The rows are then streamed to the database in chunks of csv,
+# all in one transaction, so either all rows are inserted or none.
+#
+# The database IDs of the new rows are allocated in the same transaction. An
+# advisory lock is taken before the highest ID is read through the primary key
+# index, and it is held until the rows are committed, so two uploads running
+# at the same time get separate blocks of consecutive IDs.
+# =============================================================================
+
+#%% Imports
+import io
+import zlib
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Boolean, Date, Float, Integer
+
+import UtilityFunctions.dataTableClass_V5_31 as dataTable_1
+
+
+#%% Parameters
+# Number of rows in each chunk sent to the database
+copyChunkSize = 5000
+
+
+#%% Helper classes
+class SchemaMismatch(ValueError):
+    '''Raised when the data does not match the table class'''
+    pass
+
+
+#%% Helper functions
+def _isMissing(values):
+    '''Boolean array that is True for missing values'''
+    return pd.isna(values).to_numpy() if isinstance(values, pd.Series) else pd.isna(values)
+
+def _integerText(column, values):
+    '''Integers as text. Floats are accepted if they are whole numbers'''
+    numbers = pd.to_numeric(values, errors = 'coerce')
+    missing = _isMissing(values)
+    invalid = ~missing & (numbers.isna().to_numpy() | (numbers.fillna(0) % 1 != 0).to_numpy())
+    if invalid.any():
+        raise SchemaMismatch(f'{column} should be integers. Found e.g. {values[invalid].iloc[0]!r}')
+
+    return [None if isMissing else str(int(number)) for number, isMissing in zip(numbers, missing)]
+
+def _floatText(column, values):
+    '''Floats as text, with all digits so that the values are not rounded'''
+    numbers = pd.to_numeric(values, errors = 'coerce')
+    missing = _isMissing(values)
+    invalid = ~missing & numbers.isna().to_numpy()
+    if invalid.any():
+        raise SchemaMismatch(f'{column} should be numbers. Found e.g. {values[invalid].iloc[0]!r}')
+
+    text = []
+    for number, isMissing in zip(numbers.astype(float), missing):
+        if isMissing:
+            text.append(None)
+        elif np.isinf(number):
+            text.append('Infinity' if number > 0 else '-Infinity')
+        else:
+            text.append(repr(number))
+
+    return text
+
+def _booleanText(column, values):
+    '''Booleans as t and f'''
+    booleans = {True : 't', False : 'f', 'True' : 't', 'False' : 'f', 'true' : 't', 'false' : 'f', 1 : 't', 0 : 'f'}
+    text = []
+    for value, isMissing in zip(values, _isMissing(values)):
+        if isMissing:
+            text.append(None)
+        else:
+            try:
+                text.append(booleans[value])
+            except (KeyError, TypeError):
+                raise SchemaMismatch(f'{column} should be True or False. Found e.g. {value!r}')
+
+    return text
+
+def _dateText(column, values):
+    '''Dates as yyyy-mm-dd'''
+    try:
+        dates = pd.to_datetime(values, errors = 'raise')
+    except (ValueError, TypeError, OverflowError) as e:
+        raise SchemaMismatch(f'{column} should be dates. {e}')
+
+    return [None if pd.isna(date) else date.strftime('%Y-%m-%d') for date in dates]
+
+def _text(column, values):
+    '''Everything else as text'''
+    return [None if isMissing else str(value) for value, isMissing in zip(values, _isMissing(values))]
+
+def idLockKey(schema, table, keyColumn):
+    '''Key of the advisory lock protecting the allocation of IDs in {keyColumn} of {schema}.{table}. The same in every process'''
+    return zlib.crc32(f'{schema}.{table}.{keyColumn}'.encode('utf-8'))
+
+def allocateIDs(cursor, rows, table, schema, keyColumn):
+    '''Reserve {rows} consecutive IDs in {keyColumn}, counting upwards from the highest ID in the table.
+    Must be called in the transaction inserting the rows, as the lock is released when the transaction ends'''
+    cursor.execute('select pg_advisory_xact_lock(%s)', (idLockKey(schema, table, keyColumn),))
+    cursor.execute(f'select coalesce(max("{keyColumn}"), 0) from {schema}.{table}')
+    startID = cursor.fetchone()[0] + 1
+
+    return list(range(startID, startID + rows))
+
+def _csvField(value):
+    '''A field in the csv sent to COPY. Missing values are empty and unquoted, which COPY reads as null. All other values are quoted'''
+    if value is None:
+        return ''
+
+    return '"' + value.replace('"', '""') + '"'
+
+def columnConverter(columnType):
+    '''Returns the function converting a column of {columnType} to text for COPY'''
+    if isinstance(columnType, Boolean):
+        return _booleanText
+    elif isinstance(columnType, Integer):
+        return _integerText
+    elif isinstance(columnType, Float):
+        return _floatText
+    elif isinstance(columnType, Date):
+        return _dateText
+    else:
+        return _text
+
+
+#%% Functions
+def validateDataFrame(userData, tableClass = dataTable_1.perovskitedata):
+    '''Check that the columns in {userData} are the columns in {tableClass}, in the same order, and convert every column to text for COPY.
+    Returns a list with the converted columns, as csv fields. Raises SchemaMismatch if the data does not match'''
+    tableColumns = list(tableClass.__table__.columns)
+    tableColumnNames = [column.name for column in tableColumns]
+    dataColumnNames = list(userData.columns)
+
+    if dataColumnNames != tableColumnNames:
+        missing = [column for column in tableColumnNames if column not in dataColumnNames]
+        extra = [column for column in dataColumnNames if column not in tableColumnNames]
+        if len(missing) > 0 or len(extra) > 0:
+            raise SchemaMismatch(f'The columns do not match {tableClass.__name__}. Missing: {missing}. Not in the table: {extra}')
+        firstDifference = next(i for i, (a, b) in enumerate(zip(dataColumnNames, tableColumnNames)) if a != b)
+        raise SchemaMismatch(f'The columns are not in the same order as in {tableClass.__name__}. Column {firstDifference} is {dataColumnNames[firstDifference]}, expected {tableColumnNames[firstDifference]}')
+
+    return [[_csvField(value) for value in columnConverter(column.type)(column.name, userData[column.name].reset_index(drop = True))] for column in tableColumns]
+
+def copyToDatabase(userData, table, engine, schema, tableClass = dataTable_1.perovskitedata, keyColumn = None):
+    '''Insert the rows in {userData} into {schema}.{table} with COPY FROM STDIN in one transaction.
+    The data is validated with validateDataFrame before anything is sent to the database.
+    If {keyColumn} is given, the values in it are replaced by new IDs allocated with allocateIDs, and a list with the IDs is returned'''
+    columns = validateDataFrame(userData, tableClass)
+    columnList = ', '.join(f'"{column.name}"' for column in tableClass.__table__.columns)
+    rows = len(userData)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+
+        # Check that the table in the database has the columns of the table class
+        cursor.execute('select column_name from information_schema.columns where table_schema = %s and table_name = %s', (schema, table))
+        databaseColumns = {item[0] for item in cursor.fetchall()}
+        missing = [column.name for column in tableClass.__table__.columns if column.name not in databaseColumns]
+        if len(missing) > 0:
+            raise SchemaMismatch(f'{schema}.{table} does not have the columns: {missing}')
+
+        # Database IDs for the new rows
+        IDs = None
+        if keyColumn is not None:
+            IDs = allocateIDs(cursor, rows, table = table, schema = schema, keyColumn = keyColumn)
+            keyIndex = [column.name for column in tableClass.__table__.columns].index(keyColumn)
+            columns[keyIndex] = [_csvField(str(ID)) for ID in IDs]
+
+        # Stream the data in chunks
+        for start in range(0, rows, copyChunkSize):
+            buffer = io.StringIO(''.join(','.join(row) + '\n' for row in zip(*[column[start : start + copyChunkSize] for column in columns])))
+            cursor.copy_expert(f'COPY {schema}.{table} ({columnList}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+        cursor.close()
+        connection.commit()
+    except:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    return IDs
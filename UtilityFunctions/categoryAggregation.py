@@ -0,0 +1,172 @@
+# =============================================================================
+# categoryAggregation
+# Moduel for summarizing the data in the categorical plots on the server. For
+# each category on the x-axis the number of data points, the quartiles, the
+# whiskers of a box plot and a histogram are computed with one groupby, and
+# only this summary is sent to the browser. The individual data points are
+# only sent if the user asks for them, or if there are so few of them that it
+# does not matter.
+#
+# The summary is cached per session and only recomputed when the selected
+# rows, the axes or the categories change. The counts of each category in a
+# column, used for sorting categories and colors, are cached the same way.
+# =============================================================================
+
+#%% Imports
+import zlib
+
+from bokeh.models import HoverTool
+import numpy as np
+import pandas as pd
+
+
+#%% Parameters
+# The individual data points are sent to the browser if there are at most this many of them
+pointThreshold = 3000
+
+# Number of bins in the histogram for each category
+histogramBins = 20
+
+# Width of the boxes and of the widest histogram bar, in units of the distance between categories
+boxWidth = 0.7
+
+# Columns in the summary and in the histogram
+summaryColumns = ['category', 'count', 'q1', 'median', 'q3', 'lower', 'upper']
+histogramColumns = ['category', 'bottom', 'top', 'width', 'count']
+
+
+#%% Helper functions
+def _rowsKey(rows):
+    '''Short key identifying the list of selected {rows}'''
+    rows = np.asarray(rows, dtype = np.int64)
+    return (len(rows), zlib.crc32(rows.tobytes()))
+
+def _histogram(values, categoryColumn, valueColumn, logScale, bins):
+    '''Histogram of {valueColumn} for each category. All categories share the same bins so that they can be compared'''
+    values = values[[categoryColumn, valueColumn]]
+    if logScale:
+        values = values[values[valueColumn] > 0]
+        binValues = np.log10(values[valueColumn].to_numpy(dtype = float))
+    else:
+        binValues = values[valueColumn].to_numpy(dtype = float)
+
+    if len(binValues) == 0:
+        return pd.DataFrame(columns = histogramColumns)
+
+    # Common bin edges
+    low, high = binValues.min(), binValues.max()
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, bins + 1)
+    binIndex = np.clip(np.searchsorted(edges, binValues, side = 'right') - 1, 0, bins - 1)
+
+    # Number of points in each bin and category. Only bins with data are returned
+    counts = values.groupby([values[categoryColumn].to_numpy(), binIndex]).size()
+    histogram = pd.DataFrame({
+        'category' : counts.index.get_level_values(0).astype(str),
+        'bin' : counts.index.get_level_values(1),
+        'count' : counts.to_numpy(),
+        })
+
+    # The widest bar in each category has the width of the box
+    histogram['width'] = boxWidth * histogram['count'] / histogram.groupby('category')['count'].transform('max')
+    histogram['bottom'] = edges[histogram['bin']]
+    histogram['top'] = edges[histogram['bin'] + 1]
+    if logScale:
+        histogram['bottom'] = 10**histogram['bottom']
+        histogram['top'] = 10**histogram['top']
+
+    return histogram[histogramColumns]
+
+
+#%% Functions
+def categoryCounts(data, column, countCache):
+    '''Number of rows for each value in {column} of {data}, sorted with the most common first, as from value_counts.
+    {countCache} is a dictionary, kept by the session, in which the counts are stored between calls'''
+    if column not in countCache or countCache[column][0] != len(data):
+        countCache[column] = (len(data), data[column].value_counts())
+
+    return countCache[column][1]
+
+def plottedRows(data, rows, categoryColumn, valueColumn, categories):
+    '''The {rows} of {data} that are plotted, that is those in one of the {categories} in {categoryColumn} that have a value in {valueColumn}.
+    These are the points counted in the summary from summarizeCategories'''
+    values = data.loc[rows, [categoryColumn, valueColumn]]
+    return values.index[values[categoryColumn].isin(categories) & values[valueColumn].notna()].tolist()
+
+def showIndividualPoints(numberOfPoints, requested):
+    '''True if the individual data points should be sent to the browser'''
+    return requested or numberOfPoints <= pointThreshold
+
+def summarizeCategories(data, rows, categoryColumn, valueColumn, categories, logScale = False, bins = histogramBins, summaryCache = None):
+    '''Summarize {valueColumn} for each of the {categories} in {categoryColumn}, using the {rows} of {data} that are selected.
+    Returns a dataframe with the number of points, the quartiles and the whiskers (the most extreme points within 1.5 times
+    the interquartile range from the box) for each category, and a dataframe with the histogram of each category.
+    If {summaryCache} is given, the result is stored in it and reused as long as the arguments are the same'''
+    key = (categoryColumn, valueColumn, tuple(categories), logScale, bins, _rowsKey(rows), len(data))
+    if summaryCache is not None and summaryCache.get('key') == key:
+        return summaryCache['summary'], summaryCache['histogram']
+
+    values = data.loc[rows, [categoryColumn, valueColumn]]
+    values = values[values[categoryColumn].isin(categories) & values[valueColumn].notna()]
+
+    if len(values) == 0:
+        summary = pd.DataFrame(columns = summaryColumns)
+        histogram = pd.DataFrame(columns = histogramColumns)
+    else:
+        grouped = values.groupby(categoryColumn)[valueColumn]
+        quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+        quartiles.columns = ['q1', 'median', 'q3']
+        interQuartileRange = quartiles['q3'] - quartiles['q1']
+
+        # The whiskers end at the most extreme points that are not outliers
+        category = values[categoryColumn]
+        inside = ((values[valueColumn] >= category.map(quartiles['q1'] - 1.5*interQuartileRange)) &
+                  (values[valueColumn] <= category.map(quartiles['q3'] + 1.5*interQuartileRange)))
+        insideValues = values[valueColumn].where(inside).groupby(category)
+
+        summary = quartiles
+        summary['count'] = grouped.size()
+        summary['lower'] = insideValues.min()
+        summary['upper'] = insideValues.max()
+        summary['category'] = summary.index.astype(str)
+        summary = summary.reset_index(drop = True)[summaryColumns]
+
+        histogram = _histogram(values, categoryColumn, valueColumn, logScale, bins)
+
+    if summaryCache is not None:
+        summaryCache.clear()
+        summaryCache.update({'key' : key, 'summary' : summary, 'histogram' : histogram})
+
+    return summary, histogram
+
+def addSummaryGlyphs(p, summarySource, histogramSource, color):
+    '''Draw the summaries from summarizeCategories in the figure {p}: the histograms as horizontal bars centered on each category,
+    and a box plot on top. {color} is the fill color, a color or a color mapper for the category column. Returns the renderer of the boxes'''
+    # Histograms
+    p.vbar(x = 'category', bottom = 'bottom', top = 'top', width = 'width',
+           source = histogramSource,
+           fill_color = color, fill_alpha = 0.35, line_color = None)
+
+    # Whiskers
+    p.segment(x0 = 'category', y0 = 'upper', x1 = 'category', y1 = 'q3', source = summarySource, line_color = 'black')
+    p.segment(x0 = 'category', y0 = 'lower', x1 = 'category', y1 = 'q1', source = summarySource, line_color = 'black')
+    p.rect(x = 'category', y = 'upper', width = 0.2, height = 1, height_units = 'screen', source = summarySource, line_color = 'black')
+    p.rect(x = 'category', y = 'lower', width = 0.2, height = 1, height_units = 'screen', source = summarySource, line_color = 'black')
+
+    # Boxes and medians
+    boxes = p.vbar(x = 'category', bottom = 'q1', top = 'q3', width = boxWidth,
+                   source = summarySource,
+                   fill_color = color, fill_alpha = 0.3, line_color = 'black')
+    p.rect(x = 'category', y = 'median', width = boxWidth, height = 2, height_units = 'screen', source = summarySource, fill_color = 'black', line_color = 'black')
+
+    # Hoover information for the boxes
+    p.add_tools(HoverTool(renderers = [boxes], tooltips = [
+        ('Category', '@category'),
+        ('Data points', '@count'),
+        ('Median', '@median'),
+        ('Quartiles', '@q1 - @q3'),
+        ('Whiskers', '@lower - @upper'),
+        ]))
+
+    return boxes
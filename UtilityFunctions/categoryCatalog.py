@@ -0,0 +1,156 @@
+# =============================================================================
+# categoryCatalog
+# Moduel with a process wide catalog of the categories, and how often they
+# occur, in the columns used for multiselects in the dashboards. The catalog
+# is computed once per process and is updated incrementally after uploads.
+# =============================================================================
+
+#%% Imports
+import threading
+
+import pandas as pd
+from sqlalchemy import Integer
+
+from UtilityFunctions.dataVersion import currentDataVersion
+import UtilityFunctions.dataTableClass_V5_31 as dataTable_1
+
+
+#%% The catalog. One per process
+# Keys are (column, boleanColumn). boleanColumn is None when all rows are included
+_catalog = {}
+_catalogLock = threading.RLock()
+_catalogState = {
+    'dataVersion' : None,
+    }
+
+
+#%% Functions
+def _catalogEntry(column, valueCounts):
+    '''Generate a catalog entry from a dataframe with the columns {column} and count'''
+    # Integer columns with empty cells are read as floats in the grouping query. Restore the type if there are no empty cells
+    columnType = dataTable_1.perovskitedata.__table__.columns[column].type if column in dataTable_1.perovskitedata.__table__.columns else None
+    if isinstance(columnType, Integer) and valueCounts[column].notna().all():
+        valueCounts[column] = valueCounts[column].astype('int64')
+
+    valueCounts = valueCounts.reset_index(drop = True)
+
+    entry = {
+        'counts' : valueCounts,
+        # All unique values in alphabetic order
+        'unique' : list(valueCounts[column].sort_values()),
+        # All unique values in order of occurance
+        'byFrequency' : list(valueCounts.sort_values(by = 'count', ascending = False)[column]),
+        }
+
+    return entry
+
+def _checkDataVersion():
+    '''Empty the catalog if another process has changed the data in the database'''
+    version = currentDataVersion()
+    if version != _catalogState['dataVersion']:
+        _catalog.clear()
+        _catalogState['dataVersion'] = version
+
+def _readValueCounts(columns, boleanColumn, engine):
+    '''Read the value counts for all {columns} from the database in one query using grouping sets'''
+    # Database details. Imported here to avoid a circular import
+    from UtilityFunctions.utilityFunctions import database_details
+    bd_details = database_details()
+    table = bd_details['table']
+    schema = bd_details['schema']
+
+    # String maipulation to get it to work with the sql statement
+    columnsString = ', '.join(f'"{c}"' for c in columns)
+    groupingString = ', '.join(f'GROUPING("{c}") as "grouping_{i}"' for i, c in enumerate(columns))
+    groupingSetsString = ', '.join(f'("{c}")' for c in columns)
+
+    query = f'select {columnsString}, {groupingString}, count(*) as "catalog_count" from {schema}.{table}'
+    if boleanColumn is not None:
+        query += f' where {table}."{boleanColumn}" is TRUE'
+    query += f' GROUP BY GROUPING SETS ({groupingSetsString})'
+
+    # Query the database. Coresponds to pd.values_count() for each column
+    result = pd.read_sql_query(sql = query, con = engine)
+
+    # Split the result into one set of value counts per column
+    valueCounts = {}
+    for i, column in enumerate(columns):
+        rows = result[result[f'grouping_{i}'] == 0]
+        valueCounts[column] = pd.DataFrame({column : rows[column].values, 'count' : rows['catalog_count'].values})
+
+    return valueCounts
+
+def addToCategoryCatalog(newData, previousDataVersion, dataVersion):
+    '''Update the catalog with the rows in {newData} that just have been added to the database.
+    {previousDataVersion} and {dataVersion} are the data versions before and after the upload'''
+    with _catalogLock:
+        # If the catalog already was out of date it can not be updated incrementally
+        if _catalogState['dataVersion'] != previousDataVersion:
+            _catalog.clear()
+
+        for (column, boleanColumn) in list(_catalog.keys()):
+            if column not in newData.columns:
+                del _catalog[(column, boleanColumn)]
+                continue
+
+            # Rows that should be included
+            rows = newData
+            if boleanColumn is not None:
+                if boleanColumn not in newData.columns:
+                    del _catalog[(column, boleanColumn)]
+                    continue
+                rows = newData[newData[boleanColumn] == True]
+
+            # Empty cells are stored as None in the catalog as that is how they are read from the database
+            newValues = rows[column].astype(object).where(rows[column].notna(), None)
+            newCounts = newValues.value_counts(dropna = False).rename_axis(column).reset_index(name = 'count')
+
+            # Add the new counts to the old ones
+            valueCounts = pd.concat([_catalog[(column, boleanColumn)]['counts'], newCounts], ignore_index = True)
+            valueCounts = valueCounts.groupby(column, dropna = False, sort = False)['count'].sum().reset_index()
+            valueCounts[column] = valueCounts[column].astype(object).where(valueCounts[column].notna(), None)
+
+            _catalog[(column, boleanColumn)] = _catalogEntry(column, valueCounts)
+
+        # The catalog is now in sync with the database
+        _catalogState['dataVersion'] = dataVersion
+
+def categoryCatalogEntry(column, engine, boleanColumn = None):
+    '''Returns the catalog entry for the column {column}. If {boleanColumn} is given, only rows where that column is true are included'''
+    with _catalogLock:
+        _checkDataVersion()
+
+        if (column, boleanColumn) not in _catalog:
+            warmCategoryCatalog([column], engine = engine, boleanColumn = boleanColumn)
+
+        entry = _catalog[(column, boleanColumn)]
+
+    return entry
+
+def removeFromCategoryCatalog(columns, previousDataVersion, dataVersion):
+    '''Remove the entries depending on any of the {columns} from the catalog. Used when single values have been corrected in the database.
+    {previousDataVersion} and {dataVersion} are the data versions before and after the correction'''
+    with _catalogLock:
+        # If the catalog already was out of date, all entries must be recomputed
+        if _catalogState['dataVersion'] != previousDataVersion:
+            _catalog.clear()
+
+        for (column, boleanColumn) in list(_catalog.keys()):
+            if column in columns or boleanColumn in columns:
+                del _catalog[(column, boleanColumn)]
+
+        # The catalog is now in sync with the database
+        _catalogState['dataVersion'] = dataVersion
+
+def warmCategoryCatalog(columns, engine, boleanColumn = None):
+    '''Compute the catalog entries for all {columns} not already in the catalog. All columns are read in one pass over the table'''
+    with _catalogLock:
+        _checkDataVersion()
+
+        missingColumns = [column for column in dict.fromkeys(columns) if (column, boleanColumn) not in _catalog]
+
+        if len(missingColumns) > 0:
+            valueCounts = _readValueCounts(missingColumns, boleanColumn, engine)
+
+            for column in missingColumns:
+                _catalog[(column, boleanColumn)] = _catalogEntry(column, valueCounts[column])
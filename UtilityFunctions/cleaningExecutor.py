@@ -0,0 +1,107 @@
+# =============================================================================
+# cleaningExecutor
+# Moduel for running the cleaning functions on the columns of an uploaded data
+# template. The columns are independent of each other, so for large uploads
+# they are cleaned in parallel in a pool of processes. Small uploads are
+# cleaned in this process, where starting the pool would take longer than the
+# cleaning itself.
+#
+# The work is described by a registry, a dictionary from each column in the
+# cleaned data to (column in the data template, cleaning function, keyword
+# arguments, default value). If a column is missing or can not be cleaned,
+# the default value is used, exactly as when the columns were cleaned one by
+# one. Since the registry is an ordinary dictionary, the columns in the
+# result are in the same order as in the registry.
+# =============================================================================
+
+#%% Imports
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import multiprocessing
+import os
+import time
+
+import pandas as pd
+
+
+#%% Parameters
+# Uploads with fewer rows than this are cleaned in this process
+parallelRowLimit = 5000
+
+
+#%% Helper functions
+def cleaningProcesses():
+    '''Number of processes used for cleaning. Set by the environment variable CLEANING_PROCESSES, by default the number of cpus'''
+    try:
+        processes = int(os.getenv('CLEANING_PROCESSES', os.cpu_count() or 1))
+    except ValueError:
+        processes = os.cpu_count() or 1
+
+    return max(processes, 1)
+
+def todaysDate():
+    '''Todays date. Default value for the publication date'''
+    return pd.to_datetime(datetime.now().strftime('%Y-%m-%d'))
+
+def cleanColumn(function, values, keywords):
+    '''Clean one column. Returns the cleaned values, the error message (None if there was no error) and the time it took in seconds.
+    Runs in the worker processes, so the exception is returned as a string rather than raised'''
+    start = time.perf_counter()
+    try:
+        cleanedValues = function(values, **keywords)
+        if isinstance(cleanedValues, pd.Series):
+            cleanedValues = cleanedValues.values
+        if len(cleanedValues) != len(values):
+            raise ValueError(f'{len(cleanedValues)} values returned for {len(values)} rows')
+        error = None
+    except Exception as e:
+        cleanedValues = None
+        error = f'{type(e).__name__}: {e}'
+
+    return cleanedValues, error, time.perf_counter() - start
+
+
+#%% Functions
+def cleanColumns(userData, registry, processes = None):
+    '''Clean the columns in {userData} with the functions in {registry}. Returns a datafram with the cleaned data,
+    and a datafram, indexed by the cleaned columns, with the error message and the time in seconds for each column.
+    {processes} is the number of processes to use. By default cleaningProcesses(), or 1 for uploads with fewer rows than parallelRowLimit'''
+    if processes is None:
+        processes = cleaningProcesses() if len(userData) >= parallelRowLimit else 1
+
+    results = {}
+    work = {}
+    for column, (templateColumn, function, keywords, default) in registry.items():
+        if templateColumn in userData.columns:
+            work[column] = (function, userData[templateColumn], keywords)
+        else:
+            results[column] = (None, f'Column {templateColumn} is missing', 0.0)
+
+    if processes > 1 and len(work) > 1:
+        # Spawned processes do not inherit threads and conections from the server
+        with ProcessPoolExecutor(max_workers = processes, mp_context = multiprocessing.get_context('spawn')) as executor:
+            futures = {column : executor.submit(cleanColumn, *arguments) for column, arguments in work.items()}
+            for column, future in futures.items():
+                try:
+                    results[column] = future.result()
+                except Exception:
+                    # E.g. if the cleaned values can not be pickled. Try again in this process
+                    results[column] = cleanColumn(*work[column])
+    else:
+        for column, arguments in work.items():
+            results[column] = cleanColumn(*arguments)
+
+    # Use the default value for columns that could not be cleaned
+    data = {}
+    report = {}
+    for column, (templateColumn, function, keywords, default) in registry.items():
+        cleanedValues, error, seconds = results[column]
+        if error is not None:
+            cleanedValues = default() if callable(default) else default
+        data[column] = cleanedValues
+        report[column] = {'error' : error, 'seconds' : seconds}
+
+    data = pd.DataFrame(data, index = pd.RangeIndex(len(userData)))
+    report = pd.DataFrame.from_dict(report, orient = 'index', columns = ['error', 'seconds'])
+
+    return data, report
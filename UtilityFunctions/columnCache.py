@@ -0,0 +1,192 @@
+# =============================================================================
+# columnCache
+# Moduel with a process wide store of data columns read from the database.
+# Each column is fetched once and then shared, read only, by all sessions
+# running in the same bokeh process.
+# =============================================================================
+
+#%% Imports
+from collections import OrderedDict
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from UtilityFunctions.dataVersion import bumpDataVersion, currentDataVersion
+
+
+#%% The cache. One per process
+_columns = OrderedDict()
+_columnSizes = {}
+# Converted versions of cached columns. Keys are (column, conversion)
+_convertedColumns = {}
+# Other columns used by a conversion, {(column, conversion) : set of columns}
+_convertedDependencies = {}
+_cacheLock = threading.RLock()
+_cacheState = {
+    'dataVersion' : None,
+    'bytes' : 0,
+    'hits' : 0,
+    'misses' : 0,
+    'evictions' : 0,
+    }
+
+
+#%% Functions
+def _checkDataVersion():
+    '''Empty the cache if another process has changed the data in the database'''
+    version = currentDataVersion()
+    if version != _cacheState['dataVersion']:
+        _clear()
+        _cacheState['dataVersion'] = version
+
+def _clear():
+    '''Remove all columns from the cache'''
+    _columns.clear()
+    _columnSizes.clear()
+    _convertedColumns.clear()
+    _convertedDependencies.clear()
+    _cacheState['bytes'] = 0
+
+def _evict(protectedColumns):
+    '''Remove the least recently used columns until the cache is within its size limit'''
+    maxBytes = columnCacheMaxBytes()
+
+    for column in list(_columns.keys()):
+        if _cacheState['bytes'] <= maxBytes:
+            break
+
+        if column in protectedColumns:
+            continue
+
+        del _columns[column]
+        _cacheState['bytes'] -= _columnSizes.pop(column)
+        _cacheState['evictions'] += 1
+        _removeConvertedColumns(column)
+
+def _store(column, series):
+    '''Add a column to the cache and make its data read only'''
+    # Reset the index without copying the data, which may be memory mapped from the data snapshot
+    series = pd.Series(series.values, name = series.name)
+
+    # Make the underlying array read only so that no session can change data shared with the other sessions
+    values = series.values
+    if isinstance(values, np.ndarray):
+        values.flags.writeable = False
+
+    # Replace an old version of the column
+    if column in _columns:
+        _cacheState['bytes'] -= _columnSizes.pop(column)
+        _removeConvertedColumns(column)
+
+    _columns[column] = series
+    _columnSizes[column] = int(series.memory_usage(index = False, deep = True))
+    _cacheState['bytes'] += _columnSizes[column]
+
+def _removeConvertedColumns(column):
+    '''Remove all converted versions of {column}, and all conversions that depend on it'''
+    for key in [key for key in _convertedColumns if key[0] == column or column in _convertedDependencies.get(key, ())]:
+        _cacheState['bytes'] -= _columnSizes.pop(key)
+        del _convertedColumns[key]
+        _convertedDependencies.pop(key, None)
+
+def columnCacheInfo():
+    '''Returns a dictionary with statistics for the column cache in this process'''
+    with _cacheLock:
+        info = dict(_cacheState)
+        info['columns'] = list(_columns.keys())
+        info['convertedColumns'] = list(_convertedColumns.keys())
+        info['maxBytes'] = columnCacheMaxBytes()
+
+    return info
+
+def columnCacheMaxBytes():
+    '''The maximum size of the cache in bytes. Set by the environment variable COLUMN_CACHE_MAX_MB'''
+    try:
+        maxMegaBytes = float(os.getenv('COLUMN_CACHE_MAX_MB', 1024))
+    except ValueError:
+        maxMegaBytes = 1024
+
+    return int(maxMegaBytes * 1024 * 1024)
+
+def getConvertedColumn(values, column, conversion, convert, dependsOn = None):
+    '''Returns convert({values}), where {values} is the column {column} and {conversion} a name identifying {convert}.
+    {dependsOn} is a dictionary, {column : values}, with other columns that {convert} uses.
+    If {values} and the columns in {dependsOn} are held in the cache, the result is computed once per process and is read only.
+    It is then removed from the cache when any of the columns is replaced'''
+    if dependsOn is None:
+        dependsOn = {}
+
+    with _cacheLock:
+        columns = {column : values, **dependsOn}
+        cachedValues = {name : _columns.get(name) for name in columns}
+
+        # Only data shared with the cache can be trusted to be unchanged
+        isCachedColumn = all(cachedValues[name] is not None and len(columns[name]) == len(cachedValues[name]) and np.may_share_memory(np.asarray(columns[name].values), np.asarray(cachedValues[name].values)) for name in columns)
+        key = (column, conversion)
+
+        if isCachedColumn and key in _convertedColumns:
+            _cacheState['hits'] += 1
+            return pd.Series(_convertedColumns[key], index = values.index, name = values.name, copy = False)
+
+    converted = np.asarray(convert(values))
+
+    if isCachedColumn:
+        converted.flags.writeable = False
+        with _cacheLock:
+            # The columns may have been replaced by another session while the conversion was running
+            if all(_columns.get(name) is cachedValues[name] for name in cachedValues):
+                _cacheState['misses'] += 1
+                _convertedColumns[key] = converted
+                _convertedDependencies[key] = set(dependsOn)
+                _columnSizes[key] = int(pd.Series(converted).memory_usage(index = False, deep = True))
+                _cacheState['bytes'] += _columnSizes[key]
+
+    return pd.Series(converted, index = values.index, name = values.name, copy = False)
+
+def getColumns(dataColumns, fetchColumns, key = 'Ref_ID'):
+    '''Returns a dataframe with the columns in {dataColumns}. Columns not already in the cache are read with {fetchColumns},
+    a function that takes a list of columns and returns them as a dataframe ordered by the column {key}.
+    The returned dataframe shares its data with the cache and the data can thus not be changed in place'''
+    dataColumns = list(dict.fromkeys(dataColumns))
+
+    with _cacheLock:
+        _checkDataVersion()
+
+        # Columns that must be read from the database
+        missingColumns = [column for column in dataColumns if column not in _columns]
+        _cacheState['hits'] += len(dataColumns) - len(missingColumns)
+        _cacheState['misses'] += len(missingColumns)
+
+        if len(missingColumns) > 0:
+            # The key column is always included to ensure that new columns are aligned with the ones already in the cache
+            columnsToFetch = list(dict.fromkeys(missingColumns + [key]))
+            newData = fetchColumns(columnsToFetch)
+
+            # If the rows in the database have changed since the cache was filled, start over
+            if key in _columns and not _columns[key].equals(newData[key].reset_index(drop = True)):
+                _clear()
+                newData = fetchColumns(list(dict.fromkeys(dataColumns + [key])))
+
+            for column in newData.columns:
+                _store(column, newData[column])
+
+        # Mark the requested columns as recently used
+        for column in dataColumns:
+            _columns.move_to_end(column)
+
+        data = pd.DataFrame({column : _columns[column] for column in dataColumns}, copy = False)
+
+        # Keep the cache within its size limit
+        _evict(protectedColumns = set(dataColumns + [key]))
+
+    return data
+
+def invalidateColumnCache():
+    '''Empty the cache in this process and signal to all other processes that the data in the database has changed. Returns the new data version'''
+    with _cacheLock:
+        _clear()
+        _cacheState['dataVersion'] = bumpDataVersion()
+
+    return _cacheState['dataVersion']
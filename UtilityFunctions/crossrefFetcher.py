@@ -0,0 +1,159 @@
+# =============================================================================
+# crossrefFetcher
+# Moduel for downloading reference data from CrossRef for many DOI numbers at
+# the time. The requests are made from a pool of threads, with a limit on the
+# number of requests per second shared by all threads. The limit is lowered if
+# CrossRef asks for it in the X-Rate-Limit headers. Requests that fail because
+# of the conection, rate limiting or server errors are retried with increasing
+# waiting time. DOI numbers CrossRef does not know are reported as failed.
+#
+# The url of the api can be set with the environment variable CROSSREF_API_URL,
+# e.g. to the local stub server in crossrefStubServer, whose
+# run_testCrossrefFetcher checks the retries and the rate limiting.
+# =============================================================================
+
+#%% Imports
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+import time
+from urllib.parse import quote
+
+from crossref.restful import Etiquette
+import requests
+
+
+#%% Parameters
+# CrossRef etiquette. Identifies the application in the user-agent header
+etiquette = Etiquette('Perovskite solar', 'version 1', '', 'jacobsson.jesper.work@gmail.com')
+
+# Number of times a request is retried, and the waiting time before the first retry in seconds. The waiting time is doubled for each retry
+retries = 4
+backoff = 1
+
+# Seconds before a request times out
+requestTimeout = 30
+
+# Status codes worth retrying
+retryStatusCodes = {429, 500, 502, 503, 504}
+
+
+#%% Helper functions
+def crossrefApiUrl():
+    '''Url of the CrossRef api. Set by the environment variable CROSSREF_API_URL'''
+    return os.getenv('CROSSREF_API_URL', 'https://api.crossref.org').rstrip('/')
+
+def fetchConcurrency():
+    '''Number of simultaneous requests. Set by the environment variable CROSSREF_CONCURRENCY'''
+    try:
+        return max(int(os.getenv('CROSSREF_CONCURRENCY', 5)), 1)
+    except ValueError:
+        return 5
+
+def fetchRate():
+    '''Maximum number of requests per second. Set by the environment variable CROSSREF_REQUESTS_PER_SECOND'''
+    try:
+        return max(float(os.getenv('CROSSREF_REQUESTS_PER_SECOND', 10)), 0.1)
+    except ValueError:
+        return 10
+
+
+#%% Helper classes
+class RateLimiter:
+    '''Spaces the requests from all threads so that there are at most {rate} requests per second'''
+    def __init__(self, rate):
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._nextTime = time.monotonic()
+
+    def wait(self):
+        '''Wait until the next request can be made'''
+        with self._lock:
+            now = time.monotonic()
+            waitTime = self._nextTime - now
+            self._nextTime = max(self._nextTime, now) + 1/self.rate
+
+        if waitTime > 0:
+            time.sleep(waitTime)
+
+    def pause(self, seconds):
+        '''No requests are made for {seconds} seconds, e.g. after CrossRef has asked us to slow down'''
+        with self._lock:
+            self._nextTime = max(self._nextTime, time.monotonic() + seconds)
+
+    def update(self, headers):
+        '''Lower the rate if the X-Rate-Limit headers from CrossRef allow fewer requests than the current rate'''
+        try:
+            limit = float(headers['X-Rate-Limit-Limit'])
+            interval = float(headers['X-Rate-Limit-Interval'].rstrip('s'))
+        except (KeyError, ValueError, AttributeError):
+            return
+
+        if limit > 0 and interval > 0:
+            with self._lock:
+                self.rate = min(self.rate, limit/interval)
+
+
+#%% Functions
+def fetchDOI(DOI, session, rateLimiter):
+    '''Download the CrossRef metadata for {DOI}. Returns the metadata and None, or None and the reason it failed'''
+    url = f'{crossrefApiUrl()}/works/{quote(DOI, safe = "/")}'
+
+    for attempt in range(retries + 1):
+        rateLimiter.wait()
+        try:
+            response = session.get(url, timeout = requestTimeout)
+        except requests.RequestException as e:
+            error = f'{type(e).__name__}: {e}'
+        else:
+            rateLimiter.update(response.headers)
+
+            if response.status_code == 200:
+                try:
+                    return response.json()['message'], None
+                except (ValueError, KeyError, TypeError):
+                    return None, 'Not valid json from CrossRef'
+            elif response.status_code == 404:
+                return None, 'Not found at CrossRef'
+            elif response.status_code not in retryStatusCodes:
+                return None, f'Status code {response.status_code}'
+
+            error = f'Status code {response.status_code}'
+
+            # CrossRef may tell how long to wait
+            try:
+                rateLimiter.pause(float(response.headers['Retry-After']))
+            except (KeyError, ValueError):
+                pass
+
+        if attempt < retries:
+            time.sleep(backoff * 2**attempt)
+
+    return None, error
+
+def fetchCrossrefMetadata(DOIs, concurrency = None, rate = None):
+    '''Download the CrossRef metadata for all DOI numbers in {DOIs}. Yields (DOI, metadata, error) as the downloads are finished.
+    metadata is None and error the reason if the download failed. {concurrency} is the number of simultaneous requests, by default fetchConcurrency(),
+    and {rate} the maximum number of requests per second, by default fetchRate()'''
+    DOIs = list(dict.fromkeys(DOIs))
+    if len(DOIs) == 0:
+        return
+
+    concurrency = fetchConcurrency() if concurrency is None else concurrency
+    rateLimiter = RateLimiter(fetchRate() if rate is None else rate)
+
+    with requests.Session() as session:
+        session.headers.update({'user-agent' : str(etiquette)})
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize = concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        with ThreadPoolExecutor(max_workers = concurrency) as executor:
+            futures = {executor.submit(fetchDOI, DOI, session, rateLimiter) : DOI for DOI in DOIs}
+            for future in as_completed(futures):
+                try:
+                    metaData, error = future.result()
+                except Exception as e:
+                    metaData, error = None, f'{type(e).__name__}: {e}'
+
+                yield futures[future], metaData, error
@@ -0,0 +1,179 @@
+# =============================================================================
+# crossrefStubServer
+# Moduel with a local stand in for the CrossRef api, used for checking
+# crossrefFetcher without any requests to CrossRef. Each DOI is given a list of
+# responses that the server returns in order, one per request, e.g. a 503
+# followed by a 200, and the server records when each request arrived and how
+# many requests were handled at the same time.
+#
+# run_testCrossrefFetcher points crossrefFetcher at the stub server and checks
+# the retries, the backoff, the rate limiting and the handling of failures.
+# =============================================================================
+
+#%% Imports
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import threading
+import time
+from urllib.parse import unquote
+
+import UtilityFunctions.crossrefFetcher as crossrefFetcher
+
+
+#%% Helper functions
+def response(status = 200, headers = None, delay = 0, body = None):
+    '''One scripted response from the stub server. A 200 without a {body} returns CrossRef like metadata for the DOI.
+    {delay} is the time in seconds the server waits before answering'''
+    return {'status' : status, 'headers' : headers or {}, 'delay' : delay, 'body' : body}
+
+def metadataFor(DOI):
+    '''The metadata returned for {DOI} by a 200 response'''
+    return {'DOI' : DOI, 'title' : [f'Title of {DOI}'], 'type' : 'journal-article'}
+
+
+#%% Helper classes
+class CrossrefStubServer:
+    '''Local http server answering /works/{DOI} with the responses scripted in {responses}, {DOI : list of responses}.
+    DOIs not in {responses} get a 200. When the list for a DOI is used up, its last response is repeated.
+    Use as a context manager. The url of the server is in self.url'''
+    def __init__(self, responses = None):
+        self.responses = {DOI : list(items) for DOI, items in (responses or {}).items()}
+        self.requests = {}
+        self.activeRequests = 0
+        self.maxActiveRequests = 0
+        self._lock = threading.Lock()
+
+        stub = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def __enter__(self):
+        threading.Thread(target = self._server.serve_forever, daemon = True).start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def requestTimes(self, DOI):
+        '''The times, from time.monotonic, when the requests for {DOI} arrived'''
+        with self._lock:
+            return list(self.requests.get(DOI, []))
+
+    def _handle(self, handler):
+        '''Answer one request with the next scripted response for the DOI'''
+        DOI = unquote(handler.path[len('/works/'):]) if handler.path.startswith('/works/') else None
+
+        with self._lock:
+            self.requests.setdefault(DOI, []).append(time.monotonic())
+            self.activeRequests += 1
+            self.maxActiveRequests = max(self.maxActiveRequests, self.activeRequests)
+            items = self.responses.get(DOI, [])
+            item = items.pop(0) if len(items) > 1 else (items[0] if len(items) == 1 else response())
+
+        try:
+            time.sleep(item['delay'])
+
+            body = item['body']
+            if body is None:
+                body = json.dumps({'status' : 'ok', 'message' : metadataFor(DOI)}) if item['status'] == 200 else 'Resource not found.'
+
+            handler.send_response(item['status'])
+            for key, value in item['headers'].items():
+                handler.send_header(key, value)
+            handler.send_header('Content-Length', str(len(body.encode('utf-8'))))
+            handler.end_headers()
+            handler.wfile.write(body.encode('utf-8'))
+        finally:
+            with self._lock:
+                self.activeRequests -= 1
+
+
+#%% Functions
+def run_testCrossrefFetcher():
+    '''Check crossrefFetcher against the stub server: successful downloads, retries of 503 and 429, Retry-After,
+    the exponential backoff, the X-Rate-Limit headers, the concurrency limit, 404, invalid json, a permanent 500 and a server that is down.
+    Raises an AssertionError if something is wrong'''
+    # Short waiting times so that the check runs in a few seconds
+    oldSettings = (crossrefFetcher.backoff, crossrefFetcher.requestTimeout, os.environ.get('CROSSREF_API_URL'))
+    crossrefFetcher.backoff = 0.1
+    crossrefFetcher.requestTimeout = 5
+
+    goodDOIs = [f'10.1000/good.{i}' for i in range(12)]
+    responses = {
+        '10.1000/retry-503' : [response(503), response(503), response(200)],
+        '10.1000/retry-after' : [response(429, headers = {'Retry-After' : '1'}), response(200)],
+        '10.1000/missing' : [response(404)],
+        '10.1000/not-json' : [response(200, body = 'not json')],
+        '10.1000/down' : [response(500)],
+        }
+    for DOI in goodDOIs:
+        responses[DOI] = [response(delay = 0.05)]
+
+    try:
+        # Successful downloads, retries and failures
+        with CrossrefStubServer(responses) as server:
+            os.environ['CROSSREF_API_URL'] = server.url
+            results = {DOI : (metaData, error) for DOI, metaData, error in crossrefFetcher.fetchCrossrefMetadata(goodDOIs + list(responses), concurrency = 3, rate = 100)}
+
+            for DOI in goodDOIs:
+                assert results[DOI] == (metadataFor(DOI), None), f'{DOI} was not downloaded: {results[DOI]}'
+                assert len(server.requestTimes(DOI)) == 1, f'{DOI} was requested more than once'
+            assert server.maxActiveRequests <= 3, f'{server.maxActiveRequests} simultaneous requests with a concurrency of 3'
+
+            # 503 is retried with a backoff that doubles for each retry
+            assert results['10.1000/retry-503'] == (metadataFor('10.1000/retry-503'), None), results['10.1000/retry-503']
+            times = server.requestTimes('10.1000/retry-503')
+            assert len(times) == 3, f'503 was requested {len(times)} times'
+            assert times[1] - times[0] >= crossrefFetcher.backoff and times[2] - times[1] >= 2*crossrefFetcher.backoff, 'The backoff was not respected'
+
+            # 429 is retried after the time in Retry-After
+            assert results['10.1000/retry-after'] == (metadataFor('10.1000/retry-after'), None), results['10.1000/retry-after']
+            times = server.requestTimes('10.1000/retry-after')
+            assert len(times) == 2 and times[1] - times[0] >= 1, 'Retry-After was not respected'
+
+            # 404 and invalid json fail at once
+            assert results['10.1000/missing'] == (None, 'Not found at CrossRef'), results['10.1000/missing']
+            assert len(server.requestTimes('10.1000/missing')) == 1, '404 was retried'
+            assert results['10.1000/not-json'] == (None, 'Not valid json from CrossRef'), results['10.1000/not-json']
+
+            # A permanent server error gives up after all retries
+            assert results['10.1000/down'] == (None, 'Status code 500'), results['10.1000/down']
+            assert len(server.requestTimes('10.1000/down')) == crossrefFetcher.retries + 1, 'A permanent 500 was not retried the expected number of times'
+        print('Downloads, retries, backoff, Retry-After and failures: ok')
+
+        # The rate is lowered to what the X-Rate-Limit headers allow
+        rateDOIs = [f'10.1000/rate.{i}' for i in range(6)]
+        headers = {'X-Rate-Limit-Limit' : '5', 'X-Rate-Limit-Interval' : '1s'}
+        with CrossrefStubServer({DOI : [response(headers = headers)] for DOI in rateDOIs}) as server:
+            os.environ['CROSSREF_API_URL'] = server.url
+            results = list(crossrefFetcher.fetchCrossrefMetadata(rateDOIs, concurrency = 1, rate = 100))
+            assert all(error is None for DOI, metaData, error in results), results
+
+            times = sorted(time for DOI in rateDOIs for time in server.requestTimes(DOI))
+            gaps = [later - earlier for earlier, later in zip(times[0:-1], times[1:])]
+            assert min(gaps[1:]) >= 0.9/5, f'The X-Rate-Limit headers were not respected, the shortest time between requests was {min(gaps[1:]):.3f} s'
+        print('X-Rate-Limit: ok')
+
+        # Conection errors are retried and reported
+        with CrossrefStubServer() as server:
+            url = server.url
+        os.environ['CROSSREF_API_URL'] = url
+        results = list(crossrefFetcher.fetchCrossrefMetadata(['10.1000/no-server'], rate = 100))
+        assert results[0][1] is None and results[0][2].startswith('ConnectionError'), results
+        print('Conection errors: ok')
+    finally:
+        crossrefFetcher.backoff, crossrefFetcher.requestTimeout, apiUrl = oldSettings
+        if apiUrl is None:
+            os.environ.pop('CROSSREF_API_URL', None)
+        else:
+            os.environ['CROSSREF_API_URL'] = apiUrl
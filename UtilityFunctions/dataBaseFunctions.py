@@ -12,33 +12,42 @@ import shutil
 import datetime
 
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import text
 from sqlalchemy.schema import CreateSchema
 
 from ConectionDetails.databaseConfiguration import databaseConfiguration
 
+from UtilityFunctions.bulkInsert import copyToDatabase
 import UtilityFunctions.dataColumns as dataColumns
+from UtilityFunctions.engineRegistry import getEngine
 import UtilityFunctions.dataTableClass_V5_31 as dataTable_1
 
 
+#%% Parameters
+# Strings read as missing values by pandas.read_csv
+csvMissingValues = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'n/a', 'nan', 'null']
+
+
 #%% Functions
 def conectToDataBase():
-    '''Conect to the database'''
-
-    # Reading in configuration details for accessing the database
-    dbConfig = databaseConfiguration()
+    '''Conect to the database. The engine is shared by all sessions in the process'''
+    # All sessions in the process share one engine and its conection pool
+    engine = getEngine()
 
-    # The conection string to the Postgres database
-    conection_string = 'postgresql+psycopg2://' + dbConfig['user'] + ':' + dbConfig['password'] + '@' + dbConfig['host'] + '/' + dbConfig['database']
+    return engine
 
-    # Conect to the database
-    try:
-        engine = create_engine(conection_string)
-        print(f"Connection to {dbConfig['host']} established")
-    except:
-        print(f"Conection to {dbConfig['host']} failed")
+def createIndexes(engine, tableClass):
+    '''Create the indexes defined for {tableClass} that do not excist in the database, e.g. after a new index has been added to an existing table'''
+    for index in tableClass.__table__.indexes:
+        try:
+            index.create(engine, checkfirst = True)
+            print(f"Index {index.name} is in place")
+        except Exception as e:
+            print(f"Unable to create the index {index.name}: {e}")
 
-    return engine
+    # Update the statistics used by the query planner
+    with engine.begin() as connection:
+        connection.execute(text(f'analyze {tableClass.__table__.fullname}'))
 
 def createTables(engine, nameOfDatabase, tableClass):
     ''' Create tables in the database {nameOfDatabase} Use the engine {engine}. 
@@ -61,18 +70,26 @@ def csvToDatabase(filePath, table, engine, schema):
     else:
         userData = pd.read_excel(filePath)
 
+    return dataFrameToDatabase(userData, table = table, engine = engine, schema = schema)
+
+def dataFrameToDatabase(userData, table, engine, schema):
+    '''Read in a datafram with compleated data to the database. Returns the uploaded data with the database IDs'''
+    userData = userData.copy()
+
     # Name the data columns to match the header in the database. A safeguard against misspellings 
     userData.columns = dataColumns.csv_data_columns_complet()
 
+    # Text that pandas reads as missing values from a csv file, e.g. empty strings and 'nan', is stored as null, as when the data was uploaded from file
+    for column in userData.columns[userData.dtypes == object]:
+        userData[column] = userData[column].mask(userData[column].isin(csvMissingValues))
+
     # Due to an incomprehensible effect making only one of the boolean columns a floating point column
     userData['Perovskite_dimension_3D'] = userData['Perovskite_dimension_3D'].astype('bool')
 
-    # Update the Ref_ID column
-    ref_id = update_Ref_ID(userData, table = table, schema = schema, engine = engine)
-    userData['Ref_ID'] = ref_id
+    # Insert data into the database. Checked against the table class and copied in one transaction, in which the new Ref_ID numbers are allocated
+    userData['Ref_ID'] = copyToDatabase(userData, table = table, engine = engine, schema = schema, keyColumn = 'Ref_ID')
 
-    # Insert data into the database
-    userData.to_sql(table, con=engine, schema = schema, if_exists='append', index=False)
+    return userData
 
 def defaultFilePathsWithRootFolder(root):
     '''Predifined file paths '''
@@ -202,6 +219,13 @@ def run_createNewTables(schema):
     # Create the tables specified in tableClass under the specified schema
     createTables(engine = engine, nameOfDatabase = dbConfig['database'], tableClass = dataTable_1.perovskitedata)
 
+def run_createIndexes():
+    '''Create missing indexes on the main table. Run once on an existing database when indexes have been added to the table class'''
+    # Conect to database
+    engine = conectToDataBase() 
+
+    createIndexes(engine = engine, tableClass = dataTable_1.perovskitedata)
+
 def run_csvToDatabase(filePath, table, schema):
     '''Upload data in file to database'''
     # Conect to database
@@ -246,20 +270,3 @@ def uniqueFilename(filename, savePath):
         uniqueName = filename.split('.xlsx')[0] + '_v' + str(i) + '.xlsx'
 
     return uniqueName
-
-def update_Ref_ID(userData, table, schema, engine):
-    '''Identifies the higest ID number in the database, and  start to counts from that'''
-
-    # Read in reference data from the database
-    data = readDataFromDatabase(engine = engine, table = table, schema = schema, dataColumns = ['Ref_ID'])
-
-    if len(data) == 0:
-        startID = 1
-    else:
-        startID = max(data['Ref_ID']) + 1
-
-    # New database ID counting upwards from the higest previous database ID
-    ref_id = list(range(startID, startID + len(userData)))
-
-    return ref_id
-
@@ -0,0 +1,231 @@
+# =============================================================================
+# dataSnapshot
+# Moduel for a columnar snapshot of the main data table on disk. Every column
+# is stored in its own uncompressed Arrow IPC file so that the dashboards can
+# memory map only the columns they need, without a round trip to the database.
+#
+# The snapshot is tagged with the data version it was exported at and is only
+# used when that version is the current one. Otherwise, or if pyarrow is not
+# installed, the data is read from the database as before.
+# =============================================================================
+
+#%% Imports
+import json
+import os
+import shutil
+import threading
+import uuid
+
+import pandas as pd
+from sqlalchemy import Boolean, Date, Float, Integer
+
+from UtilityFunctions.dataVersion import currentDataVersion
+import UtilityFunctions.dataTableClass_V5_31 as dataTable_1
+
+# pyarrow is optional. Without it the snapshot is simply not used
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+
+#%% Parameters
+# Number of columns read from the database in each query when the snapshot is exported
+exportBatchSize = 50
+
+# State for background rebuilds of the snapshot. One per process
+_rebuildLock = threading.Lock()
+_rebuildState = {
+    'running' : False,
+    'pending' : False,
+    }
+
+
+#%% Functions
+def snapshotFolderPath():
+    '''Returns the path to the folder holding the snapshots. Placed next to the data version marker in the shared uploads folder'''
+    root = os.path.abspath(os.getcwd())
+
+    return os.path.join(root, 'uploads', 'snapshot')
+
+def _currentSnapshotPath():
+    '''Returns the path to the folder with the current snapshot, or None if there is no snapshot'''
+    try:
+        with open(os.path.join(snapshotFolderPath(), 'current.txt'), 'r') as file:
+            name = file.read().strip()
+    except OSError:
+        return None
+
+    return os.path.join(snapshotFolderPath(), name) if name != '' else None
+
+def _readManifest(snapshotPath):
+    '''Returns the manifest of the snapshot in {snapshotPath}, or None if it can not be read'''
+    try:
+        with open(os.path.join(snapshotPath, 'manifest.json'), 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def arrowType(column):
+    '''Returns the Arrow type matching the type of {column} in the perovskitedata table class'''
+    columnType = dataTable_1.perovskitedata.__table__.columns[column].type
+    if isinstance(columnType, Boolean):
+        return pa.bool_()
+    elif isinstance(columnType, Integer):
+        return pa.int64()
+    elif isinstance(columnType, Float):
+        return pa.float64()
+    elif isinstance(columnType, Date):
+        return pa.date32()
+    else:
+        return pa.string()
+
+def _writeColumn(filePath, column, values):
+    '''Write the values in {column} to an Arrow IPC file'''
+    array = pa.array(values.values, type = arrowType(column), from_pandas = True)
+    table = pa.Table.from_arrays([array], names = [column])
+
+    with pa.OSFile(filePath, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def _readColumn(filePath):
+    '''Read a column from its Arrow IPC file. Numeric columns without empty cells are memory mapped without copying'''
+    with pa.memory_map(filePath, 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    array = table.column(0)
+    if array.num_chunks == 1 and array.null_count == 0 and (pa.types.is_integer(array.type) or pa.types.is_floating(array.type)):
+        return pd.Series(array.chunk(0).to_numpy(zero_copy_only = True), name = table.column_names[0], copy = False)
+
+    # Same representation as when the column is read from the database
+    return array.to_pandas(date_as_object = True).rename(table.column_names[0])
+
+def snapshotAvailable():
+    '''True if there is a snapshot matching the current data in the database'''
+    if pa is None:
+        return False
+
+    snapshotPath = _currentSnapshotPath()
+    if snapshotPath is None:
+        return False
+
+    manifest = _readManifest(snapshotPath)
+
+    return manifest is not None and manifest['dataVersion'] == currentDataVersion()
+
+def loadDataFromSnapshot(dataColumns):
+    '''Read the columns in {dataColumns} from the snapshot. Returns None if the snapshot is missing, out of date, or does not contain all columns'''
+    if pa is None:
+        return None
+
+    snapshotPath = _currentSnapshotPath()
+    if snapshotPath is None:
+        return None
+
+    manifest = _readManifest(snapshotPath)
+    if manifest is None or manifest['dataVersion'] != currentDataVersion():
+        return None
+
+    if any(column not in manifest['columns'] for column in dataColumns):
+        return None
+
+    try:
+        data = pd.DataFrame({column : _readColumn(os.path.join(snapshotPath, manifest['columns'][column])) for column in dataColumns}, copy = False)
+    except (OSError, pa.ArrowException):
+        return None
+
+    return data
+
+def exportDataSnapshot(engine, dataVersion = None):
+    '''Export the main data table to a new snapshot and make it the current one. The snapshot is tagged with {dataVersion}, by default the current data version.
+    Returns the path to the new snapshot, or None if pyarrow is not installed'''
+    if pa is None:
+        return None
+
+    # Database details. Imported here to avoid a circular import
+    from UtilityFunctions.utilityFunctions import database_details, loadDataFromDatabase
+    ID = database_details()['bd_key']
+
+    if dataVersion is None:
+        dataVersion = currentDataVersion()
+
+    # Each snapshot is written to a new folder so that readers never see a half written snapshot
+    name = 'snapshot-' + uuid.uuid4().hex
+    snapshotPath = os.path.join(snapshotFolderPath(), name)
+    os.makedirs(snapshotPath, exist_ok = True)
+
+    columns = [column.name for column in dataTable_1.perovskitedata.__table__.columns]
+    manifest = {'dataVersion' : dataVersion, 'key' : ID, 'rows' : None, 'columns' : {}}
+
+    # Read the table in batches of columns to limit the memory usage
+    try:
+        for start in range(0, len(columns), exportBatchSize):
+            batch = columns[start : start + exportBatchSize]
+            data = loadDataFromDatabase(dataColumns = list(dict.fromkeys(batch + [ID])), engine = engine)
+            manifest['rows'] = len(data)
+
+            for i, column in enumerate(batch):
+                fileName = f'column_{start + i}.arrow'
+                _writeColumn(os.path.join(snapshotPath, fileName), column, data[column])
+                manifest['columns'][column] = fileName
+
+        with open(os.path.join(snapshotPath, 'manifest.json'), 'w') as file:
+            json.dump(manifest, file)
+    except Exception:
+        shutil.rmtree(snapshotPath, ignore_errors = True)
+        raise
+
+    # Point to the new snapshot. Written to a temporary file and moved in place so that the switch is atomic
+    tempFilePath = os.path.join(snapshotFolderPath(), 'current.txt.' + uuid.uuid4().hex + '.tmp')
+    with open(tempFilePath, 'w') as file:
+        file.write(name)
+    os.replace(tempFilePath, os.path.join(snapshotFolderPath(), 'current.txt'))
+
+    # Remove old snapshots. Files already memory mapped by other processes stay readable until they are closed
+    for item in os.listdir(snapshotFolderPath()):
+        if item.startswith('snapshot-') and item != name:
+            shutil.rmtree(os.path.join(snapshotFolderPath(), item), ignore_errors = True)
+
+    return snapshotPath
+
+def rebuildDataSnapshot(engine):
+    '''Export a new snapshot in a background thread. Used after the data in the database has been changed.
+    If a rebuild already is running, one more is made when it is finished so that the last change is included'''
+    if pa is None:
+        return
+
+    with _rebuildLock:
+        if _rebuildState['running']:
+            _rebuildState['pending'] = True
+            return
+        _rebuildState['running'] = True
+
+    def worker():
+        while True:
+            try:
+                exportDataSnapshot(engine)
+            except Exception as e:
+                print(f'Could not export the data snapshot: {e}')
+
+            with _rebuildLock:
+                if not _rebuildState['pending']:
+                    _rebuildState['running'] = False
+                    return
+                _rebuildState['pending'] = False
+
+    threading.Thread(target = worker, daemon = True).start()
+
+def run_exportDataSnapshot():
+    '''Export a snapshot of the current data in the database. Run once before the server is started the first time'''
+    # Conect to database. Imported here to avoid a circular import
+    from UtilityFunctions.utilityFunctions import conectToDatabase
+    engine = conectToDatabase()
+
+    snapshotPath = exportDataSnapshot(engine)
+
+    if snapshotPath is None:
+        print('pyarrow is not installed. No snapshot exported')
+    else:
+        print(f'Snapshot exported to {snapshotPath}')
@@ -6,7 +6,7 @@
 # 2020 10
 # =============================================================================
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, Integer, Sequence, String, Text
+from sqlalchemy import Boolean, Column, Date, DateTime, Float, Index, Integer, Sequence, String, Text
 from sqlalchemy.ext.declarative import declarative_base
 
 
@@ -428,4 +428,16 @@ class perovskitedata(Base):
     Outdoor_spectral_data_available                             = Column(Boolean)
     Outdoor_link_spectral_data                                  = Column(Text)
     Outdoor_irradiance_measured                                 = Column(Boolean)
-    Outdoor_link_irradiance_data                                = Column(Text) 
+    Outdoor_link_irradiance_data                                = Column(Text)
+
+
+# Boolean columns selecting the rows used by the OutdoorTesting, Stability and Modules dashboards
+booleanSubsets = ['Outdoor_tested', 'Stability_measured', 'Module']
+
+def addPartialIndexes(tableClass, booleanColumns):
+    '''Partial indexes on the database ID for the rows where the {booleanColumns} are true. Queries with "where <column> is TRUE" only read the qualifying rows.
+    The indexes are added to the table of {tableClass}'''
+    for booleanColumn in booleanColumns:
+        Index(f'ix_data_{booleanColumn.lower()}', tableClass.Ref_ID, postgresql_where = tableClass.__table__.c[booleanColumn].is_(True))
+
+addPartialIndexes(perovskitedata, booleanSubsets)
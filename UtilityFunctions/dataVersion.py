@@ -0,0 +1,49 @@
+# =============================================================================
+# dataVersion
+# Moduel keeping track of when the content of the database last was changed.
+# Every bokeh process reads the version marker before it trusts data it has
+# cached in memory, and the apps writing to the database bump it.
+# =============================================================================
+
+#%% Imports
+import os
+import time
+import uuid
+
+
+#%% Functions
+def dataVersionFilePath():
+    '''Returns the path to the file holding the current data version. The file is placed in the shared uploads folder so that all processes see the same marker'''
+    root = os.path.abspath(os.getcwd())
+
+    return os.path.join(root, 'uploads', 'dataVersion.txt')
+
+def currentDataVersion():
+    '''Returns a string identifying the current version of the data in the database. An empty string if no change has been registered'''
+    try:
+        with open(dataVersionFilePath(), 'r') as file:
+            version = file.read().strip()
+    except OSError:
+        version = ''
+
+    return version
+
+def bumpDataVersion():
+    '''Register that the data in the database has changed and return the new version'''
+    filePath = dataVersionFilePath()
+
+    # Check if directories excist. If not create them
+    folder = os.path.dirname(filePath)
+    if os.path.exists(folder) == False:
+        os.makedirs(folder, exist_ok = True)
+
+    # A time stamp followed by a random part to make the version unique also when two processes write at the same time
+    version = time.strftime('%Y%m%d%H%M%S') + '-' + uuid.uuid4().hex
+
+    # Write to a temporary file and move it in place so that a reader never sees a half written file
+    tempFilePath = filePath + '.' + uuid.uuid4().hex + '.tmp'
+    with open(tempFilePath, 'w') as file:
+        file.write(version)
+    os.replace(tempFilePath, filePath)
+
+    return version
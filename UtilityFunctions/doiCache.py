@@ -0,0 +1,127 @@
+# =============================================================================
+# doiCache
+# Moduel for storing reference data downloaded from CrossRef. The data is kept
+# in an SQLite file with the DOI number as primary key, so each DOI is found
+# directly, and new references are appended without rewriting the file. The
+# publication date, first author and journal are extracted when a reference is
+# stored, and the full metadata is kept as json if they need to be extracted
+# again.
+#
+# Earlier the references were stored as a pickled datafram. If such a file
+# excist it is imported the first time the cache is opened.
+# =============================================================================
+
+#%% Imports
+from datetime import datetime
+import json
+import os
+import pickle
+import sqlite3
+import time
+
+
+#%% Parameters
+# Number of DOI numbers in each query. Kept below the limit for parameters in an SQLite query
+queryBatchSize = 500
+
+# Seconds to wait for another process writing to the cache
+lockTimeout = 30
+
+
+#%% Helper functions
+def doiCachePath(DOIPath):
+    '''Returns the path to the cache file. Placed next to the old pickle file at {DOIPath}'''
+    return DOIPath + '.sqlite'
+
+def extractCitation(metaData):
+    '''Returns the publication date (as yyyy-mm-dd), the first author and the journal from the CrossRef metadata of a paper.
+    Values that can not be extracted are returned as None'''
+    # Datetime when the paper was published
+    try:
+        date = metaData['created']['date-parts'][0]
+        date = datetime.strptime(str(date)[1:-1], '%Y, %m, %d').date().isoformat()
+    except:
+        date = None
+
+    # First autor's last name (does not get it right every time)
+    try:
+        if len(metaData['author']) > 1:
+            author = metaData['author'][0]['family'] + ' et al.'
+        else:
+            author = metaData['author'][0]['family']
+    except:
+        author = None
+
+    # Journal
+    try:
+        journal = metaData['container-title'][0]
+    except:
+        journal = None
+
+    return date, author, journal
+
+def _importPickle(connection, picklePath):
+    '''Import the references in the old pickled datafram at {picklePath}'''
+    try:
+        with open(picklePath, 'rb') as f:
+            DOI_saved = pickle.load(f)
+    except Exception as e:
+        print(f'Could not import old reference data from {picklePath}: {e}')
+        return
+
+    for DOI, metaData in zip(DOI_saved['DOI'], DOI_saved['Dict']):
+        saveCitation(connection, DOI, metaData, commit = False)
+    connection.commit()
+
+    print(f'Imported {len(DOI_saved)} references from {picklePath}')
+
+
+#%% Functions
+def openDoiCache(DOIPath):
+    '''Open the cache belonging to {DOIPath}. It is created if it does not excist, and the old pickle file at {DOIPath} is then imported'''
+    cachePath = doiCachePath(DOIPath)
+    newCache = not os.path.exists(cachePath)
+
+    os.makedirs(os.path.dirname(os.path.abspath(cachePath)), exist_ok = True)
+    connection = sqlite3.connect(cachePath, timeout = lockTimeout)
+
+    # Readers are not blocked by a process appending new references
+    connection.execute('pragma journal_mode = wal')
+    connection.execute('''create table if not exists citations (
+                              doi text primary key,
+                              publication_date text,
+                              first_author text,
+                              journal text,
+                              metadata text,
+                              downloaded real)''')
+    connection.commit()
+
+    if newCache and os.path.exists(DOIPath):
+        _importPickle(connection, DOIPath)
+
+    return connection
+
+def cachedCitations(connection, DOIs):
+    '''Returns a dictionary with (publication date, first author, journal) for each DOI in {DOIs} that is in the cache'''
+    DOIs = list(dict.fromkeys(DOI for DOI in DOIs if isinstance(DOI, str)))
+
+    citations = {}
+    for start in range(0, len(DOIs), queryBatchSize):
+        batch = DOIs[start : start + queryBatchSize]
+        query = f'select doi, publication_date, first_author, journal from citations where doi in ({", ".join("?"*len(batch))})'
+        for DOI, date, author, journal in connection.execute(query, batch):
+            citations[DOI] = (date, author, journal)
+
+    return citations
+
+def saveCitation(connection, DOI, metaData, commit = True):
+    '''Append the CrossRef metadata for {DOI} to the cache. References already in the cache are kept as they are'''
+    date, author, journal = extractCitation(metaData)
+    try:
+        metaData = json.dumps(metaData, default = str)
+    except (TypeError, ValueError):
+        metaData = None
+
+    connection.execute('insert or ignore into citations values (?, ?, ?, ?, ?, ?)', (DOI, date, author, journal, metaData, time.time()))
+    if commit:
+        connection.commit()
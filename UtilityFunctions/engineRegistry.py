@@ -0,0 +1,144 @@
+# =============================================================================
+# engineRegistry
+# Moduel holding one pooled SQLAlchemy engine per process. All dashboards and
+# all sessions in a process share the engine and thereby its conection pool.
+#
+# The pool is configured with the environment variables
+#   DB_POOL_SIZE       number of conections kept open (default 5)
+#   DB_MAX_OVERFLOW    aditional conections allowed at peak load (default 10)
+#   DB_POOL_TIMEOUT    seconds to wait for a free conection (default 30)
+#   DB_POOL_RECYCLE    seconds before a conection is replaced (default 1800)
+# =============================================================================
+
+#%% Imports
+import os
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from ConectionDetails.databaseConfiguration import databaseConfiguration
+
+
+#%% The registry. One engine per conection string and process
+_engines = {}
+_statistics = {}
+_registryLock = threading.Lock()
+
+
+#%% Classes
+class MeasuredQueuePool(QueuePool):
+    '''A QueuePool that records how long callers have to wait for a conection, and how often the checkout fails'''
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            # No conection was returned to the pool within pool_timeout
+            _statistics[self.logging_name]['timeouts'] += 1
+            raise
+        except Exception:
+            # The database could not be reached, refused the conection, etc.
+            _statistics[self.logging_name]['connectErrors'] += 1
+            raise
+        finally:
+            waitTime = time.perf_counter() - start
+            statistics = _statistics[self.logging_name]
+            statistics['waitTimeTotal'] += waitTime
+            statistics['waitTimeMax'] = max(statistics['waitTimeMax'], waitTime)
+
+
+#%% Functions
+def _environmentInteger(name, default):
+    '''Read an integer from an environment variable'''
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+def _registerPoolEvents(engine, poolName):
+    '''Count checkouts, checkins and new conections for the pool of the engine'''
+    statistics = _statistics[poolName]
+
+    def onConnect(dbapiConnection, connectionRecord):
+        statistics['connects'] += 1
+
+    def onCheckout(dbapiConnection, connectionRecord, connectionProxy):
+        statistics['checkouts'] += 1
+
+    def onCheckin(dbapiConnection, connectionRecord):
+        statistics['checkins'] += 1
+
+    event.listen(engine, 'connect', onConnect)
+    event.listen(engine, 'checkout', onCheckout)
+    event.listen(engine, 'checkin', onCheckin)
+
+def conectionString():
+    '''The conection string to the Postgres database'''
+    # Reading in configuration details for accessing the database
+    dbConfig = databaseConfiguration()
+
+    return 'postgresql+psycopg2://' + dbConfig['user'] + ':' + dbConfig['password'] + '@' + dbConfig['host'] + '/' + dbConfig['database']
+
+def getEngine():
+    '''Returns the engine shared by all sessions in this process. The engine is created the first time it is asked for'''
+    conection_string = conectionString()
+
+    # Conections can not be shared between processes. The process id is thus part of the key
+    key = (conection_string, os.getpid())
+
+    with _registryLock:
+        if key not in _engines:
+            poolName = f'perovskitedatabase-{os.getpid()}-{len(_engines)}'
+            _statistics[poolName] = {
+                'checkouts' : 0,
+                'checkins' : 0,
+                'connects' : 0,
+                'timeouts' : 0,
+                'connectErrors' : 0,
+                'waitTimeTotal' : 0.0,
+                'waitTimeMax' : 0.0,
+                }
+
+            engine = create_engine(conection_string,
+                                   poolclass = MeasuredQueuePool,
+                                   pool_size = _environmentInteger('DB_POOL_SIZE', 5),
+                                   max_overflow = _environmentInteger('DB_MAX_OVERFLOW', 10),
+                                   pool_timeout = _environmentInteger('DB_POOL_TIMEOUT', 30),
+                                   pool_recycle = _environmentInteger('DB_POOL_RECYCLE', 1800),
+                                   pool_pre_ping = True,
+                                   pool_logging_name = poolName)
+
+            _registerPoolEvents(engine, poolName)
+            _engines[key] = engine
+
+            print(f"Conection pool to {engine.url.host} established")
+
+    return _engines[key]
+
+def poolStatistics():
+    '''Returns a dictionary with the state of, and counters for, the conection pools in this process'''
+    statistics = {}
+
+    with _registryLock:
+        for (conection_string, pid), engine in _engines.items():
+            if pid != os.getpid():
+                continue
+
+            pool = engine.pool
+            poolStatistics = dict(_statistics[pool.logging_name])
+            poolStatistics['poolSize'] = pool.size()
+            poolStatistics['checkedIn'] = pool.checkedin()
+            poolStatistics['checkedOut'] = pool.checkedout()
+            poolStatistics['overflow'] = pool.overflow()
+            if poolStatistics['checkouts'] > 0:
+                poolStatistics['waitTimeMean'] = poolStatistics['waitTimeTotal'] / poolStatistics['checkouts']
+            else:
+                poolStatistics['waitTimeMean'] = 0.0
+
+            statistics[f'{engine.url.host}/{engine.url.database}'] = poolStatistics
+
+    return statistics
@@ -0,0 +1,292 @@
+# =============================================================================
+# exportArtifacts
+# Moduel for pre-built exports of all data in the database. The full table is
+# written as csv, gzipped csv and, if pyarrow is installed, Parquet to the
+# uploads folder, together with a manifest holding the content hash and the
+# number of rows. The downloads of all data are served from the latest export
+# instead of querying the database on every click.
+#
+# The export is rebuilt after uploads and on a schedule. Each export is tagged
+# with the data version it was made at and is only served while that version
+# is the current one.
+# =============================================================================
+
+#%% Imports
+import csv
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from UtilityFunctions.dataSnapshot import arrowType
+from UtilityFunctions.dataVersion import currentDataVersion
+from UtilityFunctions.streamingDownload import allDataFileName, allDataQuery
+import UtilityFunctions.dataTableClass_V5_31 as dataTable_1
+
+# pyarrow is optional. Without it no Parquet file is written
+try:
+    import pyarrow as pa
+    import pyarrow.csv
+    import pyarrow.parquet
+except ImportError:
+    pa = None
+
+
+#%% Parameters
+# File names of the artifacts in each export
+artifactFileNames = {
+    'csv' : allDataFileName,
+    'csvGz' : allDataFileName + '.gz',
+    'parquet' : allDataFileName.replace('.csv', '.parquet'),
+    }
+
+# Seconds between the checks of the schedule. The interval between exports is set by exportInterval()
+scheduleCheckInterval = 15 * 60
+
+# If a lock is older than this, the process holding it is assumed to have died
+lockTimeout = 2 * 60 * 60
+
+# State for exports in this process
+_exportLock = threading.Lock()
+_exportState = {
+    'running' : False,
+    'pending' : False,
+    'scheduleStarted' : False,
+    }
+
+
+#%% Helper functions
+def exportFolderPath():
+    '''Returns the path to the folder holding the exports. Placed in the shared uploads folder'''
+    root = os.path.abspath(os.getcwd())
+
+    return os.path.join(root, 'uploads', 'exports')
+
+def exportInterval():
+    '''Hours between scheduled exports. Set by the environment variable EXPORT_INTERVAL_HOURS'''
+    try:
+        hours = float(os.getenv('EXPORT_INTERVAL_HOURS', 24))
+    except ValueError:
+        hours = 24
+
+    return hours * 60 * 60
+
+def _fileHash(filePath):
+    '''Returns the sha256 hash of the file'''
+    fileHash = hashlib.sha256()
+    with open(filePath, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            fileHash.update(block)
+
+    return fileHash.hexdigest()
+
+def _countRows(filePath):
+    '''Returns the number of data rows in a csv file. Uses the csv module as entries may contain line breaks'''
+    with open(filePath, 'r', newline = '', encoding = 'utf-8') as file:
+        rows = sum(1 for row in csv.reader(file)) - 1
+
+    return max(rows, 0)
+
+def _writeParquet(csvFilePath, parquetFilePath):
+    '''Convert the csv file to Parquet, one block at the time. Returns the number of rows'''
+    columnTypes = {column.name : arrowType(column.name) for column in dataTable_1.perovskitedata.__table__.columns}
+    convertOptions = pa.csv.ConvertOptions(column_types = columnTypes, strings_can_be_null = True)
+    # Free text entries may contain quoted line breaks
+    parseOptions = pa.csv.ParseOptions(newlines_in_values = True)
+    reader = pa.csv.open_csv(csvFilePath, parse_options = parseOptions, convert_options = convertOptions)
+
+    rows = 0
+    with pa.parquet.ParquetWriter(parquetFilePath, reader.schema) as writer:
+        for batch in reader:
+            writer.write_table(pa.Table.from_batches([batch]))
+            rows += batch.num_rows
+
+    return rows
+
+class _CsvWriter:
+    '''File like object receiving data from COPY TO STDOUT and writing it both as plain and gzipped csv'''
+    def __init__(self, csvFile, gzipFile):
+        self._csvFile = csvFile
+        self._gzipFile = gzipFile
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self._csvFile.write(data)
+        self._gzipFile.write(data)
+
+def _acquireLock():
+    '''Take the lock shared by all processes. Returns False if another process is exporting'''
+    lockPath = os.path.join(exportFolderPath(), 'export.lock')
+
+    # Remove locks left by processes that have died
+    try:
+        if time.time() - os.path.getmtime(lockPath) > lockTimeout:
+            os.remove(lockPath)
+    except OSError:
+        pass
+
+    try:
+        os.close(os.open(lockPath, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+
+    return True
+
+def _releaseLock():
+    '''Release the lock shared by all processes'''
+    try:
+        os.remove(os.path.join(exportFolderPath(), 'export.lock'))
+    except OSError:
+        pass
+
+
+#%% Functions
+def latestExport():
+    '''Returns the path to the latest export and its manifest. (None, None) if there is no export'''
+    try:
+        with open(os.path.join(exportFolderPath(), 'latest.txt'), 'r') as file:
+            exportPath = os.path.join(exportFolderPath(), file.read().strip())
+        with open(os.path.join(exportPath, 'manifest.json'), 'r') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None, None
+
+    return exportPath, manifest
+
+def latestExportFile(kind):
+    '''Returns the path and the manifest entry of the latest export of type {kind} ('csv', 'csvGz' or 'parquet').
+    (None, None) if there is no export of that type matching the current data in the database'''
+    exportPath, manifest = latestExport()
+    if manifest is None or manifest['dataVersion'] != currentDataVersion() or kind not in manifest['files']:
+        return None, None
+
+    return os.path.join(exportPath, manifest['files'][kind]['name']), manifest['files'][kind]
+
+def writeExportArtifacts(engine):
+    '''Export all data in the database to csv, gzipped csv and Parquet and make it the latest export. Returns the path to the export.
+    Nothing is done, and None is returned, if another process already is exporting'''
+    os.makedirs(exportFolderPath(), exist_ok = True)
+    if not _acquireLock():
+        return None
+
+    try:
+        dataVersion = currentDataVersion()
+        name = time.strftime('export-%Y%m%d%H%M%S-') + uuid.uuid4().hex[0:8]
+        exportPath = os.path.join(exportFolderPath(), name)
+        os.makedirs(exportPath, exist_ok = True)
+        filePaths = {kind : os.path.join(exportPath, fileName) for kind, fileName in artifactFileNames.items()}
+
+        try:
+            # Write the csv files directly from the database
+            connection = engine.raw_connection()
+            try:
+                with open(filePaths['csv'], 'wb') as csvFile, gzip.open(filePaths['csvGz'], 'wb') as gzipFile:
+                    cursor = connection.cursor()
+                    cursor.copy_expert(f'COPY ({allDataQuery()}) TO STDOUT WITH CSV HEADER', _CsvWriter(csvFile, gzipFile))
+                    cursor.close()
+            finally:
+                connection.close()
+
+            # Parquet file. If it can not be written, the csv files are still published
+            rows = None
+            if pa is not None:
+                try:
+                    rows = _writeParquet(filePaths['csv'], filePaths['parquet'])
+                except Exception as e:
+                    print(f'Could not write the Parquet export: {e}')
+
+            if rows is None:
+                if os.path.exists(filePaths['parquet']):
+                    os.remove(filePaths['parquet'])
+                del filePaths['parquet']
+                rows = _countRows(filePaths['csv'])
+
+            manifest = {
+                'dataVersion' : dataVersion,
+                'created' : time.strftime('%Y-%m-%d %H:%M:%S'),
+                'rows' : rows,
+                'files' : {kind : {'name' : os.path.basename(filePath),
+                                   'sha256' : _fileHash(filePath),
+                                   'bytes' : os.path.getsize(filePath),
+                                   'rows' : rows} for kind, filePath in filePaths.items()},
+                }
+            with open(os.path.join(exportPath, 'manifest.json'), 'w') as file:
+                json.dump(manifest, file, indent = 4)
+        except Exception:
+            shutil.rmtree(exportPath, ignore_errors = True)
+            raise
+
+        # Point to the new export. Written to a temporary file and moved in place so that the switch is atomic
+        tempFilePath = os.path.join(exportFolderPath(), 'latest.txt.' + uuid.uuid4().hex + '.tmp')
+        with open(tempFilePath, 'w') as file:
+            file.write(name)
+        os.replace(tempFilePath, os.path.join(exportFolderPath(), 'latest.txt'))
+
+        # Remove old exports, but keep the previous one for downloads that are in progress
+        oldExports = sorted(item for item in os.listdir(exportFolderPath()) if item.startswith('export-') and item != name)
+        for item in oldExports[0:-1]:
+            shutil.rmtree(os.path.join(exportFolderPath(), item), ignore_errors = True)
+    finally:
+        _releaseLock()
+
+    return exportPath
+
+def rebuildExportArtifacts(engine):
+    '''Write a new export in a background thread. Used after the data in the database has been changed.
+    If an export already is running, one more is made when it is finished so that the last change is included'''
+    with _exportLock:
+        if _exportState['running']:
+            _exportState['pending'] = True
+            return
+        _exportState['running'] = True
+
+    def worker():
+        while True:
+            try:
+                writeExportArtifacts(engine)
+            except Exception as e:
+                print(f'Could not write the export artifacts: {e}')
+
+            with _exportLock:
+                if not _exportState['pending']:
+                    _exportState['running'] = False
+                    return
+                _exportState['pending'] = False
+
+    threading.Thread(target = worker, daemon = True).start()
+
+def startExportSchedule(engine):
+    '''Start a background thread that writes a new export when the latest one is older than exportInterval(), or does not match the data in the database.
+    Only one schedule is started per process, and the lock makes sure that only one process exports at the time'''
+    with _exportLock:
+        if _exportState['scheduleStarted']:
+            return
+        _exportState['scheduleStarted'] = True
+
+    def worker():
+        while True:
+            exportPath, manifest = latestExport()
+            if manifest is None or manifest['dataVersion'] != currentDataVersion() or time.time() - os.path.getmtime(os.path.join(exportPath, 'manifest.json')) > exportInterval():
+                rebuildExportArtifacts(engine)
+
+            time.sleep(scheduleCheckInterval)
+
+    threading.Thread(target = worker, daemon = True).start()
+
+def run_writeExportArtifacts():
+    '''Write the export artifacts. Can be run from e.g. cron instead of, or in addition to, the schedule in the server'''
+    # Conect to database. Imported here to avoid a circular import
+    from UtilityFunctions.utilityFunctions import conectToDatabase
+    engine = conectToDatabase()
+
+    exportPath = writeExportArtifacts(engine)
+
+    if exportPath is None:
+        print('Another process is already writing the export')
+    else:
+        print(f'Export written to {exportPath}')
@@ -0,0 +1,90 @@
+# =============================================================================
+# filterEngine
+# Moduel for selecting the rows in a dataframe that pass a set of filters.
+# Each filter is evaluated to a boolean mask over all rows. The masks are
+# cached per session so that when one widget changes only its mask is
+# recomputed, and the masks are combined with NumPy without building any
+# intermediate dataframes.
+#
+# A filter is described by a tuple (kind, column, parameters...). Use the
+# filter* functions below to construct them.
+# =============================================================================
+
+#%% Imports
+import numpy as np
+
+
+#%% Functions for defining filters
+def filterIsIn(column, values):
+    '''Keep rows where {column} is one of {values}'''
+    return ('isIn', column, frozenset(values))
+
+def filterIsTrue(column):
+    '''Keep rows where {column} is True'''
+    return ('isTrue', column)
+
+def filterNotEqual(column, value):
+    '''Keep rows where {column} is not equal to {value}'''
+    return ('notEqual', column, value)
+
+def filterNotIn(column, values):
+    '''Keep rows where {column} is not one of {values}'''
+    return ('notIn', column, frozenset(values))
+
+def filterOpenRange(column, lower, upper):
+    '''Keep rows where {column} is strictly between {lower} and {upper}'''
+    return ('openRange', column, lower, upper)
+
+
+#%% Functions for evaluating filters
+def computeMask(data, selectionFilter):
+    '''Returns a NumPy boolean array with one element per row in {data} that is True for the rows passing {selectionFilter}'''
+    kind = selectionFilter[0]
+    column = data[selectionFilter[1]]
+
+    if kind == 'isIn':
+        mask = column.isin(list(selectionFilter[2])).values
+    elif kind == 'isTrue':
+        mask = (column == True).values
+    elif kind == 'notEqual':
+        mask = (column != selectionFilter[2]).values
+    elif kind == 'notIn':
+        mask = ~column.isin(list(selectionFilter[2])).values
+    elif kind == 'openRange':
+        mask = ((column > selectionFilter[2]) & (column < selectionFilter[3])).values
+    else:
+        raise ValueError(f'Unknown filter: {kind}')
+
+    return np.asarray(mask, dtype = bool)
+
+def invalidateFilterMasks(maskCache, columns = None):
+    '''Remove cached masks. If {columns} is given, only masks depending on those columns are removed.
+    Must be called when columns in the data are replaced, as the cache only checks the filters and the number of rows'''
+    for key in list(maskCache.keys()):
+        if columns is None or maskCache[key][0][1] in columns:
+            del maskCache[key]
+
+def selectRowMask(data, filters, maskCache):
+    '''Returns a NumPy boolean array with one element per row in {data} that is True for the rows passing all {filters}.
+    {filters} is a dictionary with one filter per widget, and {maskCache} a dictionary, kept by the session, in which the masks are stored between calls.
+    A mask is only recomputed if the filter for its widget has changed'''
+    masks = []
+    for key, selectionFilter in filters.items():
+        # Reuse the cached mask if the filter is unchanged
+        if key in maskCache and maskCache[key][0] == selectionFilter and len(maskCache[key][1]) == len(data):
+            mask = maskCache[key][1]
+        else:
+            mask = computeMask(data, selectionFilter)
+            maskCache[key] = (selectionFilter, mask)
+
+        masks.append(mask)
+
+    # Combine all masks
+    if len(masks) == 0:
+        return np.ones(len(data), dtype = bool)
+
+    return np.logical_and.reduce(masks)
+
+def selectRowIndices(data, filters, maskCache):
+    '''Returns the index of the rows in {data} passing all {filters}. See selectRowMask'''
+    return data.index.values[selectRowMask(data, filters, maskCache)].tolist()
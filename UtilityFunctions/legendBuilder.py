@@ -0,0 +1,73 @@
+# =============================================================================
+# legendBuilder
+# Moduel for building the legends in the dashboards. A legend entry points at
+# the first row in the plot with its label, and the entries are sorted by how
+# common the labels are in the total dataset. The first row of each label is
+# found with one drop_duplicates over the plotted rows, and the order of the
+# labels is computed once per legend category and session. The LegendItems are
+# kept by the session and reused when the selection changes, as creating them
+# takes more time than finding the rows.
+# =============================================================================
+
+#%% Imports
+from bokeh.models import Legend, LegendItem
+import pandas as pd
+
+from UtilityFunctions.categoryAggregation import categoryCounts
+
+
+#%% Functions
+def legendLabelOrder(data, column, countCache):
+    '''All values in {column} of {data}, the most common first. The counts are cached in {countCache}, see categoryCounts'''
+    return list(categoryCounts(data, column, countCache).index)
+
+def firstOccurrences(values):
+    '''Dictionary with the position of the first occurance of each value in {values}'''
+    values = pd.Series(values).reset_index(drop = True)
+    first = values[~values.duplicated()]
+
+    return dict(zip(first.tolist(), first.index.tolist()))
+
+def legendItems(values, renderer, labels = None, itemCache = None):
+    '''LegendItems for {renderer}, one for each of the {labels} that are in {values}, pointing at the first row with that label.
+    {values} is the legend column for the rows in the plot, in the order of the rows. By default the labels are the values in order of first occurance.
+    {itemCache} is a dictionary, kept by the session, in which the LegendItems are kept so that they can be reused, with an updated index, as long as the renderer is the same.
+    Creating the LegendItems takes most of the time for legends with many entries'''
+    firstIndex = firstOccurrences(values)
+    if labels is None:
+        labels = list(firstIndex)
+
+    # LegendItems for another renderer can not be reused
+    if itemCache is None:
+        itemCache = {}
+    if itemCache.get('renderer') != renderer.id:
+        itemCache.clear()
+        itemCache.update({'renderer' : renderer.id, 'items' : {}})
+
+    items = []
+    for label in labels:
+        if label not in firstIndex:
+            continue
+
+        item = itemCache['items'].get(label)
+        if item is None:
+            item = LegendItem(label = str(label), index = firstIndex[label], renderers = [renderer])
+            itemCache['items'][label] = item
+        elif item.index != firstIndex[label]:
+            item.index = firstIndex[label]
+
+        items.append(item)
+
+    return items
+
+def showLegend(p, items, fontSize, labelWidth):
+    '''Place a legend with {items} to the right of the figure {p}'''
+    # Add an emty legend if no legend already excist
+    if len(p.legend) == 0:
+        p.add_layout(Legend())
+
+    p.add_layout(p.legend[0], 'right')
+    p.legend.items = items
+    p.legend.label_text_font_size = str(fontSize) + 'pt'
+    p.legend.spacing = 0
+    p.legend.label_width = labelWidth
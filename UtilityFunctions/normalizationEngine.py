@@ -0,0 +1,138 @@
+# =============================================================================
+# normalizationEngine
+# Moduel for converting user data to the standard formating used in the
+# database. A vocabulary is a dictionary from each standard formating to the
+# formating variations that should be converted to it. The vocabularies are
+# compiled once into lookup tables, and the result for each token is cached,
+# so the time for cleaning a column depends on the number of unique tokens
+# rather than on the number of rows.
+#
+# Entries in the data template are nested lists, e.g. layers separated by |,
+# deposition steps separated by >> and elements separated by ;. normalize
+# splits each unique entry, formats every token and joins the parts again.
+#
+# Ordered rewrite rules, i.e. chains of str.replace, are compiled with
+# compileRewriteRules so that text without any of the patterns is passed
+# through after a single regular expression search.
+# =============================================================================
+
+#%% Imports
+from functools import lru_cache
+import re
+
+import numpy as np
+import pandas as pd
+
+
+#%% Parameters
+# Separators in the data template, and the spacing used when the parts are joined again
+layers = ('|', ' | ')
+steps = ('>>', ' >> ')
+lists = (';', '; ')
+mixtures = (':', ':')
+
+# Number of tokens cached for each vocabulary
+cacheSize = 2**16
+
+# Compiled vocabularies and formating functions. One per process
+_normalizers = {}
+
+
+#%% Functions
+def compileVocabulary(vocabulary):
+    '''Returns a lookup table from the stripped lower case formating variations to the standard formating.
+    If a variation is listed for more than one standard formating, the first one is used'''
+    lookup = {}
+    for standard, variations in vocabulary.items():
+        for variation in variations:
+            lookup.setdefault(variation.strip().lower(), standard)
+
+    return lookup
+
+def tokenNormalizer(vocabulary, default = None, arguments = ()):
+    '''Returns a cached function giving the standard formating of a token.
+    {vocabulary} is either a vocabulary dictionary or a formating function, which is called as vocabulary(token, *arguments).
+    Tokens that are not in a vocabulary are returned stripped, or as {default} if it is given'''
+    key = (id(vocabulary), default, arguments)
+    if key not in _normalizers:
+        if callable(vocabulary):
+            def normalizeToken(token):
+                return vocabulary(token, *arguments)
+        else:
+            lookup = compileVocabulary(vocabulary)
+            def normalizeToken(token):
+                token = token.strip()
+                return lookup.get(token.lower(), token if default is None else default)
+
+        # The vocabulary is kept so that its id is not reused while the normalizer exists
+        _normalizers[key] = (vocabulary, lru_cache(maxsize = cacheSize)(normalizeToken))
+
+    return _normalizers[key][1]
+
+def normalizeToken(token, vocabulary, default = None):
+    '''Returns the standard formating of one token'''
+    return tokenNormalizer(vocabulary, default)(token)
+
+def _normalizeParts(text, normalizeToken, separators):
+    '''Split {text} on the first separator, normalize each part and join them again'''
+    if len(separators) == 0:
+        return normalizeToken(text)
+
+    separator, joiner = separators[0]
+
+    return joiner.join([_normalizeParts(part, normalizeToken, separators[1:]) for part in text.split(separator)])
+
+def normalize(userData, vocabulary, separators = (), replacements = (), default = None, arguments = (), errorValue = None, strip = True):
+    '''Returns a list with the standard formating of each entry in {userData}, which can be a pandas series or a list.
+    Each entry is converted to a string and, if {strip} is True, stripped. The (old, new) pairs in {replacements} are applied,
+    and it is split on {separators}, outermost first. Each token is then formated with {vocabulary} as in tokenNormalizer.
+    Use strip = False for cleaning functions that did not strip the entries, as stripping e.g. a trailing line break turns the last token into an empty one.
+    If an entry can not be formated, it is returned as it is, or as {errorValue} if that is given.
+    Only unique entries are processed'''
+    normalizeToken = tokenNormalizer(vocabulary, default, tuple(arguments))
+
+    # Enforce that input are strings
+    items = pd.Series(userData, dtype = object).astype(str)
+
+    def normalizeEntry(item):
+        if strip:
+            item = item.strip()
+        for old, new in replacements:
+            item = item.replace(old, new)
+
+        try:
+            return _normalizeParts(item, normalizeToken, separators)
+        except Exception:
+            print(f'Could not normalize {item}')
+            return item if errorValue is None else errorValue
+
+    # Format the unique entries and map them back to all rows
+    codes, uniqueItems = pd.factorize(items)
+    formatedItems = np.array([normalizeEntry(item) for item in uniqueItems], dtype = object)
+
+    return list(formatedItems[codes])
+
+def compileRewriteRules(rules):
+    '''Compile the ordered (old, new) pairs in {rules} for rewrite. Returns the rules together with one regular expression matching any of the old strings'''
+    rules = tuple(rules)
+    detector = re.compile('|'.join(re.escape(old) for old, new in rules))
+
+    return detector, rules
+
+def rewrite(text, compiledRules):
+    '''Apply the rules compiled with compileRewriteRules to {text}, with the same result as calling text.replace(old, new) for each rule in order.
+    Text without any of the old strings is returned after a single search. Other text is rewritten rule by rule,
+    since later rules may apply to what earlier rules have written'''
+    detector, rules = compiledRules
+    if detector.search(text) is None:
+        return text
+
+    for old, new in rules:
+        text = text.replace(old, new)
+
+    return text
+
+def clearNormalizationCaches():
+    '''Empty the caches of formated tokens'''
+    for vocabulary, normalizeToken in _normalizers.values():
+        normalizeToken.cache_clear()
@@ -1,25 +1,13 @@
 # Function for reading in data from the database and returnign a pandas datafram
 
 import pandas as pd
-from sqlalchemy import create_engine
 
-from ConectionDetails.databaseConfiguration import databaseConfiguration
+from UtilityFunctions.engineRegistry import getEngine
 
 def conectToDatabase():
-    '''Create a conection to the database and return the conection engine'''
-
-    # Reading in configuration details for accessing the database
-    dbConfig = databaseConfiguration()
-
-    # The conection string to the Postgres database
-    conection_string = 'postgresql+psycopg2://' + dbConfig['user'] + ':' + dbConfig['password'] + '@' + dbConfig['host'] + '/' + dbConfig['database']
-
-    # Conect to the database
-    try:
-        engine = create_engine(conection_string)
-        print(f"Connection to {dbConfig['host']} established")
-    except:
-        print(f"Conection to {dbConfig['host']} failed")
+    '''Return the conection engine to the database. The engine is shared by all sessions in the process'''
+    # All sessions in the process share one engine and its conection pool
+    engine = getEngine()
 
     return engine
 
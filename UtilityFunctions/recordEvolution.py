@@ -0,0 +1,54 @@
+# =============================================================================
+# recordEvolution
+# Moduel for finding the record values over time, e.g. the record efficiency,
+# among the rows passing the filters in a dashboard. A row is a record if its
+# value is higher than the values of all rows published before it, and only
+# the highest record of each publication date is kept.
+#
+# The rows are sorted by publication date and value once per value column,
+# and the order is cached per session. When the filters change, the records
+# are found with one pass of np.maximum.accumulate over the rows passing the
+# filters, taken in the cached order, so no sorting is done.
+# =============================================================================
+
+#%% Imports
+import numpy as np
+
+
+#%% Functions
+def recordOrder(data, valueColumn, orderCache, dateColumn = 'Ref_publication_date'):
+    '''Positions of the rows in {data} sorted by {dateColumn}, and by {valueColumn} within each date. Equal rows keep their order.
+    {orderCache} is a dictionary, kept by the session, in which the order for each value column is stored between calls'''
+    key = (dateColumn, valueColumn)
+    if key not in orderCache or len(orderCache[key]) != len(data):
+        # The last key is the primary key in lexsort, which is stable
+        orderCache[key] = np.lexsort((data[valueColumn].to_numpy(), data[dateColumn].to_numpy()))
+
+    return orderCache[key]
+
+def recordPositions(data, valueColumn, rowMask, orderCache, dateColumn = 'Ref_publication_date'):
+    '''Positions of the record rows among the rows in {data} where {rowMask} is True, in order of publication date.
+    Rows where {valueColumn} is empty are never records'''
+    order = recordOrder(data, valueColumn, orderCache, dateColumn = dateColumn)
+    values = data[valueColumn].to_numpy(dtype = float)
+
+    # The rows passing the filters, in order of date and value
+    rows = order[(rowMask & ~np.isnan(values))[order]]
+    if len(rows) == 0:
+        return rows
+
+    # A row is a record if its value is higher than the highest value before it
+    sortedValues = values[rows]
+    highestSoFar = np.maximum.accumulate(sortedValues)
+    isRecord = np.empty(len(rows), dtype = bool)
+    isRecord[0] = True
+    isRecord[1:] = sortedValues[1:] > highestSoFar[:-1]
+    records = rows[isRecord]
+
+    # Only the last, and highest, record of each date. Dates are compared as integers so that missing dates are equal
+    dates = data[dateColumn].to_numpy(dtype = 'datetime64[ns]').view('int64')[records]
+    lastOfDate = np.empty(len(records), dtype = bool)
+    lastOfDate[:-1] = dates[1:] != dates[:-1]
+    lastOfDate[-1] = True
+
+    return records[lastOfDate]
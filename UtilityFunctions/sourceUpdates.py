@@ -0,0 +1,100 @@
+# =============================================================================
+# sourceUpdates
+# Moduel for updating bokeh ColumnDataSources with as little data as possible.
+# Instead of replacing all data in a source, only columns that are new or have
+# changed are sent to the browser. Single changed rows are patched, appended
+# rows are streamed, and all columns are sent as typed NumPy arrays so that
+# bokeh can use its binary transport instead of lists of Python objects.
+# =============================================================================
+
+#%% Imports
+import numpy as np
+import pandas as pd
+
+
+#%% Parameters
+# If fewer than this fraction of the rows in a column have changed, the column is patched rather than replaced
+patchFraction = 0.1
+
+
+#%% Functions
+def columnArray(values):
+    '''Returns {values} as a NumPy array that bokeh can send in binary form'''
+    values = pd.Series(values)
+
+    # Dates are sent as milliseconds since epoch, which is what bokeh uses in the browser
+    if np.issubdtype(values.dtype, np.datetime64):
+        array = values.values.astype('datetime64[ms]').astype('float64')
+        array[values.isna().values] = np.nan
+        return array
+
+    # 64 bit integers are not supported by the binary transport
+    if values.dtype.kind in ('i', 'u') and values.dtype.itemsize > 4:
+        if len(values) == 0 or (values.min() >= np.iinfo(np.int32).min and values.max() <= np.iinfo(np.int32).max):
+            return values.values.astype('int32')
+        return values.values.astype('float64')
+
+    # Arrays shared with the column cache are read only, and the data in a source must be possible to stream to
+    return np.array(values.values, copy = True)
+
+def columnDataSourceData(data, columns = None):
+    '''Returns a dictionary with typed arrays for all {columns} in the dataframe {data}. Used instead of data.to_dict('series')'''
+    if columns is None:
+        columns = list(data.columns)
+
+    return {column : columnArray(data[column]) for column in columns}
+
+def _changedRows(oldValues, newValues):
+    '''Returns a boolean array that is True for rows that differ between {oldValues} and {newValues}. Empty cells are considered equal'''
+    oldValues = pd.Series(oldValues)
+    newValues = pd.Series(np.asarray(newValues))
+
+    return (oldValues.values != newValues.values) & ~(oldValues.isna().values & newValues.isna().values)
+
+def updateColumnDataSource(source, data, columns = None):
+    '''Update the ColumnDataSource {source} so that it contains the dataframe {data}, but only send what has changed.
+    If {columns} is given, only those columns are updated and the other columns in the source are left as they are.
+    Otherwise the source is given exactly the columns in {data}'''
+    newData = columnDataSourceData(data, columns)
+    oldData = source.data
+    oldLength = len(next(iter(oldData.values()))) if len(oldData) > 0 else 0
+    newLength = len(data)
+
+    # Columns that are in the source but not in the new data
+    removedColumns = [column for column in oldData if column not in newData] if columns is None else []
+
+    # Start over if the source is empty, if columns should be removed, or if rows have been removed
+    if oldLength == 0 or len(removedColumns) > 0 or newLength < oldLength:
+        source.data = newData
+        return
+
+    # Appended rows are streamed, provided that all columns are present and the old rows are unchanged
+    if newLength > oldLength:
+        if set(newData.keys()) == set(oldData.keys()) and not any(_changedRows(oldData[column], newData[column][0:oldLength]).any() for column in newData):
+            source.stream({column : newData[column][oldLength:] for column in newData})
+        else:
+            source.data = newData
+        return
+
+    # New columns are added, changed columns are patched or replaced
+    columnsToReplace = {}
+    patches = {}
+    for column in newData:
+        if column not in oldData:
+            columnsToReplace[column] = newData[column]
+            continue
+
+        changedRows = np.flatnonzero(_changedRows(oldData[column], newData[column]))
+        if len(changedRows) == 0:
+            continue
+        elif len(changedRows) <= patchFraction * newLength:
+            patches[column] = [(int(row), value) for row, value in zip(changedRows, newData[column][changedRows].tolist())]
+        else:
+            columnsToReplace[column] = newData[column]
+
+    # All new and replaced columns are sent in one message
+    if len(columnsToReplace) > 0:
+        source.data.update(columnsToReplace)
+
+    if len(patches) > 0:
+        source.patch(patches)
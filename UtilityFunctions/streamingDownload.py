@@ -0,0 +1,244 @@
+# =============================================================================
+# streamingDownload
+# Moduel with tornado request handlers for downloading the whole data table.
+# If the pre-built export is up to date it is sent as it is. Otherwise the
+# table is streamed as a gzipped csv file. The data is then read with Postgres
+# COPY TO STDOUT in a separate thread and compressed chunk by chunk, so the
+# full result is never held in memory. The chunks are passed to the handler
+# through a bounded queue, which pauses the database read if the client is
+# slower than the database.
+# =============================================================================
+
+#%% Imports
+import asyncio
+import concurrent.futures
+import os
+import threading
+import zlib
+
+from sqlalchemy import Boolean
+from tornado.iostream import StreamClosedError
+from tornado.web import RequestHandler
+
+from UtilityFunctions.engineRegistry import getEngine
+import UtilityFunctions.dataTableClass_V5_31 as dataTable_1
+
+
+#%% Parameters
+# Routes of the downloads relative to the server root
+allDataRoute = '/download/all_data.csv'
+allDataParquetRoute = '/download/all_data.parquet'
+allDataFileName = 'Perovskite_database_content_all_data.csv'
+
+# Size of the uncompressed data in each chunk, and number of compressed chunks that can wait in the queue
+chunkSize = 1024 * 1024
+queueSize = 8
+
+# Set when the handler is added to a server running in this process
+_routeState = {
+    'registered' : False,
+    }
+
+
+#%% Helper classes
+class DownloadCancelled(Exception):
+    '''Raised in the reading thread when the client has closed the conection'''
+    pass
+
+class _GzipQueueWriter:
+    '''File like object receiving data from COPY TO STDOUT, compressing it and putting it on the queue'''
+    def __init__(self, put, cancelled):
+        self._put = put
+        self._cancelled = cancelled
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        self._buffer = []
+        self._bufferSize = 0
+
+    def write(self, data):
+        if self._cancelled.is_set():
+            raise DownloadCancelled()
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        self._buffer.append(data)
+        self._bufferSize += len(data)
+
+        if self._bufferSize >= chunkSize:
+            self._putBuffer()
+
+    def close(self):
+        '''Compress what is left in the buffer and end the gzip stream'''
+        self._putBuffer()
+        self._put(self._compressor.flush())
+
+    def _putBuffer(self):
+        compressed = self._compressor.compress(b''.join(self._buffer))
+        self._buffer = []
+        self._bufferSize = 0
+        if len(compressed) > 0:
+            self._put(compressed)
+
+
+#%% Functions
+def allDataQuery():
+    '''Returns the query for all data in the main table. Booleans are written as True and False, as in csv files generated by pandas'''
+    # Database details. Imported here to avoid a circular import
+    from UtilityFunctions.utilityFunctions import database_details
+    bd_details = database_details()
+    table = bd_details['table']
+    schema = bd_details['schema']
+    ID = bd_details['bd_key']
+
+    columns = []
+    for column in dataTable_1.perovskitedata.__table__.columns:
+        if isinstance(column.type, Boolean):
+            columns.append(f'initcap("{column.name}"::text) as "{column.name}"')
+        else:
+            columns.append(f'"{column.name}"')
+
+    return f'''select {', '.join(columns)} from {schema}.{table} order by {table}."{ID}"'''
+
+def copyQueryToQueue(engine, query, chunks, loop, cancelled):
+    '''Run {query} with COPY TO STDOUT and put the gzipped result on the asyncio queue {chunks}, which belongs to {loop}.
+    Runs in a separate thread. Ends by putting None on the queue, preceded by the exception if something went wrong'''
+    def put(item):
+        future = asyncio.run_coroutine_threadsafe(chunks.put(item), loop)
+        while True:
+            try:
+                return future.result(timeout = 1)
+            except concurrent.futures.TimeoutError:
+                if cancelled.is_set():
+                    future.cancel()
+                    raise DownloadCancelled()
+
+    connection = None
+    try:
+        connection = engine.raw_connection()
+        writer = _GzipQueueWriter(put, cancelled)
+        cursor = connection.cursor()
+        cursor.copy_expert(f'COPY ({query}) TO STDOUT WITH CSV HEADER', writer)
+        cursor.close()
+        writer.close()
+        put(None)
+    except DownloadCancelled:
+        pass
+    except Exception as e:
+        if not cancelled.is_set():
+            put(e)
+            put(None)
+    finally:
+        if connection is not None:
+            connection.close()
+
+def downloadRoutes():
+    '''Returns the routes for the streaming downloads, to be passed as extra_patterns to the bokeh server'''
+    _routeState['registered'] = True
+
+    return [(allDataRoute, DownloadAllDataHandler),
+            (allDataParquetRoute, DownloadAllDataParquetHandler)]
+
+async def sendFile(handler, filePath, fileInfo):
+    '''Send a file from the latest export in chunks. {fileInfo} is its entry in the export manifest'''
+    handler.set_header('Etag', f'"{fileInfo["sha256"]}"')
+    if handler.check_etag_header():
+        handler.set_status(304)
+        return
+
+    handler.set_header('Content-Length', fileInfo['bytes'])
+    loop = asyncio.get_event_loop()
+    try:
+        with open(filePath, 'rb') as file:
+            while True:
+                chunk = await loop.run_in_executor(None, file.read, chunkSize)
+                if len(chunk) == 0:
+                    break
+                handler.write(chunk)
+                await handler.flush()
+    except StreamClosedError:
+        pass
+
+def parquetDownloadUrl():
+    '''Returns the url of the Parquet download of all data, or None if it is not available'''
+    # Imported here to avoid a circular import
+    from UtilityFunctions.exportArtifacts import latestExportFile
+
+    if _routeState['registered'] and latestExportFile('parquet')[0] is not None:
+        return allDataParquetRoute
+
+    return None
+
+def streamingDownloadUrl():
+    '''Returns the url of the streaming download of all data, or None if it is not available.
+    The url can be set with the environment variable DOWNLOAD_ALL_DATA_URL, e.g. if the handler is served behind a proxy'''
+    url = os.getenv('DOWNLOAD_ALL_DATA_URL')
+    if url:
+        return url
+
+    if _routeState['registered']:
+        return allDataRoute
+
+    return None
+
+
+#%% Request handlers
+class DownloadAllDataHandler(RequestHandler):
+    '''Stream all data in the database as a gzipped csv file. The latest export is sent if it is up to date, otherwise the data is read from the database'''
+    async def get(self):
+        # Imported here to avoid a circular import
+        from UtilityFunctions.exportArtifacts import latestExportFile
+
+        self.set_header('Content-Type', 'text/csv; charset=utf-8')
+        self.set_header('Content-Encoding', 'gzip')
+        self.set_header('Content-Disposition', f'attachment; filename="{allDataFileName}"')
+
+        filePath, fileInfo = latestExportFile('csvGz')
+        if filePath is not None:
+            await sendFile(self, filePath, fileInfo)
+            return
+
+        self._cancelled = threading.Event()
+        chunks = asyncio.Queue(maxsize = queueSize)
+        reader = threading.Thread(target = copyQueryToQueue, args = (getEngine(), allDataQuery(), chunks, asyncio.get_event_loop(), self._cancelled), daemon = True)
+        reader.start()
+
+        try:
+            while True:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                elif isinstance(chunk, Exception):
+                    print(f'Streaming download failed: {chunk}')
+                    if not self._headers_written:
+                        self.clear()
+                        self.send_error(500)
+                    else:
+                        # The headers have already been sent, so the client can only be told by closing the conection
+                        self.request.connection.close()
+                    return
+
+                self.write(chunk)
+                await self.flush()
+        except StreamClosedError:
+            pass
+        finally:
+            self._cancelled.set()
+
+    def on_connection_close(self):
+        if hasattr(self, '_cancelled'):
+            self._cancelled.set()
+
+class DownloadAllDataParquetHandler(RequestHandler):
+    '''Send the Parquet file from the latest export'''
+    async def get(self):
+        # Imported here to avoid a circular import
+        from UtilityFunctions.exportArtifacts import artifactFileNames, latestExportFile
+
+        filePath, fileInfo = latestExportFile('parquet')
+        if filePath is None:
+            self.send_error(404)
+            return
+
+        self.set_header('Content-Type', 'application/octet-stream')
+        self.set_header('Content-Disposition', f'attachment; filename="{artifactFileNames["parquet"]}"')
+        await sendFile(self, filePath, fileInfo)
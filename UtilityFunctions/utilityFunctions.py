@@ -6,32 +6,24 @@
 # =============================================================================
 
 from datetime import datetime
-import os
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
-
-from ConectionDetails.databaseConfiguration import databaseConfiguration
+from sqlalchemy import text
 
+from UtilityFunctions.artifactWriter import writeDataFrame, writeDataFrameInBackground
+from UtilityFunctions.categoryCatalog import categoryCatalogEntry
+from UtilityFunctions.columnCache import getColumns, getConvertedColumn
+from UtilityFunctions.dataSnapshot import loadDataFromSnapshot
+from UtilityFunctions.engineRegistry import getEngine
 import UtilityFunctions.CleanDataV5 as cleanData
 import UtilityFunctions.CompleatDataV5 as compleatData
 
 
 def conectToDatabase():
-    '''Create a conection to the database and return the conection engine'''
-
-    # Reading in configuration details for accessing the database
-    dbConfig = databaseConfiguration()
-
-    # The conection string to the Postgres database
-    conection_string = 'postgresql+psycopg2://' + dbConfig['user'] + ':' + dbConfig['password'] + '@' + dbConfig['host'] + '/' + dbConfig['database']
-
-    # Conect to the database
-    try:
-        engine = create_engine(conection_string)
-        print(f"Connection to {dbConfig['host']} established")
-    except:
-        print(f"Conection to {dbConfig['host']} failed")
+    '''Return the conection engine to the database. The engine is shared by all sessions in the process'''
+    # All sessions in the process share one engine and its conection pool
+    engine = getEngine()
 
     return engine
 
@@ -41,33 +33,16 @@ def convertNumerListToFloats(numberList):
     # Convert data to strings
     numberList = numberList.astype(str)
 
-    # identify all strings with more than one element, by utlising that they contain the pattern ' | '
-    x = numberList.str.contains(' | ') == True
+    # Most entries are repeated, so each unique string is only converted once
+    codes, uniques = pd.factorize(numberList)
 
-    # Get a list of the indexes where the abowe condition holds
-    indexlist = list(numberList[x].index)
-
-    # Loop over all instances with more than one number
-    for index in indexlist:
-        # Ensure that entry is a string
-        y = str(numberList[index]).strip()
-
-        # Keep the first entry
-        y = y.split(' | ')[0].strip()
-
-        # Convert number into a float
-        try:
-            number = float(y)
-        except:
-            number = np.nan
-
-        # Uppdate data
-        numberList.loc[index] = number
+    # Keep the first entry in lists separated by ' | '. Partition does not interpret the separator as a regular expression
+    uniques = pd.Series(uniques).str.strip().str.partition(' | ')[0].str.strip()
 
     # Convert everything to floats
-    numberList = pd.to_numeric(numberList, errors = 'coerce')
+    numbers = pd.to_numeric(uniques, errors = 'coerce').values.astype(float)
 
-    return numberList
+    return pd.Series(numbers[codes], index = numberList.index, name = numberList.name)
 
 def database_details():
     '''Returns detailes of the database to work with '''
@@ -82,20 +57,9 @@ def database_details():
 
 def databaseCategoriesMostCommon(column, number, engine):
     '''Extract the {number} most comon categories in the column {column} in the database'''
-    # Database details
-    bd_details = database_details()
-    table = bd_details['table']
-    schema = bd_details['schema']
-
-    # String maipulation to get it to work with the sql statement
-    columnString = f'"{column}"'
-
-    # Query the database. Coresponds to pd.values_count()
-    valueCounts = pd.read_sql_query(sql=f"select {columnString}, count(*) from {schema}.{table} GROUP BY {columnString}", con=engine)
+    # Get the categories in order of occurance from the category catalog
+    categories = categoryCatalogEntry(column = column, engine = engine)['byFrequency']
 
-    # Sort categories in order of occurance
-    categories = list(valueCounts.sort_values(by='count', ascending=False)[column])
-    
     # Select the {number} most common categories
     categories = categories[0:number]
 
@@ -109,21 +73,9 @@ def databaseCategoriesMostCommon(column, number, engine):
 
 def databaseCategoriesMostCommon_withBoleanFilter(column, boleanColumn, number, engine):
     '''Extract the {number} most comon categories in the column {column} in the database'''
-    # Database details
-    bd_details = database_details()
-    table = bd_details['table']
-    schema = bd_details['schema']
+    # Get the categories in order of occurance from the category catalog
+    categories = categoryCatalogEntry(column = column, engine = engine, boleanColumn = boleanColumn)['byFrequency']
 
-    # String maipulation to get it to work with the sql statement
-    columnString = f'"{column}"'
-    boleanColumnString = f'"{boleanColumn}"'
-
-    # Query the database. Coresponds to pd.values_count()
-    valueCounts = pd.read_sql_query(sql=f"select {columnString}, count(*) from {schema}.{table} where {table}.{boleanColumnString} is TRUE GROUP BY {columnString}", con=engine)
-
-    # Sort categories in order of occurance
-    categories = list(valueCounts.sort_values(by='count', ascending=False)[column])
-    
     # Select the {number} most common categories
     categories = categories[0:number]
 
@@ -137,75 +89,31 @@ def databaseCategoriesMostCommon_withBoleanFilter(column, boleanColumn, number,
 
 def databaseCatagoriesUnique(column, engine):
     '''Extract all unique values in the column {column} in the database'''
-    # Database details
-    bd_details = database_details()
-    table = bd_details['table']
-    schema = bd_details['schema']
-
-    # String maipulation to get it to work with the sql statement
-    columnString = f'"{column}"'
-
-    # Query the database for uniue values
-    values = pd.read_sql_query(sql=f"select distinct {columnString} from {schema}.{table}", con=engine)
-
-    # Sort categoreis in alphabetic order
-    values.sort_values(by=column, inplace=True)
-
-    # Extract the categoreis
-    categories = list(values[column])
+    # Get the categoreis in alphabetic order from the category catalog
+    categories = list(categoryCatalogEntry(column = column, engine = engine)['unique'])
 
     return categories
 
 def databaseCatagoriesUnique_withBoleanFilter(column, boleanColumn, engine):
     '''Extract all unique values in the column {column} in the database'''
-    # Database details
-    bd_details = database_details()
-    table = bd_details['table']
-    schema = bd_details['schema']
-
-    # String maipulation to get it to work with the sql statement
-    columnString = f'"{column}"'
-    boleanColumnString = f'"{boleanColumn}"'
-
-    # Query the database for uniue values
-    values = pd.read_sql_query(sql=f"select distinct {columnString} from {schema}.{table} where {table}.{boleanColumnString} is TRUE", con=engine)
-
-    # Sort categoreis in alphabetic order
-    values.sort_values(by=column, inplace=True)
-
-    # Extract the categoreis
-    categories = list(values[column])
+    # Get the categoreis in alphabetic order from the category catalog
+    categories = list(categoryCatalogEntry(column = column, engine = engine, boleanColumn = boleanColumn)['unique'])
 
     return categories
 
-def dataCitationData(DOInumbers, defaultDate, defaultAuthor, DOIPath, filePaths):
-    '''Extract citation data from CrossRef based on the DOI number '''
+def dataCitationData(DOInumbers, defaultDate, defaultAuthor, DOIPath, filePaths, background = False):
+    '''Extract citation data from CrossRef based on the DOI number. If {background}, the file is saved in a background thread'''
 
     # Get citation data
     referenceData = compleatData.citationData(DOInumbers, defaultDate, defaultAuthor, DOIPath)
     
-    # Extract file ending
-    fileEnding = os.path.splitext(os.path.basename(filePaths['dataCitationFilePath']))[1]
-
-    # Save cleaned data
-    if fileEnding == '.xlsx':
-        try:
-            referenceData.to_excel(filePaths['dataCitationFilePath'], index = False)
-            print(f'Saved citation data')
-        except:
-            print(f'Failed to save citation data based on: {filePaths["dataOriginalFileName"]}')
-
-    else:
-        try:
-            referenceData.to_csv(filePaths['dataCitationFilePath'], index = False, encoding='utf-8-sig')
-            print(f'Saved citation data')
-        except:
-            print(f'Failed to save citation data based on: {filePaths["dataOriginalFileName"]}')
+    # Save citation data
+    saveData(referenceData, filePaths['dataCitationFilePath'], 'citation', filePaths['dataOriginalFileName'], background)
 
     return referenceData
 
-def dataCleaning(userData, filePaths):
-    '''Run a data cleaning and formating rutine on the data'''
+def dataCleaning(userData, filePaths, background = False):
+    '''Run a data cleaning and formating rutine on the data. If {background}, the file is saved in a background thread'''
 
     # Clean the data
     try:
@@ -213,34 +121,13 @@ def dataCleaning(userData, filePaths):
     except:
         print(f'Failed to clean data for: {filePaths["dataOriginalFileName"]}')
 
-    # Extract file ending
-    #fileEnding = os.path.splitext(os.path.basename(filePaths['dataOriginalFileName']))[1]
-    fileEnding = os.path.splitext(os.path.basename(filePaths['dataCleanedFilePath']))[1]
-
     # Save cleaned data
-    if fileEnding == '.xlsx':
-        try:
-           cleanedData.to_excel(filePaths['dataCleanedFilePath'], index = False)
-           print(f'Saved cleaned data')
-        except:
-           print(f'Failed to saved clean data at {filePaths["dataOriginalFileName"]}')
-
-    else:
-        try:
-            cleanedData.to_csv(filePaths['dataCleanedFilePath'], index = False, encoding='utf-8-sig')
-            print(f'Saved cleaned data')
-        except:
-            try:
-                cleanedData = cleanedData.applymap(lambda x: x.encode('unicode_escape').decode('utf-8') if isinstance(x, str) else x)
-                cleanedData.to_csv(filePaths['dataCleanedFilePath'], index = False)
-                print(f'Saved cleaned data after unicode escape')
-            except:
-                print(f'Failed to saved clean data at {filePaths["dataOriginalFileName"]}')
+    saveData(cleanedData, filePaths['dataCleanedFilePath'], 'cleaned', filePaths['dataOriginalFileName'], background)
 
     return cleanedData
 
-def dataDeriveNewColumns(cleanedData, filePaths):
-    '''Deriv data for aditional columns based on the cleaned data'''
+def dataDeriveNewColumns(cleanedData, filePaths, background = False):
+    '''Deriv data for aditional columns based on the cleaned data. If {background}, the file is saved in a background thread'''
 
     # Derive the data
     try:
@@ -248,28 +135,13 @@ def dataDeriveNewColumns(cleanedData, filePaths):
     except:
         print(f'Failed to derive additional data based on: {filePaths["dataOriginalFileName"]}')
 
-    # Extract file ending
-    fileEnding = os.path.splitext(os.path.basename(filePaths['dataDerivedFilePath']))[1]
-
-    # Save cleaned data
-    if fileEnding == '.xlsx':
-        try:
-           derivedData.to_excel(filePaths['dataDerivedFilePath'], index = False)
-           print(f'Saved derived data')
-        except:
-           print(f'Failed to saved derived data at {filePaths["dataOriginalFileName"]}')
-
-    else:
-        try:
-            derivedData.to_csv(filePaths['dataDerivedFilePath'], index = False, encoding='utf-8-sig')
-            print(f'Saved derived data')
-        except:
-            print(f'Failed to save derived aditional data based on: {filePaths["dataOriginalFileName"]}')
+    # Save derived data
+    saveData(derivedData, filePaths['dataDerivedFilePath'], 'derived', filePaths['dataOriginalFileName'], background)
 
     return derivedData
 
-def dataMergeData(cleanedData, derivedData, citationData, filePaths):
-    '''Merge cleanedData, derivedData and citationData into one document ready for databse uploading'''
+def dataMergeData(cleanedData, derivedData, citationData, filePaths, background = False):
+    '''Merge cleanedData, derivedData and citationData into one document ready for databse uploading. If {background}, the file is saved in a background thread'''
 
     # Merge the data
     try:
@@ -277,23 +149,8 @@ def dataMergeData(cleanedData, derivedData, citationData, filePaths):
     except:
         print(f'Failed to merged data into one file for: {filePaths["dataOriginalFileName"]}')
 
-    # Extract file ending
-    fileEnding = os.path.splitext(os.path.basename(filePaths['dataCompleatFilePath']))[1]
-
-    # Save cleaned data
-    if fileEnding == '.xlsx':
-        try:
-            mergedData.to_excel(filePaths['dataCompleatFilePath'], index = False)
-            print(f'Saved compleated data')
-        except:
-            print(f'Failed to save compleated data based on: {filePaths["dataOriginalFileName"]}')
-
-    else:
-        try:  
-            mergedData.to_csv(filePaths['dataCompleatFilePath'], index = False, encoding='utf-8-sig')
-            print(f'Saved compleated data')
-        except:
-            print(f'Failed to save compleated data based on: {filePaths["dataOriginalFileName"]}')
+    # Save compleated data
+    saveData(mergedData, filePaths['dataCompleatFilePath'], 'compleated', filePaths['dataOriginalFileName'], background)
 
     return mergedData
 
@@ -331,70 +188,63 @@ def dataManipulation(data):
                       'Stability_time_total_exposure',
                       ]
             
-    # replace Nan with -1 in the columns that may be plotted
+    # replace Nan with -1 in the columns that may be plotted. The columns are replaced rather than changed in place as data from the column cache is read only
+    # Conversions of columns from the column cache are done once per process and are shared by all sessions
     for column in list(data.columns):
         if column in numericColumns:
-            data[column].fillna(value = -1, inplace = True)
+            data[column] = getConvertedColumn(data[column], column, 'numeric', fillMissingNumbers)
 
     # Convert the band gap column to numeric values (and keeping the first value if multiple values)
     if 'Perovskite_band_gap' in list(data.columns):
         data['Perovskite_band_gap_string'] = data['Perovskite_band_gap'] 
-        data['Perovskite_band_gap'] = convertNumerListToFloats(data['Perovskite_band_gap'])
-        data['Perovskite_band_gap'].fillna(value = -1, inplace = True)
+        data['Perovskite_band_gap'] = getConvertedColumn(data['Perovskite_band_gap'], 'Perovskite_band_gap', 'bandGap', bandGapToFloats)
 
     # Time data
     if 'Ref_publication_date' in list(data.columns):
-        data['Ref_publication_date'] = pd.to_datetime(data['Ref_publication_date'], errors="coerce")
         # Replace corupt values with todays date
         todays_time = pd.to_datetime(datetime.now().strftime("%Y-%m-%d"))
-        data['Ref_publication_date'].fillna(todays_time, inplace=True)
+        data['Ref_publication_date'] = getConvertedColumn(data['Ref_publication_date'], 'Ref_publication_date', f'date_{todays_time.date()}', lambda x: pd.to_datetime(x, errors="coerce").fillna(todays_time))
 
     # Extract the higher temperature in the temperature range and add that as a separate column
     if 'Outdoor_temperature_range' in list(data.columns):
         #data['Outdoor_temperature_range_max'] = getMaxTemperature(data['Outdoor_temperature_range'])
-        data['Outdoor_temperature_range'] = getMaxTemperature(data['Outdoor_temperature_range'])
+        data['Outdoor_temperature_range'] = getConvertedColumn(data['Outdoor_temperature_range'], 'Outdoor_temperature_range', 'maxTemperature', getMaxTemperature)
 
 
     # Extract the higher temperature in the temperature range and add that as a separate column
     if 'Stability_temperature_range' in list(data.columns):
         #data['Stability_temperature_range_max'] = getMaxTemperature(data['Stability_temperature_range'])
-        data['Stability_temperature_range'] = getMaxTemperature(data['Stability_temperature_range'])
+        data['Stability_temperature_range'] = getConvertedColumn(data['Stability_temperature_range'], 'Stability_temperature_range', 'maxTemperature', getMaxTemperature)
 
 
     return data
 
-def getMaxTemperature(data):
-    '''Take a panadas series with entries as strings in the format 'value1; value2' and returns a list with the highest of the two numbers '''
-
-    # Internal helper function
-    def convertToNumber(x):
-        try:
-            number = float(x)
-        except:
-            number = np.nan
+def fillMissingNumbers(data):
+    '''Replace Nan with -1 in a column that may be plotted'''
+    return data.fillna(value = -1)
 
-        return number
+def bandGapToFloats(data):
+    '''Convert the band gap column to numeric values, keeping the first value if multiple values. Missing values are replaced with -1'''
+    return convertNumerListToFloats(data).fillna(value = -1)
 
-    maxTemp = []
-    for item in data:
-        # Ensure that data is a string
-        temperaturString = str(item).strip()
-
-        # Separate the entries into a list
-        temperaturListString = temperaturString.split(';')
+def getMaxTemperature(data):
+    '''Take a panadas series with entries as strings in the format 'value1; value2' and returns an array with the highest of the two numbers '''
 
-        T = []
-        for temperature in temperaturListString:
-            # Remove blank spaces
-            temperature = temperature.strip()
+    # Most entries are repeated, so each unique string is only converted once
+    codes, uniques = pd.factorize(pd.Series(data).astype(str))
+    if len(uniques) == 0:
+        return np.full(len(codes), np.nan)
 
-            # convert to a number and add to temporary list
-            T.append(convertToNumber(temperature))
+    # Separate the entries into one column per value and convert to numbers
+    temperatures = pd.Series(uniques).str.strip().str.split(';', expand = True)
+    temperatures = temperatures.apply(lambda x: pd.to_numeric(x.str.strip(), errors = 'coerce')).values.astype(float)
 
-        # Append the higest number
-        maxTemp.append(max(T))   
+    # The higest number. As for the built in max function, an entry where the first value is not a number gives nan
+    maxTemp = np.full(len(temperatures), np.nan)
+    firstIsNumber = ~np.isnan(temperatures[:, 0])
+    maxTemp[firstIsNumber] = np.nanmax(temperatures[firstIsNumber], axis = 1)
 
-    return maxTemp
+    return maxTemp[codes]
 
 def integerList(item):
     '''Takes in text string with integers separated by ; and returns a list of the integers'''
@@ -432,35 +282,79 @@ def is_number(s):
         return False
 
 def loadData(dataColumns, engine):
-    '''Read in the data from the database. Takes a list of columns and a conection engine as argument and returns the fetched data'''
+    '''Read in the data from the database. Takes a list of columns and a conection engine as argument and returns the fetched data.
+    Columns are served from the process wide column cache and are read only. Columns not in the cache are read from the data snapshot if it is up to date, and otherwise from the database'''
+    # Database details
+    bd_details = database_details()
+    ID = bd_details['bd_key']
+
+    # Internal helper function reading the columns missing in the cache
+    def fetchColumns(columns):
+        data = loadDataFromSnapshot(dataColumns = columns)
+        if data is None:
+            data = loadDataFromDatabase(dataColumns = columns, engine = engine)
+        return data
+
+    # Get data from the cache
+    data = getColumns(dataColumns = dataColumns, fetchColumns = fetchColumns, key = ID)
+
+    return data
+
+def loadDataByID(IDs, engine, dataColumns = None, chunkSize = 10000):
+    '''Read in the rows with the database ID:s in {IDs}. Takes an optional list of columns. By default all columns are returned.
+    The ID:s are passed to the query as an array parameter, and large selections are read in chunks of {chunkSize} ID:s'''
     # Database details
     bd_details = database_details()
     table = bd_details['table']
     schema = bd_details['schema']
+    ID = bd_details['bd_key']
+
+    # Remove dublicates and ensure that the ID:s are integers. Sorted so that the chunks together are in ID order
+    IDs = sorted(set(int(x) for x in IDs))
+
+    # String maipulation to get it to work with the sql statement
+    dataColumnsString = '*' if dataColumns is None else ', '.join(f'"{c}"' for c in dataColumns)
+    query = text(f'''select {dataColumnsString} from {schema}.{table} where {table}."{ID}" = ANY(:IDs) order by {table}."{ID}"''')
+
+    # Get data from the database. At least one query is made so that the columns are returned also when there are no ID:s
+    chunks = []
+    for start in range(0, max(len(IDs), 1), chunkSize):
+        chunks.append(pd.read_sql_query(sql = query, con = engine, params = {'IDs' : IDs[start : start + chunkSize]}))
+
+    data = pd.concat(chunks, ignore_index = True)
+
+    return data
+
+def loadDataFromDatabase(dataColumns, engine):
+    '''Read in the data from the database bypassing the column cache. The rows are ordered by the database key so that columns read at different times line up'''
+    # Database details
+    bd_details = database_details()
+    table = bd_details['table']
+    schema = bd_details['schema']
+    ID = bd_details['bd_key']
 
     # String maipulation to get it to work with the sql statement
     dataColumnsString = ', '.join(f'"{c}"' for c in dataColumns)
 
     # Get data from the database
-    data = pd.read_sql_query(sql=f"select {dataColumnsString} from {schema}.{table}", con = engine)
+    data = pd.read_sql_query(sql=f'''select {dataColumnsString} from {schema}.{table} order by {table}."{ID}"''', con = engine)
 
     return data
 
 def loadData_withBoleanFilter(dataColumns, boleanColumn, engine):
-    '''Read in the data from the database. Takes a list of columns, a column hat must be true, and a conection engine as argument and returns the fetched data'''
+    '''Read in the data from the database. Takes a list of columns, a column hat must be true, and a conection engine as argument and returns the fetched data.
+    For the columns in dataTableClass_V5_31.booleanSubsets, only the qualifying rows are read through a partial index. The rows are ordered by the database key'''
     # Database details
     bd_details = database_details()
     table = bd_details['table']
     schema = bd_details['schema']
-
-    boleanColumn = [boleanColumn]
+    ID = bd_details['bd_key']
 
     # String maipulation to get it to work with the sql statement
     dataColumnsString = ', '.join(f'"{c}"' for c in dataColumns)
-    boleanColumnString = ', '.join(f'"{c}"' for c in boleanColumn)
 
-    # Get data from the database
-    data = pd.read_sql_query(sql=f"select {dataColumnsString} from {schema}.{table} where {table}.{boleanColumnString} is TRUE", con = engine)
+    # Get data from the database. The condition is written as in the partial indexes so that the query planner can use them
+    data = pd.read_sql_query(sql=f'select {dataColumnsString} from {schema}.{table} where {table}."{boleanColumn}" is TRUE order by {table}."{ID}"', con = engine)
 
     return data
 
@@ -513,6 +407,13 @@ def readDataFromDatabase_v2(table, schema, dataColumns, engine):
 
     return data
 
+def saveData(data, filePath, description, fileName, background = False):
+    '''Save data from the upload steps as xlsx or csv, see artifactWriter. If {background}, a copy is saved in a background thread'''
+    if background:
+        writeDataFrameInBackground(data, filePath, description, fileName)
+    else:
+        writeDataFrame(data, filePath, description, fileName)
+
 def toolTipsDict():
     '''Return dictionary of posible selected hover tools '''
 
@@ -20,6 +20,8 @@ from tornado.ioloop import IOLoop
 from dotenv import load_dotenv
 load_dotenv()
 
+from UtilityFunctions.streamingDownload import downloadRoutes
+
 
 #%% list of filepaths to the bokeh apps to serve
 files = [os.path.join('dashboards', 'RecordEvolution'),
@@ -41,18 +43,21 @@ for app in files:
     argvs[app]=None
     paths.append(app)
 
-# Turn file path into bokeh apps
-apps = build_single_handler_applications(paths, argvs)
-
 # Function that starts the server   
 def bk_worker():
     # Can't pass num_procs > 1 in this configuration. If you need to run multiple
     # processes, see e.g. flask_gunicorn_embed.py
 
     #myServer = Server(apps, io_loop=IOLoop(), allow_websocket_origin=["127.0.0.1:5006", "127.0.0.1:5100",  "localhost:5006", "localhost:5100"])  
-    myServer = Server(apps, io_loop=IOLoop(), allow_websocket_origin=["*"])  
+    # The streaming downloads are served by the same server as the apps
+    myServer = Server(apps, io_loop=IOLoop(), allow_websocket_origin=["*"], extra_patterns=downloadRoutes())  
     myServer.start()
     myServer.io_loop.start()
 
 #%% Runing a thred starting the server (do not realy understand how this works)
-Thread(target=bk_worker).start()   
\ No newline at end of file
+# Only when run as a script. The processes cleaning uploaded data import this file again when they are started
+if __name__ == '__main__':
+    # Turn file path into bokeh apps
+    apps = build_single_handler_applications(paths, argvs)
+
+    Thread(target=bk_worker).start()   
\ No newline at end of file
@@ -40,19 +40,38 @@ import numpy as np
 import pandas as pd
 
 from UtilityFunctions.categoricalColors import categoricalColors
+from UtilityFunctions.categoryCatalog import warmCategoryCatalog
+from UtilityFunctions.columnCache import getConvertedColumn
+from UtilityFunctions.filterEngine import filterIsIn, filterIsTrue, filterNotIn, filterOpenRange, invalidateFilterMasks, selectRowIndices
+from UtilityFunctions.sourceUpdates import updateColumnDataSource
 from UtilityFunctions.utilityFunctions import (conectToDatabase,
+    bandGapToFloats,
     convertNumerListToFloats,
     databaseCategoriesMostCommon,
     databaseCatagoriesUnique,
-    database_details,
     dataManipulation,
+    fillMissingNumbers,
     integerList,
     is_number,
     loadData,
+    loadDataByID,
     toolTipsDict,
     toolTipsMap)
 
 
+#%% Parameters
+# The Shockley-Queisser limit, read once per process. {fileName : dataframe}
+_SQlimit = {}
+
+# The columns compared to the SQ limit, {column : (column in the SQ data, scale factor)}
+SQcolumns = {
+    'JV_default_PCE' : ('PCE (%)', 1),
+    'JV_default_Voc' : ('Voc (V)', 1),
+    'JV_default_Jsc' : ('Jsc (mA/cm^2)', 1),
+    'JV_default_FF' : ('FF (%)', 100),
+    }
+
+
 #%% helper functions
 def getAppInstructions(fileName = 'Instructions.txt'):
     '''Read in text file with instructions'''
@@ -400,12 +419,32 @@ def style(p, fontSize = 14):
 
     return p   
 
+def getSQlimit(fileName = 'SQ limit.csv'):
+    '''Read in the Shockley-Queisser limit as a function of the band gap. The file is only read once per process and the data is shared by all sessions'''
+    if fileName not in _SQlimit:
+        #The file shoud be placed in the same folder as the main script
+        path = pathlib.Path(__file__).parent.absolute()
+        filePath = os.path.join(path, fileName)
+        _SQlimit[fileName] = pd.read_csv(filePath)
+
+    return _SQlimit[fileName]
+
 def SQ_potential(data, QEdata):
-    ''' Compute the losses with respect to the SQ limit '''
-    PCE_SQ = np.interp(data['Perovskite_band_gap'],QEdata['Bandgap (eV)'],QEdata['PCE (%)']) - data['JV_default_PCE']
-    Voc_SQ = np.interp(data['Perovskite_band_gap'],QEdata['Bandgap (eV)'],QEdata['Voc (V)']) - data['JV_default_Voc']
-    Jsc_SQ = np.interp(data['Perovskite_band_gap'],QEdata['Bandgap (eV)'],QEdata['Jsc (mA/cm^2)']) - data['JV_default_Jsc']
-    FF_SQ = np.interp(data['Perovskite_band_gap'],QEdata['Bandgap (eV)'],QEdata['FF (%)'])/100 - data['JV_default_FF']
+    ''' Compute the losses with respect to the SQ limit. {data} is the data as read with loadData, before dataManipulation.
+    The losses are kept in the column cache, so they are computed once per process and recomputed only if the band gap or the JV data change'''
+    def computeLoss(bandGap, column, SQcolumn, scale):
+        '''The SQ limit at the band gap minus the value in {column}, both formated as in dataManipulation'''
+        bandGap = getConvertedColumn(bandGap, 'Perovskite_band_gap', 'bandGap', bandGapToFloats)
+        values = getConvertedColumn(data[column], column, 'numeric', fillMissingNumbers)
+        return np.interp(bandGap, QEdata['Bandgap (eV)'], QEdata[SQcolumn])/scale - values
+
+    losses = []
+    for column, (SQcolumn, scale) in SQcolumns.items():
+        losses.append(getConvertedColumn(data['Perovskite_band_gap'], 'Perovskite_band_gap', f'SQ_loss_{column}',
+                                         lambda x, column = column, SQcolumn = SQcolumn, scale = scale: computeLoss(x, column, SQcolumn, scale),
+                                         dependsOn = {column : data[column]}))
+
+    PCE_SQ, Voc_SQ, Jsc_SQ, FF_SQ = losses
 
     return PCE_SQ, Voc_SQ, Jsc_SQ, FF_SQ
 
@@ -441,22 +480,11 @@ def interactiveEngine():
     def downloadDataTable(event):
         '''Download selected data in table as .csv-file '''
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-        ID = bd_details['bd_key']
-
         # The Ref_ID for all selected cells
         Cell_ID_numbers = list(mainDataFrame.loc[global_selectedRows]['Ref_ID'])
 
-        # Forrmat the Cell_ID_numbers for the SQL query
-        IDnumbersString = [str(x) for x in Cell_ID_numbers]
-        IDnumbersString = '(' + ','.join(IDnumbersString) + ')'
-
         # Query the database for all data for the selected cells
-        query = f'''select * from {schema}.{table} where {table}."{ID}" in {IDnumbersString}'''
-        query_results = pd.read_sql_query(sql = query, con = engine)
+        query_results = loadDataByID(IDs = Cell_ID_numbers, engine = engine)
 
         # Download results
         if len(query_results) != 0:
@@ -471,22 +499,11 @@ def interactiveEngine():
     def downloadDataTableLasso(event):
         '''Download selected data in table as .csv-file '''
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-        ID = bd_details['bd_key'] 
-
         # The Ref_ID for all selected cells
         Cell_ID_numbers = list(mainDataFrame.loc[source.selected.indices]['Ref_ID'])
 
-        # Forrmat the Cell_ID_numbers for the SQL query
-        IDnumbersString = [str(x) for x in Cell_ID_numbers]
-        IDnumbersString = '(' + ','.join(IDnumbersString) + ')'
-
         # Query the database for all data for the selected cells
-        query = f'''select * from {schema}.{table} where {table}."{ID}" in {IDnumbersString}'''
-        query_results = pd.read_sql_query(sql = query, con = engine)
+        query_results = loadDataByID(IDs = Cell_ID_numbers, engine = engine)
 
         # Download results
         if len(query_results) != 0:
@@ -592,57 +609,61 @@ def interactiveEngine():
         return newCategories
  
     def select_data(data):
-        '''Start by selecting all data and succesivly narrow it down'''
+        '''Returns the index of the rows passing all active filters. The mask for each filter is cached so only filters that have changed are recomputed'''
 
         # Categories in dataset so far fetched from the database
         presentDataCategories = list(data.columns)
 
+        # The active filters. One per widget
+        filters = {}
+
         # Filter out nan values in the categories that should be plotted (nan values have previously been set to -1)
-        #data = data[data[y_axis_map[selects['y_axis'].value]] != -1]
-        #data = data[data[x_axis_map[selects['x_axis'].value]] != -1]
+        #filters['y_axis'] = filterNotEqual(y_axis_map[selects['y_axis'].value], -1)
+        #filters['x_axis'] = filterNotEqual(x_axis_map[selects['x_axis'].value], -1)
 
         #%% Checkboxbuttongroups
-        # For each active filter, sucessivly sort out entries where those values are True
+        # For each active filter, sort out entries where those values are True
         for category in checkBoxButtons:
             if category in presentDataCategories:
                 if 0 in checkBoxButtons[category].active:
-                    data = data[data[category] == True]
+                    filters['checkBoxButtons_' + category] = filterIsTrue(category)
 
         #%% Multiselects long
         for category in multiselects:
             if category in presentDataCategories:
                 if 'All' not in multiselects[category].value:
-                    data = data[data[category].isin(multiselects[category].value)]
+                    filters['multiselects_' + category] = filterIsIn(category, multiselects[category].value)
 
         #%% Multiselects short
         for category in multiselectsShort:
             if category in presentDataCategories:
                 if 'All' not in multiselectsShort[category].value:
-                    data = data[data[category].isin(multiselectsShort[category].value)]
+                    filters['multiselectsShort_' + category] = filterIsIn(category, multiselectsShort[category].value)
 
         #%% Sliders
         for category in rangeSliders:
             if category in presentDataCategories:
                 if rangeSliders[category].value[0] > sliderLimits[category][0] or rangeSliders[category].value[1] < sliderLimits[category][1]:
-                    data = data[(data[category] > rangeSliders[category].value[0]) & (data[category] < rangeSliders[category].value[1])]
+                    filters['rangeSliders_' + category] = filterOpenRange(category, rangeSliders[category].value[0], rangeSliders[category].value[1])
 
         # The data range slider apears to behave differently on different systems
         if 'Ref_publication_date' in presentDataCategories:
             try:
                 datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))
             except:
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0])) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))
 
         #%% Text input
         if 'Ref_ID' in presentDataCategories: 
             if textInputControlls['excludeCellID'].value != '':
                 ID_to_drop = integerList(textInputControlls['excludeCellID'].value)
-                data = data[~data['Ref_ID'].isin(ID_to_drop)]
+                filters['excludeCellID'] = filterNotIn('Ref_ID', ID_to_drop)
 
-        return data
+        #%% Return the index of the rows passing all filters
+        return selectRowIndices(data, filters, global_filterMasks)
 
     def update():
         ''' Uppdate the data selection''' 
@@ -651,14 +672,14 @@ def interactiveEngine():
         updateMainDataFrame(columnsToDownload)
 
         # Uppdate the selection of data to plot based on the filters selected by the user
-        newSelectionOfData = select_data(mainDataFrame)
+        selectedRows = select_data(mainDataFrame)
  
         # Uppdate the column data source with the new data selection (older solution. takes a lot of time)
-        updateSource(categories = list(newSelectionOfData.columns))        
+        updateSource(categories = list(mainDataFrame.columns))        
  
         # Update the list of indicies for the selected data so that it can be accessed by remaining internal functions
         global_selectedRows.clear()
-        global_selectedRows.extend(list(newSelectionOfData.index))
+        global_selectedRows.extend(selectedRows)
 
         # Uppdate the view of the columnDataSource
         view.filters = [IndexFilter(global_selectedRows)]
@@ -685,7 +706,7 @@ def interactiveEngine():
         dataSelection = mainDataFrame.loc[global_selectedRows]
 
         # Uppdate the columnDataSource responsible for the datatabel with the currently selected data
-        sourceDataTable.data = dataSelection.to_dict('series')
+        updateColumnDataSource(sourceDataTable, dataSelection)
 
         # STOP WAINTING SPINNER
 
@@ -711,7 +732,7 @@ def interactiveEngine():
         dataSelection = mainDataFrame.loc[source.selected.indices]
 
         # Uppdate the columnDataSource responsible for the datatabel with the currently selected data
-        sourceLassoSelect.data = dataSelection.to_dict('series')
+        updateColumnDataSource(sourceLassoSelect, dataSelection)
 
         # STOP WAINTING SPINNER
 
@@ -739,6 +760,9 @@ def interactiveEngine():
             for category in newCategories:
                 mainDataFrame[category] = newData[category]
 
+            # Masks computed from earlier versions of the columns can not be reused
+            invalidateFilterMasks(global_filterMasks, newCategories)
+
     def updatePlot():
         '''Generated the plots'''
 
@@ -783,6 +807,7 @@ def interactiveEngine():
         # If the x-axis, or the y-axis or the hover tools are change, more data may need to be added to the source
 
         excistingCategories = source.column_names
+        newCategories = []
 
         ## The x-axis
         #x_axis = x_axis_map[selects['x_axis'].value] 
@@ -798,7 +823,7 @@ def interactiveEngine():
         booleanCategory = booleanCategory_map[selects['booleanCategory'].value]
         if booleanCategory != 'none':
             if booleanCategory not in excistingCategories:
-                source.data[booleanCategory] = mainDataFrame[booleanCategory]
+                newCategories.append(booleanCategory)
 
         ## The legendCategory
         #legendCategory = legendCategory_map[selects['legendCategory'].value]
@@ -810,7 +835,10 @@ def interactiveEngine():
         hovertools = toolTipsDict()
         for category in [hovertools[item] for item in hoverToolSelect.value]:
             if category not in excistingCategories:
-                source.data[category] = mainDataFrame[category]        
+                newCategories.append(category)
+
+        # Only the new columns are sent to the browser
+        updateColumnDataSource(source, mainDataFrame, columns = newCategories)
 
     #%% Main function #######################################################
     #%% Initial setup
@@ -820,17 +848,16 @@ def interactiveEngine():
     # Read in data needed for the initial plot
     mainDataFrame = loadData(dataColumns = dataColumnsToUseFromTheStart(), engine = engine)
 
-    # Ensure proper formating of the data
-    mainDataFrame = dataManipulation(mainDataFrame)
-
     # Read data for the Schotcley quisier limit
-    path = pathlib.Path(__file__).parent.absolute()
-    fileName = 'SQ limit.csv'
-    filePath = os.path.join(path, fileName)
-    QEdata = pd.read_csv(filePath)
+    QEdata = getSQlimit()
   
-    # Generate the comparitions to the SQ limit
+    # Generate the comparitions to the SQ limit. Done before the data manipulation, as only the columns read from the column cache share the cached losses
     PCE_SQ, Voc_SQ, Jsc_SQ, FF_SQ = SQ_potential(mainDataFrame, QEdata)
+
+    # Ensure proper formating of the data
+    mainDataFrame = dataManipulation(mainDataFrame)
+
+    # Add the comparitions to the SQ limit
     mainDataFrame['PCE_SQ'] = PCE_SQ 
     mainDataFrame['Voc_SQ'] = Voc_SQ
     mainDataFrame['Jsc_SQ'] = Jsc_SQ
@@ -838,7 +865,7 @@ def interactiveEngine():
 
     # Main ColumnDataSource. Pupolate it with the intial values 
     source = ColumnDataSource(data=dict())
-    source.data = mainDataFrame.to_dict('series')
+    updateColumnDataSource(source, mainDataFrame)
 
     # Set up a view conected to the main column data source
     view = CDSView(source=source)
@@ -849,6 +876,7 @@ def interactiveEngine():
     
     # Global lists to keep track of selected data, current figures, and legend, and to provide access to those in sub functions
     global_selectedRows = []
+    global_filterMasks = {}
 
     #%% Read in text instructions about the app to be shown in a separate tab
     appInstructions = getAppInstructions(fileName = 'Instructions.html')
@@ -924,6 +952,9 @@ def interactiveEngine():
         'Substrate_stack_sequence',
         ]
 
+    # Compute the categories for all multiselect categories in one pass over the table. Only done by the first session in the process
+    warmCategoryCatalog(multiselectCategories, engine = engine)
+
     # Generate alphabetic lists of all alternatives in the database for each multiselect category 
     multiselectDict = {}
     for i, item in enumerate(multiselectCategories):
@@ -21,6 +21,10 @@ import pandas as pd
 
 from sqlalchemy.orm import sessionmaker, scoped_session
 
+from UtilityFunctions.categoryCatalog import removeFromCategoryCatalog
+from UtilityFunctions.columnCache import invalidateColumnCache
+from UtilityFunctions.dataSnapshot import rebuildDataSnapshot
+from UtilityFunctions.dataVersion import currentDataVersion
 from UtilityFunctions.utilityFunctions import (conectToDatabase, database_details)
 from UtilityFunctions.dataColumns import csv_data_columns_complet
 from UtilityFunctions.updateDataValidation import cleaningFuncions
@@ -205,11 +209,17 @@ def interactiveEngine():
         sql = f'''UPDATE {schema}.{table} SET "{column}" = '{dataToInsert}' WHERE data."Ref_ID" in {ID_string}'''
 
         # Create a session and run the sql comand
+        previousDataVersion = currentDataVersion()
         db = scoped_session(sessionmaker(bind=engine))
         db.execute(sql)
         db.commit()
         db.close()
 
+        # The data cached by the dashboards is no longer up to date
+        dataVersion = invalidateColumnCache()
+        removeFromCategoryCatalog([column], previousDataVersion = previousDataVersion, dataVersion = dataVersion)
+        rebuildDataSnapshot(engine)
+
         updateStatusText(f'Value of {Selects["column"].value} at database ID {textInput["ID"].value} is {textInput["Old_value"].value} and has now been replaced with {newData[0]} by {str(textInput["Your_name"].value)}')
 
     def submittNewValue(event):
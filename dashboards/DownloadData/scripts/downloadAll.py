@@ -17,6 +17,8 @@ from bokeh.models import Panel
 
 import pandas as pd
 
+from UtilityFunctions.exportArtifacts import latestExportFile, startExportSchedule
+from UtilityFunctions.streamingDownload import parquetDownloadUrl, streamingDownloadUrl
 from UtilityFunctions.utilityFunctions import (conectToDatabase, database_details)
 
 
@@ -47,27 +49,39 @@ def interactiveEngine():
         # Uppdate status text
         updateStatusText(text = f'Conection to the database is established')
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-
-        # Fetch all data from the database 
-        query = f'''select * from {schema}.{table}'''
-        query_results = pd.read_sql_query(sql = query, con = engine)
+        # Use the latest export if it is up to date. Otherwise fetch all data from the database
+        filePath, fileInfo = latestExportFile('csv')
+        if filePath is not None:
+            with open(filePath, 'r', encoding = 'utf-8') as file:
+                csvData = file.read()
+            numberOfRows = fileInfo['rows']
+        else:
+            # Fetch table and scheema names of the database
+            bd_details = database_details()
+            table = bd_details['table']
+            schema = bd_details['schema']
+
+            query = f'''select * from {schema}.{table}'''
+            query_results = pd.read_sql_query(sql = query, con = engine)
+            csvData = query_results.to_csv(header=True, index=False) if len(query_results) != 0 else None
+            numberOfRows = len(query_results)
 
         # Download resutls
-        if len(query_results) != 0:
+        if csvData is not None:
 
             # Make the data accesible to download
             callback.args['userFilename'] = 'Perovskite_database_content_all_data.csv'
-            callback.args['data'] = query_results.to_csv(header=True, index=False)
+            callback.args['data'] = csvData
 
             # Uppdate status text      
-            updateStatusText(text = f' Data for {len(query_results)} devices have been fetched from the database')
+            updateStatusText(text = f' Data for {numberOfRows} devices have been fetched from the database')
 
             download_Data_via_Json()
 
+    def streamDataFromDatabase(event):
+        '''The data is streamed by the browser directly from the download url. Only the status text is updated here'''
+        updateStatusText(text = f'The download has started. The data is streamed directly from the database')
+
     def updateStatusText(text):
         '''Update status text '''
         status_update_text.text = text
@@ -77,12 +91,29 @@ def interactiveEngine():
     # Set up a conection to the database
     engine = conectToDatabase()
 
+    # Keep the pre-built exports of all data up to date. Started once per process
+    startExportSchedule(engine)
+
     #%% Input controlls ####################################################
     # Buttons
     buttons = {'download_data_button' : Button(label="Download all data in the database", button_type="success"),}
     
     #%% Setting up callbacks ###############################################
-    buttons['download_data_button'].on_event(ButtonClick, downloadDataFromDatabase)
+    # If the streaming download is available, the browser fetches the data from its url. Otherwise the data is sent via the websocket
+    downloadUrl = streamingDownloadUrl()
+    if downloadUrl is not None:
+        buttons['download_data_button'].js_on_event(ButtonClick, CustomJS(args=dict(url=downloadUrl),
+            code="const link = document.createElement('a'); link.href = url; link.download = ''; document.body.appendChild(link); link.click(); document.body.removeChild(link);"))
+        buttons['download_data_button'].on_event(ButtonClick, streamDataFromDatabase)
+
+        # All data is also available as Parquet if there is an export
+        parquetUrl = parquetDownloadUrl()
+        if parquetUrl is not None:
+            buttons['download_parquet_button'] = Button(label="Download all data in the database as Parquet", button_type="success")
+            buttons['download_parquet_button'].js_on_event(ButtonClick, CustomJS(args=dict(url=parquetUrl),
+                code="const link = document.createElement('a'); link.href = url; link.download = ''; document.body.appendChild(link); link.click(); document.body.removeChild(link);"))
+    else:
+        buttons['download_data_button'].on_event(ButtonClick, downloadDataFromDatabase)
 
     #%% Set up a dummy glyph which when triggered runs a javascript based function for downloading selected data
     filename = 'Perovskite_database_content_all_data.csv'
@@ -101,7 +132,7 @@ def interactiveEngine():
 
     #%% Layout the controlls
     layout_tab1 = column(aboutTheApp)
-    layout_tab2 = column(instruction_1, buttons['download_data_button'], status_update_text, download_trigger)
+    layout_tab2 = column(instruction_1, *buttons.values(), status_update_text, download_trigger)
 
     #%% Make tabs with the specified layouts
     tab1 = Panel(child=layout_tab1, title = 'About')
@@ -16,13 +16,11 @@ from bokeh.models import FileInput
 from bokeh.models import Panel
 from bokeh.models import TextInput
 
-import pandas as pd
-
-from UtilityFunctions.utilityFunctions import (conectToDatabase, database_details, is_int)
+from UtilityFunctions.utilityFunctions import (conectToDatabase, is_int, loadDataByID)
 
 #%% Helper functions
 def formatInputString(inputString):
-    '''Take text input and returns tuple with integers found in the comma separated text input '''
+    '''Take text input and returns a list with the integers found in the comma separated text input '''
     # Format the ID number
     if type(inputString) == bytes:
             inputString = str(inputString.decode())
@@ -40,11 +38,7 @@ def formatInputString(inputString):
         if is_int(ID):
             IDnumbers.append(int(ID))
 
-    # Convert to string
-    IDnumbersString = [str(x) for x in IDnumbers]
-    IDnumbersString = '(' + ','.join(IDnumbersString) + ')'
-
-    return IDnumbersString
+    return IDnumbers
 
 
 #%% Seting up the dashboard and the interactivity
@@ -60,14 +54,11 @@ def interactiveEngine():
         # Uppdate status text
         updateStatusText(text = f'Conection to the database is established')
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-
         # Read in all data for the specified ID numbers
-        query = f''' SELECT * FROM singeljunction.data WHERE data."Ref_ID" in {IDnumbers} '''
-        query_results = pd.read_sql_query(query, engine)
+        query_results = loadDataByID(IDs = IDnumbers, engine = engine)
+
+        # ID numbers formated for the status text
+        IDnumbersString = ', '.join(str(x) for x in IDnumbers)
 
         # Download resutls
         if len(query_results) != 0:
@@ -76,13 +67,13 @@ def interactiveEngine():
             callback.args['data'] = query_results.to_csv(header=True, index=False)
 
             # Uppdate status text
-            updateStatusText(text = f'The database contains {len(query_results)} entries coresponding to ID numbers: {IDnumbers}')
+            updateStatusText(text = f'The database contains {len(query_results)} entries coresponding to ID numbers: {IDnumbersString}')
 
             download_Data_via_Json()
 
         else:
             # Uppdate status text
-            updateStatusText(text = f'The database contains no entries with iD: {IDnumbers}')
+            updateStatusText(text = f'The database contains no entries with iD: {IDnumbersString}')
 
     def fileInputUpdate(attr, old, new):
         '''Read textfile from user'''
@@ -23,12 +23,14 @@ from bokeh.models import Slider
 
 import pandas as pd
 
+from UtilityFunctions.categoryCatalog import warmCategoryCatalog
+from UtilityFunctions.filterEngine import filterIsIn, filterIsTrue, filterOpenRange, invalidateFilterMasks, selectRowIndices
 from UtilityFunctions.utilityFunctions import (conectToDatabase,
                                                databaseCategoriesMostCommon,
                                                databaseCatagoriesUnique,
-                                               database_details,
                                                dataManipulation, 
-                                               loadData)
+                                               loadData,
+                                               loadDataByID)
 
 #%% Helper functions
 def dataColumnsToUseFromTheStart():
@@ -48,22 +50,11 @@ def interactiveEngine():
     def downloadDataTable(event):
         '''Download selected data in table as .csv-file '''
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-        ID = bd_details['bd_key']
-
         # # The Ref_ID for all selected cells
         Cell_ID_numbers = list(mainDataFrame.loc[global_selectedRows]['Ref_ID'])
 
-        # Forrmat the Cell_ID_numbers for the SQL query
-        IDnumbersString = [str(x) for x in Cell_ID_numbers]
-        IDnumbersString = '(' + ','.join(IDnumbersString) + ')'
-
         # Query the database for all data for the selected cells
-        query = f'''select * from {schema}.{table} where {table}."{ID}" in {IDnumbersString}'''
-        query_results = pd.read_sql_query(sql = query, con = engine)
+        query_results = loadDataByID(IDs = Cell_ID_numbers, engine = engine)
 
         # Download results
         if len(query_results) != 0:           
@@ -96,48 +87,51 @@ def interactiveEngine():
         return newCategories
 
     def select_data(data):
-        '''Start by selecting all data and succesivly narrow it down'''
+        '''Returns the index of the rows passing all active filters. The mask for each filter is cached so only filters that have changed are recomputed'''
 
         # Categories in dataset so far fetched from the database
         presentDataCategories = list(data.columns)
 
+        # The active filters. One per widget
+        filters = {}
+
         #%% Checkboxbuttongroups
-        # For each active filter, sucessivly sort out entries where those values are True
+        # For each active filter, sort out entries where those values are True
         for category in checkBoxButtons:
             if category in presentDataCategories:
                 if 0 in checkBoxButtons[category].active:
-                    data = data[data[category] == True]
+                    filters['checkBoxButtons_' + category] = filterIsTrue(category)
 
         #%% Multiselects long
         for category in multiselects:
             if category in presentDataCategories:
                 if 'All' not in multiselects[category].value:
-                    data = data[data[category].isin(multiselects[category].value)]
+                    filters['multiselects_' + category] = filterIsIn(category, multiselects[category].value)
 
         #%% Multiselects short
         for category in multiselectsShort:
             if category in presentDataCategories:
                 if 'All' not in multiselectsShort[category].value:
-                    data = data[data[category].isin(multiselectsShort[category].value)]
+                    filters['multiselectsShort_' + category] = filterIsIn(category, multiselectsShort[category].value)
 
         #%% Sliders
         for category in rangeSliders:
             if category in presentDataCategories:
                 if rangeSliders[category].value[0] > sliderLimits[category][0] or rangeSliders[category].value[1] < sliderLimits[category][1]:
-                    data = data[(data[category] > rangeSliders[category].value[0]) & (data[category] < rangeSliders[category].value[1])]
+                    filters['rangeSliders_' + category] = filterOpenRange(category, rangeSliders[category].value[0], rangeSliders[category].value[1])
 
         # The data range slider apears to behave differently on different systems
         if 'Ref_publication_date' in presentDataCategories:
             try:
                 datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))
             except:
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0])) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))
 
-        #%% Return
-        return data
+        #%% Return the index of the rows passing all filters
+        return selectRowIndices(data, filters, global_filterMasks)
 
     def update():
         ''' Uppdate the data selection'''
@@ -146,11 +140,11 @@ def interactiveEngine():
         updateMainDataFrame(columnsToDownload)
 
         # Uppdate the selection of data to plot based on the filters selected by the user
-        newSelectionOfData = select_data(mainDataFrame)
+        selectedRows = select_data(mainDataFrame)
         
         # Update the list of indicies for the selected data so that it can be accessed by remaining internal functions
         global_selectedRows.clear()
-        global_selectedRows.extend(list(newSelectionOfData.index))
+        global_selectedRows.extend(selectedRows)
 
         # Display the amount of data found
         updateLogText(len(global_selectedRows))
@@ -182,6 +176,9 @@ def interactiveEngine():
 
             for category in newCategories:
                 mainDataFrame[category] = newData[category]
+
+            # Masks computed from earlier versions of the columns can not be reused
+            invalidateFilterMasks(global_filterMasks, newCategories)
        
     #%% Main function #######################################################
     #%% Initial setup
@@ -196,6 +193,7 @@ def interactiveEngine():
     
     #Global lists to keep track of selected data, current figures, and legend and to provide access to those in sub functions
     global_selectedRows = []
+    global_filterMasks = {}
 
     #%% Input controlls ####################################################
     # Buttons
@@ -283,6 +281,9 @@ def interactiveEngine():
         'Substrate_stack_sequence',
         ]
     
+    # Compute the categories for all multiselect categories in one pass over the table. Only done by the first session in the process
+    warmCategoryCatalog(multiselectCategories + multiselectCategories_short, engine = engine)
+
     # Generate alphabetic lists of all alternatives in the database for each multiselect category 
     multiselectDict = {}
     for i, item in enumerate(multiselectCategories):
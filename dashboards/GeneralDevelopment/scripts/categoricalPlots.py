@@ -21,8 +21,8 @@ from bokeh.models import ColumnDataSource
 from bokeh.models import CustomJS
 from bokeh.models import DateRangeSlider
 from bokeh.models import Div
-from bokeh.models import IndexFilter
-from bokeh.models import Legend, LegendItem
+from bokeh.models import HoverTool
+from bokeh.models import Legend
 from bokeh.models import LinearColorMapper
 from bokeh.models import MultiSelect
 from bokeh.models import OpenURL
@@ -42,6 +42,11 @@ import numpy as np
 import pandas as pd
 
 from UtilityFunctions.categoricalColors import categoricalColors
+from UtilityFunctions.categoryAggregation import addSummaryGlyphs, categoryCounts, plottedRows, showIndividualPoints, summarizeCategories
+from UtilityFunctions.categoryCatalog import warmCategoryCatalog
+from UtilityFunctions.filterEngine import filterIsIn, filterIsTrue, filterNotEqual, filterNotIn, filterOpenRange, invalidateFilterMasks, selectRowIndices
+from UtilityFunctions.legendBuilder import legendItems, legendLabelOrder, showLegend
+from UtilityFunctions.sourceUpdates import updateColumnDataSource
 from UtilityFunctions.utilityFunctions import (conectToDatabase,
     convertNumerListToFloats,
     databaseCategoriesMostCommon,
@@ -67,7 +72,7 @@ def dataColumnsToUseFromTheStart():
               'Ref_publication_date',
               ]
 
-def make_plot(source, view, data, activeCategories, alphaValue, booleanCategory, colorLabels, currentRowsInData, legendCategory, legendFontSize, markerSize, tooltips, useColorMarkers, x_axis, y_axis, yAxisLogStart, y_scale_select):
+def make_plot(source, summarySource, histogramSource, view, data, activeCategories, alphaValue, booleanCategory, categoryLabels, colorLabels, currentRowsInData, legendCategory, legendFontSize, markerSize, tooltips, useColorMarkers, x_axis, y_axis, yAxisLogStart, y_scale_select):
     '''Generate the plot'''
     TOOLS = "box_select, box_zoom, hover, lasso_select, pan, reset, save, tap, wheel_zoom"
 
@@ -100,6 +105,9 @@ def make_plot(source, view, data, activeCategories, alphaValue, booleanCategory,
                    y_axis_type= y_scale_select,
                    output_backend="webgl")
 
+    # The hover tool of the figure shows the individual points. The summary has its own
+    pointHoverTool = p.select(type=HoverTool)
+
     # List of posible marker types
     markerSet = []
     if useColorMarkers: 
@@ -107,6 +115,17 @@ def make_plot(source, view, data, activeCategories, alphaValue, booleanCategory,
     else:
         markerSet = ['circle']
 
+    #%% Summary of each category. Colored by category when the points are colored by the x-axis category
+    if legendCategory == 'none' and booleanCategory == 'none':
+        summaryColorSet = categoricalColors('Dark')
+        if len(categoryLabels) > len(summaryColorSet):
+            summaryColorSet = summaryColorSet*(int(len(categoryLabels)/len(summaryColorSet)) + 1)
+        summaryColor = factor_cmap('category', palette=summaryColorSet, factors=categoryLabels)
+    else:
+        summaryColor = 'darkgrey'
+
+    addSummaryGlyphs(p, summarySource, histogramSource, color = summaryColor)
+
     #%% Generate the figure
     # If there is a legend category
     if legendCategory != 'none':
@@ -154,7 +173,7 @@ def make_plot(source, view, data, activeCategories, alphaValue, booleanCategory,
     # If no legend color category
     else:
         # Define legend entries (sorted in number of ocurances)
-        colorLabels = list(data[x_axis[1]].value_counts().index)
+        colorLabels = categoryLabels
 
          # Import a colormap for categorical ploting in the form of a list of 61 hex values
         colorSet = categoricalColors('Dark')
@@ -172,6 +191,9 @@ def make_plot(source, view, data, activeCategories, alphaValue, booleanCategory,
                 color = factor_cmap(x_axis[1], palette=colorSet, factors=colorLabels),               
                 )
 
+    # The hover and tap tools of the figure only concern the individual points
+    pointHoverTool.renderers = [GlyphRenderer]
+
     #%% Add axis labels
     p.yaxis.axis_label = y_axis[0]
 
@@ -191,6 +213,7 @@ def make_plot(source, view, data, activeCategories, alphaValue, booleanCategory,
     url = "https://doi.org/@Ref_DOI_number"
     taptool = p.select(type=TapTool)
     taptool.callback = OpenURL(url=url)
+    taptool.renderers = [GlyphRenderer]
 
     return p, GlyphRenderer
 
@@ -327,60 +350,68 @@ def interactiveEngine():
         return newCategories
 
     def select_data(data):
-        '''Start by selecting all data and succesivly narrow it down'''
+        '''Returns the index of the rows passing all active filters. The mask for each filter is cached so only filters that have changed are recomputed'''
 
         # Categories in dataset so far fetched from the database
         presentDataCategories = list(data.columns)
 
+        # The active filters. One per widget
+        filters = {}
+
         # Remove rows with nan values in the categories that should be plotted (nan values have previously been set to -1)
-        data = data[data[y_axis_map[selects['y_axis'].value]] != -1]
+        filters['y_axis'] = filterNotEqual(y_axis_map[selects['y_axis'].value], -1)
 
         # Color by category
         if legendCategory_map[selects['x_axis'].value] in presentDataCategories:
-            data = data[data[legendCategory_map[selects['x_axis'].value]].isin(updateActiveCategories())]
+            filters['x_axis_categories'] = filterIsIn(legendCategory_map[selects['x_axis'].value], updateActiveCategories())
 
         #%% Checkboxbuttongroups
-        # For each active filter, sucessivly sort out entries where those values are True
+        # For each active filter, sort out entries where those values are True
         for category in checkBoxButtons:
             if category in presentDataCategories:
                 if 0 in checkBoxButtons[category].active:
-                    data = data[data[category] == True]
+                    filters['checkBoxButtons_' + category] = filterIsTrue(category)
 
         #%% Multiselects long
         for category in multiselects:
             if category in presentDataCategories:
                 if 'All' not in multiselects[category].value:
-                    data = data[data[category].isin(multiselects[category].value)]
+                    filters['multiselects_' + category] = filterIsIn(category, multiselects[category].value)
 
         #%% Multiselects short
         for category in multiselectsShort:
             if category in presentDataCategories:
                 if 'All' not in multiselectsShort[category].value:
-                    data = data[data[category].isin(multiselectsShort[category].value)]
+                    filters['multiselectsShort_' + category] = filterIsIn(category, multiselectsShort[category].value)
 
         #%% Sliders
         for category in rangeSliders:
             if category in presentDataCategories:
                 if rangeSliders[category].value[0] > sliderLimits[category][0] or rangeSliders[category].value[1] < sliderLimits[category][1]:
-                    data = data[(data[category] > rangeSliders[category].value[0]) & (data[category] < rangeSliders[category].value[1])]
+                    filters['rangeSliders_' + category] = filterOpenRange(category, rangeSliders[category].value[0], rangeSliders[category].value[1])
 
         # The data range slider apears to behave diferently on diferent systems
         if 'Ref_publication_date' in presentDataCategories:
             try:
                 datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))
             except:
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0])) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))
 
         #%% Text input
         if 'Ref_ID' in presentDataCategories: 
             if textInputControlls['excludeCellID'].value != '':
                 ID_to_drop = integerList(textInputControlls['excludeCellID'].value)
-                data = data[~data['Ref_ID'].isin(ID_to_drop)]
-            
-        return data
+                filters['excludeCellID'] = filterNotIn('Ref_ID', ID_to_drop)
+
+        #%% Return the index of the rows passing all filters
+        return selectRowIndices(data, filters, global_filterMasks)
+
+    def showPoints():
+        '''True if the individual data points should be plotted'''
+        return showIndividualPoints(len(global_plottedRows), 0 in checkBoxButtonsPlotProperties['ShowPoints'].active)
 
     def update():
         ''' Uppdate the data selection'''
@@ -414,11 +445,7 @@ def interactiveEngine():
            
         # In case 'All' is chosen, sort out the five categories with most data (so we do not plot 2000 HTL categories)
         if activeCategories == []:
-            if len(mainDataFrame[activeColumn].value_counts()) > 5:
-                activeCategories = list(mainDataFrame[activeColumn].value_counts()[0:5].index)
-                
-            elif len(mainDataFrame[activeColumn].value_counts()) > 0:
-                activeCategories = list(mainDataFrame[activeColumn].value_counts().index)
+            activeCategories = list(categoryCounts(mainDataFrame, activeColumn, global_categoryCounts)[0:5].index)
 
         activeCategories.sort()
 
@@ -431,17 +458,24 @@ def interactiveEngine():
         updateMainDataFrame(columnsToDownload)
 
         # Uppdate the selection of data to plot based on the filters selected by the user
-        newSelectionOfData = select_data(mainDataFrame)
+        selectedRows = select_data(mainDataFrame)
  
-        # Uppdate the column data source with the new data selection (older solution. takes a lot of time)
-        updateSource(categories = list(newSelectionOfData.columns)) 
-
         # Update the list of indicies for the selected data so that it can be accessed by remaining internal functions
         global_selectedRows.clear()
-        global_selectedRows.extend(list(newSelectionOfData.index))
+        global_selectedRows.extend(selectedRows)
+
+        # The selected rows that are plotted, i.e. that are in the categories on the x-axis and have a value on the y-axis
+        global_plottedRows.clear()
+        global_plottedRows.extend(plottedRows(mainDataFrame, global_selectedRows,
+                  categoryColumn = legendCategory_map[selects['x_axis'].value],
+                  valueColumn = y_axis_map[selects['y_axis'].value],
+                  categories = updateActiveCategories()))
+
+        # Uppdate the column data source with the new data selection
+        updateSource(categories = list(mainDataFrame.columns))
 
-        # Uppdate the view of the columnDataSource
-        view.filters = [IndexFilter(global_selectedRows)]
+        # Uppdate the summary of each category
+        updateSummary()
 
         # Update and add the legend (if the figure is defined and if it has a legend)
         if global_figure != []:
@@ -460,71 +494,33 @@ def interactiveEngine():
         p = global_figure[0]
         GlyphRenderer = global_GlyphRenderer[0]
 
+        # The legend refers to the individual points. No legend if they are not plotted
+        if not showPoints():
+            if len(p.legend) != 0:
+                p.legend.items = []
+            return
+
         # If there is a legend category
         if legendCategory != 'none':
-            # Define the complete set of legend lables and sort those based on how common they are. That is, all unique entries in the legendCategory
-            legendLabelsComplete = global_legendLabelsComplete
-
-            # The current selection of data in the plot         
-            dataSelection = mainDataFrame.loc[global_selectedRows,[legendCategory]]
-
-            # Define the set of legend labels in the reduced dataset in the current figure where there is data 
-            categoriesWithData = list(dataSelection[legendCategory].unique())
-
-            # Sort legendLabels based on frequence in the total dataset
-            legendLabels = [x for x in legendLabelsComplete if x in categoriesWithData]
-
-            # Find the index in the data source for the first occurance of each legendLabel
-            LegendIndex = dict.fromkeys(legendLabels)
-            dataSelectionList = dataSelection[legendCategory].tolist()
-            for item in legendLabels:
-                LegendIndex[item] = dataSelectionList.index(item)
-
-            # Define the LegendItems for each category in the current figure
-            legendEntries = []
-            for item in legendLabels:
-                legendEntries.append(LegendItem(label=item, index=LegendIndex[item], renderers=[GlyphRenderer]))
-
-            # Add an emty legend if no legend already excist
-            if len(p.legend) == 0:
-                p.add_layout(Legend())
-
-            # Add the legend to the figure p 
-            p.add_layout(p.legend[0], 'right')    
-            p.legend.items =  legendEntries  
-            p.legend.label_text_font_size = str(legendFontSize) + 'pt'
-            p.legend.spacing = 0
-            p.legend.label_width = 250
-            
-        # If there is a bolean category but no legend category
-        elif booleanCategory != 'none':
-            # The current selection of data in the plot         
-            dataSelection = mainDataFrame.loc[global_selectedRows,[booleanCategory]]
+            # The legend category for the current selection of data in the plot
+            dataSelection = mainDataFrame.loc[global_plottedRows, legendCategory]
 
-            # Define the set of legend labels in the reduced dataset in the current figure where there is data 
-            legendLabels = list(dataSelection[booleanCategory].unique())
+            # One entry per legend label in the current selection, sorted based on how common the labels are in the total dataset
+            legendEntries = legendItems(dataSelection, GlyphRenderer, labels = global_legendLabelsComplete, itemCache = global_legendItems)
 
-            # Find the index in the data source of the first occurance of each legendLabel
-            LegendIndex = dict.fromkeys(legendLabels)
-            dataSelectionList = dataSelection[booleanCategory].tolist()
-            for item in legendLabels:
-                LegendIndex[item] = dataSelectionList.index(item)
+            # Add the legend to the figure p
+            showLegend(p, legendEntries, fontSize = legendFontSize, labelWidth = 250)
 
-            # Define the LegendItems for each category in the current figure
-            legendEntries = []
-            for item in legendLabels:
-                legendEntries.append(LegendItem(label=str(item), index=LegendIndex[item], renderers=[GlyphRenderer]))
+        # If there is a bolean category but no legend category
+        elif booleanCategory != 'none':
+            # The bolean category for the current selection of data in the plot
+            dataSelection = mainDataFrame.loc[global_plottedRows, booleanCategory]
 
-            # Add an emty legend if no one legend already excist
-            if len(p.legend) == 0:
-                p.add_layout(Legend())
+            # One entry per value in the current selection, in order of first occurance
+            legendEntries = legendItems(dataSelection, GlyphRenderer, itemCache = global_legendItems)
 
             # Add the legend to the figure p
-            p.add_layout(p.legend[0], 'right')    
-            p.legend.items =  legendEntries  
-            p.legend.label_text_font_size = str(legendFontSize) + 'pt'
-            p.legend.spacing = 0
-            p.legend.label_width = 50
+            showLegend(p, legendEntries, fontSize = legendFontSize, labelWidth = 50)
 
     def updateMainDataFrame(newCategories):
         '''Reads in more data from the database if a filter has been selected that needs that data for filtering'''
@@ -550,6 +546,9 @@ def interactiveEngine():
             for category in newCategories:
                 mainDataFrame[category] = newData[category]
 
+            # Masks computed from earlier versions of the columns can not be reused
+            invalidateFilterMasks(global_filterMasks, newCategories)
+
     def updatePlot():
         '''Generated the plots'''
         # Check which color markers that should be used
@@ -566,7 +565,7 @@ def interactiveEngine():
         # Define the complete set of legend lables and sort those based on how common they are. That is, all unique entries in the legendCategory
         if legendCategory != 'none':
             global_legendLabelsComplete.clear()
-            global_legendLabelsComplete.extend(list(mainDataFrame[legendCategory].value_counts().index))
+            global_legendLabelsComplete.extend(legendLabelOrder(mainDataFrame, legendCategory, global_categoryCounts))
         elif booleanCategory != 'none':
             global_legendLabelsComplete.clear()
             global_legendLabelsComplete.extend(['True', 'False'])
@@ -578,11 +577,12 @@ def interactiveEngine():
         tooltips = [hoverTools_map[tips] for tips in hoverToolSelect.value]
 
         # Initiate the figure
-        p, GlyphRenderer = make_plot(source = source, data = mainDataFrame,
+        p, GlyphRenderer = make_plot(source = source, summarySource = summarySource, histogramSource = histogramSource, data = mainDataFrame,
                   view = view,
                   activeCategories = multiselectDict[legendCategory_map[selects['x_axis'].value]],
                   alphaValue = sliders['plotAlpha'].value,
                   booleanCategory = booleanCategory_map[selects['booleanCategory'].value],
+                  categoryLabels = list(categoryCounts(mainDataFrame, legendCategory_map[selects['x_axis'].value], global_categoryCounts).index),
                   colorLabels = global_legendLabelsComplete,
                   currentRowsInData = global_selectedRows,
                   legendCategory = legendCategory_map[selects['legendCategory'].value],
@@ -653,35 +653,81 @@ def interactiveEngine():
         '''Update the column data source if needed'''
         # If the x-axis, or the y-axis or the hover tools are change, more data may need to be added to the source
 
-        excistingCategories = source.column_names
+        # The individual points are only sent to the browser if the user asks for them or if there are not too many of them.
+        # Otherwise the source is given empty columns, so that the glyphs refer to columns that excist
+        if showPoints():
+            rowsToSend = list(global_plottedRows)
+        else:
+            rowsToSend = []
+
+        # If the source already holds the same rows, only new columns must be sent
+        if rowsToSend == global_sourceRows and len(source.data) > 0:
+            excistingCategories = source.column_names
+        else:
+            excistingCategories = []
+        newCategories = []
+
+        # The DOI number is used when a point is clicked
+        if 'Ref_DOI_number' not in excistingCategories:
+            newCategories.append('Ref_DOI_number')
 
         # The x-axis
         x_axis = legendCategory_map[selects['x_axis'].value] 
         if x_axis not in excistingCategories:
-            source.data[x_axis] = mainDataFrame[x_axis]
+            newCategories.append(x_axis)
 
         # The y-axis
         y_axis = y_axis_map[selects['y_axis'].value] 
         if y_axis not in excistingCategories:
-            source.data[y_axis] = mainDataFrame[y_axis]
+            newCategories.append(y_axis)
 
         # The booleanCategory
         booleanCategory = booleanCategory_map[selects['booleanCategory'].value]
         if booleanCategory != 'none':
             if booleanCategory not in excistingCategories:
-                source.data[booleanCategory] = mainDataFrame[booleanCategory]
+                newCategories.append(booleanCategory)
 
         # The legendCategory
         legendCategory = legendCategory_map[selects['legendCategory'].value]
         if legendCategory != 'none':
             if legendCategory not in excistingCategories:
-                source.data[legendCategory] = mainDataFrame[legendCategory]
+                newCategories.append(legendCategory)
 
         # Hoover tool tips
         hovertools = toolTipsDict()
         for category in [hovertools[item] for item in hoverToolSelect.value]:
             if category not in excistingCategories:
-                source.data[category] = mainDataFrame[category]
+                newCategories.append(category)
+
+        # Only the plotted rows are sent to the browser, and if those are the same as before only the new columns
+        newCategories = list(dict.fromkeys(newCategories))
+        if excistingCategories != []:
+            updateColumnDataSource(source, mainDataFrame.loc[rowsToSend], columns = newCategories)
+        else:
+            updateColumnDataSource(source, mainDataFrame.loc[rowsToSend, newCategories])
+
+        # Row i in the source is the row global_sourceRows[i] in the mainDataFrame
+        global_sourceRows.clear()
+        global_sourceRows.extend(rowsToSend)
+
+    def updateSummary():
+        '''Update the number of data points, the quartiles and the histogram of each category in the plot'''
+        summary, histogram = summarizeCategories(mainDataFrame, global_selectedRows,
+                  categoryColumn = legendCategory_map[selects['x_axis'].value],
+                  valueColumn = y_axis_map[selects['y_axis'].value],
+                  categories = updateActiveCategories(),
+                  logScale = y_scale_select_map[selects['y_scale_select'].value] == 'log',
+                  summaryCache = global_summaryCache)
+
+        # The histograms are only shown when the individual points are not
+        if showPoints():
+            histogram = histogram.iloc[0:0]
+            pointsInfo.text = ''
+        else:
+            pointsInfo.text = f'{len(global_plottedRows)} data points. Showing the distribution in each category'
+
+        updateColumnDataSource(summarySource, summary)
+        updateColumnDataSource(histogramSource, histogram)
 
     #%% Main function #######################################################
     #%% Initial setup
@@ -694,18 +740,27 @@ def interactiveEngine():
     # Ensure proper formating of the data
     mainDataFrame = dataManipulation(mainDataFrame)
 
-    # Main ColumnDataSource. Pupolate it with the intial values 
+    # Main ColumnDataSource with the individual data points. Populated when the points are plotted
     source = ColumnDataSource(data=dict())
-    source.data = mainDataFrame.to_dict('series')
 
-    # Set up a view conected to the main column data source
+    # ColumnDataSources with the summary of each category
+    summarySource = ColumnDataSource(data=dict())
+    histogramSource = ColumnDataSource(data=dict())
+
+    # Set up a view conected to the main column data source. The source only holds the plotted rows, so all of them are shown
     view = CDSView(source=source)
 
     #Global lists to keep track of selected data, current fiures, and legend and to provide access to those in sub functions
     global_selectedRows = []
+    global_plottedRows = []
+    global_sourceRows = []
+    global_filterMasks = {}
+    global_categoryCounts = {}
+    global_summaryCache = {}
     global_figure = []
     global_GlyphRenderer = []
     global_legendLabelsComplete = []
+    global_legendItems = {}
 
     #%% Generate input controlls
     #%% Buttons
@@ -736,6 +791,7 @@ def interactiveEngine():
     }
     checkBoxButtonsPlotProperties = {
         'MarkerSymbols' : CheckboxButtonGroup(labels = ['Separate color by marker type'], active = []),
+        'ShowPoints' : CheckboxButtonGroup(labels = ['Show all data points'], active = []),
         }
 
     #%% Multiselects
@@ -760,6 +816,9 @@ def interactiveEngine():
         'Substrate_stack_sequence',
         ]
 
+    # Compute the categories for all multiselect categories in one pass over the table. Only done by the first session in the process
+    warmCategoryCatalog(multiselectCategories, engine = engine)
+
     # Generate alphabetic lists of all alternatives in the database for each multiselect category 
     multiselectDict = {}
     for i, item in enumerate(multiselectCategories):
@@ -948,6 +1007,7 @@ def interactiveEngine():
     comonAlternatives = Div(text = "<b>Most common alternatives</b>")
     instruction_1 = Paragraph(text="""Filter out all non-True values""")
     blankColumnShort = Div(text = "              ", width=200, height=100)
+    pointsInfo = Div(text = "")
 
     #%% Initial update 
     # Update teh data
@@ -970,6 +1030,8 @@ def interactiveEngine():
         selects['legendCategory'],
         selects['booleanCategory'],
         checkBoxButtonsPlotProperties['MarkerSymbols'],
+        checkBoxButtonsPlotProperties['ShowPoints'],
+        pointsInfo,
         textInputControlls['excludeCellID'],
         sliders['plotAlpha'],
         sliders['markerSize'],
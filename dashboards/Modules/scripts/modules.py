@@ -22,7 +22,7 @@ from bokeh.models import CustomJS
 from bokeh.models import DateRangeSlider
 from bokeh.models import Div
 from bokeh.models import IndexFilter
-from bokeh.models import Legend, LegendItem
+from bokeh.models import Legend
 from bokeh.models import LinearColorMapper
 from bokeh.models import MultiSelect
 from bokeh.models import OpenURL
@@ -41,15 +41,19 @@ import numpy as np
 import pandas as pd
 
 from UtilityFunctions.categoricalColors import categoricalColors
+from UtilityFunctions.categoryCatalog import warmCategoryCatalog
+from UtilityFunctions.filterEngine import filterIsIn, filterIsTrue, filterNotEqual, filterNotIn, filterOpenRange, invalidateFilterMasks, selectRowIndices
+from UtilityFunctions.legendBuilder import legendItems, legendLabelOrder, showLegend
+from UtilityFunctions.sourceUpdates import updateColumnDataSource
 from UtilityFunctions.utilityFunctions import (conectToDatabase,
     convertNumerListToFloats,
     databaseCategoriesMostCommon_withBoleanFilter,
     databaseCatagoriesUnique_withBoleanFilter,
-    database_details,
     dataManipulation,
     integerList,
     is_number,
     loadData,
+    loadDataByID,
     loadData_withBoleanFilter,
     toolTipsDict,
     toolTipsMap)
@@ -314,22 +318,11 @@ def interactiveEngine():
     def downloadDataTable(event):
         '''Download selected data in table as .csv-file '''
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-        ID = bd_details['bd_key']
-
         # The Ref_ID for all selected cells
         Cell_ID_numbers = list(mainDataFrame.loc[global_selectedRows]['Ref_ID'])
 
-        # Forrmat the Cell_ID_numbers for the SQL query
-        IDnumbersString = [str(x) for x in Cell_ID_numbers]
-        IDnumbersString = '(' + ','.join(IDnumbersString) + ')'
-
         # Query the database for all data for the selected cells
-        query = f'''select * from {schema}.{table} where {table}."{ID}" in {IDnumbersString}'''
-        query_results = pd.read_sql_query(sql = query, con = engine)
+        query_results = loadDataByID(IDs = Cell_ID_numbers, engine = engine)
 
         # Download results
         if len(query_results) != 0:
@@ -344,22 +337,11 @@ def interactiveEngine():
     def downloadDataTableLasso(event):
         '''Download selected data in table as .csv-file '''
 
-        # Fetch table and scheema names of the database
-        bd_details = database_details()
-        table = bd_details['table']
-        schema = bd_details['schema']
-        ID = bd_details['bd_key'] 
-
         # The Ref_ID for all selected cells
         Cell_ID_numbers = list(mainDataFrame.loc[source.selected.indices]['Ref_ID'])
 
-        # Forrmat the Cell_ID_numbers for the SQL query
-        IDnumbersString = [str(x) for x in Cell_ID_numbers]
-        IDnumbersString = '(' + ','.join(IDnumbersString) + ')'
-
         # Query the database for all data for the selected cells
-        query = f'''select * from {schema}.{table} where {table}."{ID}" in {IDnumbersString}'''
-        query_results = pd.read_sql_query(sql = query, con = engine)
+        query_results = loadDataByID(IDs = Cell_ID_numbers, engine = engine)
 
         # Download results
         if len(query_results) != 0:
@@ -465,59 +447,61 @@ def interactiveEngine():
         return newCategories
 
     def select_data(data):
-        '''Start by selecting all data and succesivly narrow it down'''
+        '''Returns the index of the rows passing all active filters. The mask for each filter is cached so only filters that have changed are recomputed'''
 
         # Categories in dataset so far fetched from the database
         presentDataCategories = list(data.columns)
 
+        # The active filters. One per widget
+        filters = {}
+
         # Filter out nan values in the categories that should be plotted (nan values have previously been set to -1)
-        data = data[data[y_axis_map[selects['y_axis'].value]] != -1]
-        data = data[data[x_axis_map[selects['x_axis'].value]] != -1]
+        filters['y_axis'] = filterNotEqual(y_axis_map[selects['y_axis'].value], -1)
+        filters['x_axis'] = filterNotEqual(x_axis_map[selects['x_axis'].value], -1)
 
         #%% Checkboxbuttongroups
-        # For each active filter, sucessivly sort out entries where those values are True
+        # For each active filter, sort out entries where those values are True
         for category in checkBoxButtons:
             if category in presentDataCategories:
                 if 0 in checkBoxButtons[category].active:
-                    data = data[data[category] == True]
+                    filters['checkBoxButtons_' + category] = filterIsTrue(category)
 
         #%% Multiselects long
         for category in multiselects:
             if category in presentDataCategories:
                 if 'All' not in multiselects[category].value:
-                    data = data[data[category].isin(multiselects[category].value)]
+                    filters['multiselects_' + category] = filterIsIn(category, multiselects[category].value)
 
         #%% Multiselects short
         for category in multiselectsShort:
             if category in presentDataCategories:
                 if 'All' not in multiselectsShort[category].value:
-                    data = data[data[category].isin(multiselectsShort[category].value)]
+                    filters['multiselectsShort_' + category] = filterIsIn(category, multiselectsShort[category].value)
 
         #%% Sliders
         for category in rangeSliders:
             if category in presentDataCategories:
                 if rangeSliders[category].value[0] > sliderLimits[category][0] or rangeSliders[category].value[1] < sliderLimits[category][1]:
-                    data = data[(data[category] > rangeSliders[category].value[0]) & (data[category] < rangeSliders[category].value[1])]
+                    filters['rangeSliders_' + category] = filterOpenRange(category, rangeSliders[category].value[0], rangeSliders[category].value[1])
 
         # The data range slider apears to behae diferently on diferent systems
         if 'Ref_publication_date' in presentDataCategories:
             try:
                 datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000)) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]/1000), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]/1000))
             except:
                 if datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]) > sliderLimits['Ref_publication_date'][0] or datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]) < sliderLimits['Ref_publication_date'][1]:
-                    data = data[(data['Ref_publication_date'] > datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0])) & (data['Ref_publication_date'] < datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))]
+                    filters['daterangeSliders_Ref_publication_date'] = filterOpenRange('Ref_publication_date', datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[0]), datetime.datetime.fromtimestamp(daterangeSliders['Ref_publication_date'].value[1]))
 
         #%% Text input
         if 'Ref_ID' in presentDataCategories: 
             if textInputControlls['excludeCellID'].value != '':
                 ID_to_drop = integerList(textInputControlls['excludeCellID'].value)
-                data = data[~data['Ref_ID'].isin(ID_to_drop)]
-
+                filters['excludeCellID'] = filterNotIn('Ref_ID', ID_to_drop)
 
-        #%% Return
-        return data
+        #%% Return the index of the rows passing all filters
+        return selectRowIndices(data, filters, global_filterMasks)
 
     def update():
         ''' Uppdate the data selection'''
@@ -526,14 +510,14 @@ def interactiveEngine():
         updateMainDataFrame(columnsToDownload)
 
         # Uppdate the selection of data to plot based on the filters selected by the user
-        newSelectionOfData = select_data(mainDataFrame)
+        selectedRows = select_data(mainDataFrame)
  
         # Uppdate the column data source with the new data selection (older solution. takes a lot of time)
-        updateSource(categories = list(newSelectionOfData.columns))
+        updateSource(categories = list(mainDataFrame.columns))
 
         # Update the list of indicies for the selected data so that it can be accessed by remaining internal functions
         global_selectedRows.clear()
-        global_selectedRows.extend(list(newSelectionOfData.index))
+        global_selectedRows.extend(selectedRows)
 
         # Uppdate the view of the columnDataSource
         view.filters = [IndexFilter(global_selectedRows)]
@@ -565,7 +549,7 @@ def interactiveEngine():
         dataSelection = mainDataFrame.loc[global_selectedRows]
 
         # Uppdate the columnDataSource responsible for the datatabel with the currently selected data
-        sourceDataTable.data = dataSelection.to_dict('series')
+        updateColumnDataSource(sourceDataTable, dataSelection)
 
         # STOP WAINTING SPINNER
 
@@ -591,7 +575,7 @@ def interactiveEngine():
         dataSelection = mainDataFrame.loc[source.selected.indices]
 
         # Uppdate the columnDataSource responsible for the datatabel with the currently selected data
-        sourceLassoSelect.data = dataSelection.to_dict('series')
+        updateColumnDataSource(sourceLassoSelect, dataSelection)
 
         # STOP WAINTING SPINNER
 
@@ -609,69 +593,25 @@ def interactiveEngine():
 
         # If there is a legend category
         if legendCategory != 'none':
-            # Define the complete set of legend lables and sort those based on how common they are. That is, all unique entries in the legendCategory
-            legendLabelsComplete = global_legendLabelsComplete
-
-            # The current selection of data in the plot         
-            dataSelection = mainDataFrame.loc[global_selectedRows,[legendCategory]]
-
-            # Define the set of legend labels in the reduced dataset in the current figure where there is data 
-            categoriesWithData = list(dataSelection[legendCategory].unique())
-
-            # Sort legendLabels based on frequence in the total dataset
-            legendLabels = [x for x in legendLabelsComplete if x in categoriesWithData]
-
-            # Find the index in the data source for the first occurance of each legendLabel
-            LegendIndex = dict.fromkeys(legendLabels)
-            dataSelectionList = dataSelection[legendCategory].tolist()
-            for item in legendLabels:
-                LegendIndex[item] = dataSelectionList.index(item)
-
-            # Define the LegendItems for each category in the current figure
-            legendEntries = []
-            for item in legendLabels:
-                legendEntries.append(LegendItem(label=item, index=LegendIndex[item], renderers=[GlyphRenderer]))
-
-            # Add an emty legend if no legend already excist
-            if len(p.legend) == 0:
-                p.add_layout(Legend())
-
-            # Add the legend to the figure p 
-            p.add_layout(p.legend[0], 'right')    
-            p.legend.items =  legendEntries  
-            p.legend.label_text_font_size = str(legendFontSize) + 'pt'
-            p.legend.spacing = 0
-            p.legend.label_width = 250
-            
-        # If there is a bolean category but no legend category
-        elif booleanCategory != 'none':
-            # The current selection of data in the plot         
-            dataSelection = mainDataFrame.loc[global_selectedRows,[booleanCategory]]
+            # The legend category for the current selection of data in the plot
+            dataSelection = mainDataFrame.loc[global_selectedRows, legendCategory]
 
-            # Define the set of legend labels in the reduced dataset in the current figure where there is data 
-            legendLabels = list(dataSelection[booleanCategory].unique())
+            # One entry per legend label in the current selection, sorted based on how common the labels are in the total dataset
+            legendEntries = legendItems(dataSelection, GlyphRenderer, labels = global_legendLabelsComplete, itemCache = global_legendItems)
 
-            # Find the index in the data source of the first occurance of each legendLabel
-            LegendIndex = dict.fromkeys(legendLabels)
-            dataSelectionList = dataSelection[booleanCategory].tolist()
-            for item in legendLabels:
-                LegendIndex[item] = dataSelectionList.index(item)
+            # Add the legend to the figure p
+            showLegend(p, legendEntries, fontSize = legendFontSize, labelWidth = 250)
 
-            # Define the LegendItems for each category in the current figure
-            legendEntries = []
-            for item in legendLabels:
-                legendEntries.append(LegendItem(label=str(item), index=LegendIndex[item], renderers=[GlyphRenderer]))
+        # If there is a bolean category but no legend category
+        elif booleanCategory != 'none':
+            # The bolean category for the current selection of data in the plot
+            dataSelection = mainDataFrame.loc[global_selectedRows, booleanCategory]
 
-            # Add an emty legend if no one legend already excist
-            if len(p.legend) == 0:
-                p.add_layout(Legend())
+            # One entry per value in the current selection, in order of first occurance
+            legendEntries = legendItems(dataSelection, GlyphRenderer, itemCache = global_legendItems)
 
             # Add the legend to the figure p
-            p.add_layout(p.legend[0], 'right')    
-            p.legend.items =  legendEntries  
-            p.legend.label_text_font_size = str(legendFontSize) + 'pt'
-            p.legend.spacing = 0
-            p.legend.label_width = 50
+            showLegend(p, legendEntries, fontSize = legendFontSize, labelWidth = 50)
 
     def updateMainDataFrame(newCategories):
         '''Reads in more data from the database if a filter has been selected that needs that data for filtering'''
@@ -696,6 +636,9 @@ def interactiveEngine():
 
             for category in newCategories:
                 mainDataFrame[category] = newData[category]
+
+            # Masks computed from earlier versions of the columns can not be reused
+            invalidateFilterMasks(global_filterMasks, newCategories)
       
     def updatePlot():
         '''Generated the plots'''
@@ -727,7 +670,7 @@ def interactiveEngine():
          # Define the complete set of legend lables and sort those based on how common they are. That is, all unique entries in the legendCategory
         if legendCategory != 'none':
             global_legendLabelsComplete.clear()
-            global_legendLabelsComplete.extend(list(mainDataFrame[legendCategory].value_counts().index))
+            global_legendLabelsComplete.extend(legendLabelOrder(mainDataFrame, legendCategory, global_categoryCounts))
         elif booleanCategory != 'none':
             global_legendLabelsComplete.clear()
             global_legendLabelsComplete.extend(['True', 'False'])
@@ -789,34 +732,38 @@ def interactiveEngine():
         # If the x-axis, or the y-axis or the hover tools are change, more data may need to be added to the source
 
         excistingCategories = source.column_names
+        newCategories = []
 
         # The x-axis
         x_axis = x_axis_map[selects['x_axis'].value] 
         if x_axis not in excistingCategories:
-            source.data[x_axis] = mainDataFrame[x_axis]
+            newCategories.append(x_axis)
 
         # The y-axis
         y_axis = y_axis_map[selects['y_axis'].value] 
         if y_axis not in excistingCategories:
-            source.data[y_axis] = mainDataFrame[y_axis]
+            newCategories.append(y_axis)
 
         # The booleanCategory
         booleanCategory = booleanCategory_map[selects['booleanCategory'].value]
         if booleanCategory != 'none':
             if booleanCategory not in excistingCategories:
-                source.data[booleanCategory] = mainDataFrame[booleanCategory]
+                newCategories.append(booleanCategory)
 
         # The legendCategory
         legendCategory = legendCategory_map[selects['legendCategory'].value]
         if legendCategory != 'none':
             if legendCategory not in excistingCategories:
-                source.data[legendCategory] = mainDataFrame[legendCategory]
+                newCategories.append(legendCategory)
 
         # Hoover tool tips
         hovertools = toolTipsDict()
         for category in [hovertools[item] for item in hoverToolSelect.value]:
             if category not in excistingCategories:
-                source.data[category] = mainDataFrame[category]
+                newCategories.append(category)
+
+        # Only the new columns are sent to the browser
+        updateColumnDataSource(source, mainDataFrame, columns = newCategories)
 
     #%% Main function #######################################################
     #%% Initial setup
@@ -831,7 +778,7 @@ def interactiveEngine():
 
     # Main ColumnDataSource. Pupolate it with the intial values 
     source = ColumnDataSource(data=dict())
-    source.data = mainDataFrame.to_dict('series')
+    updateColumnDataSource(source, mainDataFrame)
 
     # Set up a view conected to the main column data source
     view = CDSView(source=source)
@@ -842,9 +789,12 @@ def interactiveEngine():
     
     # Global lists to keep track of selected data, current figures, and legend, and to provide access to those in sub functions
     global_selectedRows = []
+    global_filterMasks = {}
+    global_categoryCounts = {}
     global_figure = []
     global_GlyphRenderer = []
     global_legendLabelsComplete = []
+    global_legendItems = {}
 
     #%% Read in text instructions about the app to be shown in a separate tab
     appInstructions = getAppInstructions(fileName = 'Instructions.html')
@@ -909,6 +859,9 @@ def interactiveEngine():
         'Substrate_stack_sequence',
         ]
 
+    # Compute the categories for all multiselect categories in one pass over the table. Only done by the first session in the process
+    warmCategoryCatalog(multiselectCategories, engine = engine, boleanColumn = 'Module')
+
     # Generate alphabetic lists of all alternatives in the database for each multiselect category 
     multiselectDict = {}
     for i, item in enumerate(multiselectCategories):
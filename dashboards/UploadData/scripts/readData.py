@@ -29,6 +29,12 @@ import pandas as pd
 import UtilityFunctions.CleanDataV5 as cleanData
 import UtilityFunctions.CompleatDataV5 as compleatData
 import UtilityFunctions.dataBaseFunctions as dbf
+from UtilityFunctions.artifactWriter import waitForBackgroundWrites
+from UtilityFunctions.categoryCatalog import addToCategoryCatalog
+from UtilityFunctions.columnCache import invalidateColumnCache
+from UtilityFunctions.dataSnapshot import rebuildDataSnapshot
+from UtilityFunctions.dataVersion import currentDataVersion
+from UtilityFunctions.exportArtifacts import rebuildExportArtifacts
 from UtilityFunctions.utilityFunctions import (conectToDatabase, database_details, dataCitationData, dataCleaning, dataDeriveNewColumns, dataMergeData)
 
 # Test commet to see if it is the right version that is pushed to github
@@ -176,26 +182,30 @@ def processUserData(filePaths):
         # Read in userdata from file as a pandas dataframe
         userData = readOriginalData(filePath = filePaths['dataOriginalFilePath'], sheetName = 'Master')
 
+        # The data is passed between the steps in memory. The files for tracability are written in the background
         # Clean data
-        cleanedData = dataCleaning(userData = userData, filePaths = filePaths)
+        cleanedData = dataCleaning(userData = userData, filePaths = filePaths, background = True)
 
         # Deriv data for aditional columns based on the cleaned data
-        derivedData = dataDeriveNewColumns(cleanedData = cleanedData, filePaths = filePaths)
+        derivedData = dataDeriveNewColumns(cleanedData = cleanedData, filePaths = filePaths, background = True)
 
         # Extract citation data from CrossRef based on the DOI number
-        citationData = dataCitationData(cleanedData['Ref_DOI_number'], cleanedData['Ref_publication_date'], cleanedData['Ref_lead_author'], filePaths['DOIPath'], filePaths = filePaths)
+        citationData = dataCitationData(cleanedData['Ref_DOI_number'], cleanedData['Ref_publication_date'], cleanedData['Ref_lead_author'], filePaths['DOIPath'], filePaths = filePaths, background = True)
 
         # Merge the data to the format for the database
-        mergedData = dataMergeData(cleanedData, derivedData, citationData, filePaths = filePaths)
+        mergedData = dataMergeData(cleanedData, derivedData, citationData, filePaths = filePaths, background = True)
 
         print('-----------------------------------------\nFinished processing user data')
 
         ## Upload data to database
-        uploadUserDataToDatabase(filePath = filePaths['dataCompleatFilePath'])
+        uploadUserDataToDatabase(data = mergedData)
         #dbf.run_csvToDatabase(filePath = filePaths['dataCompleatFilePath'], table = 'data', schema = 'singeljunction')
 
         print('-----------------------------------------\nFinished uploading user data')
 
+        # Wait for the files written in the background before the log is closed
+        waitForBackgroundWrites()
+
         # Reverse back standard output to promt and close logfile
         logfile.close()
         sys.stdout = original_stdout
@@ -206,6 +216,9 @@ def processUserData(filePaths):
         # Copy processed data to centralised storage for backup
         backupToStorage(filePaths)
 
+        # Write new exports of all data including the uploaded data
+        rebuildExportArtifacts(conectToDatabase())
+
 def readOriginalData(filePath, sheetName):
     '''Read in original data'''
     # Read in file object
@@ -272,8 +285,8 @@ def updateFilePaths(filename, saveFilename, filePaths, filetype):
 
     return filePaths
 
-def uploadUserDataToDatabase(filePath):
-    '''Uppload user data '''
+def uploadUserDataToDatabase(filePath = None, data = None):
+    '''Uppload user data. Either the compleated data in {data}, or the data in the file at {filePath}'''
     # Fetch table and scheema names of the database
     bd_details = database_details()
     table = bd_details['table']
@@ -284,7 +297,20 @@ def uploadUserDataToDatabase(filePath):
 
     # Run rutine for uploading the data    
     #dbf.run_csvToDatabase(filePath = filePaths['dataCompleatFilePath'], table = table, schema = schema)
-    dbf.csvToDatabase(filePath = filePath, table = table, engine = engine, schema = schema)
+    previousDataVersion = currentDataVersion()
+    if data is not None:
+        uploadedData = dbf.dataFrameToDatabase(data, table = table, engine = engine, schema = schema)
+    else:
+        uploadedData = dbf.csvToDatabase(filePath = filePath, table = table, engine = engine, schema = schema)
+
+    # The data cached by the dashboards is no longer up to date
+    dataVersion = invalidateColumnCache()
+
+    # Add the new rows to the category catalog
+    addToCategoryCatalog(uploadedData, previousDataVersion = previousDataVersion, dataVersion = dataVersion)
+
+    # Export a new data snapshot for the dashboards
+    rebuildDataSnapshot(engine)
 
 #%% Seting up the dashboard and the interactivity
 def interactiveEngine():